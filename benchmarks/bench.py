@@ -0,0 +1,298 @@
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+import importlib.util
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stubs import install_stubs
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+DEFAULT_THRESHOLD = 0.25
+# Differences smaller than this are timer noise, whatever the ratio says.
+NOISE_FLOOR = 50e-6
+
+GUI_PACKAGES = ['customtkinter', 'PIL', 'tkinter']
+if sys.platform == "win32":
+    GUI_PACKAGES += ['wmi', 'pythoncom']
+
+FIRST_PAINT_SCRIPT = r'''
+import os, sys, time
+sys.argv = ['info.py']
+import info
+app = info.ZInformationApp()
+original = app.update_gui
+def first_paint(*args):
+    original(*args)
+    app.update_idletasks()
+    print(time.time(), flush=True)
+    os._exit(0)
+app.update_gui = first_paint
+app.mainloop()
+'''
+
+class SkipBenchmark(Exception):
+    pass
+
+BENCHMARKS = []
+
+def benchmark(name):
+    def register(func):
+        BENCHMARKS.append((name, func))
+        return func
+    return register
+
+def measure(func, repeat=7, target=0.02):
+    # Calibrates the loop count so one repeat takes about `target` seconds
+    # and reports the median time per call.
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= target or number >= 1 << 20:
+            break
+        number *= 2
+    timings = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) / number)
+    return statistics.median(timings)
+
+def measure_process(code, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True)
+        timings.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            raise SkipBenchmark(result.stderr.decode(errors='replace').strip().splitlines()[-1])
+    return statistics.median(timings)
+
+def require_gui():
+    missing = [name for name in GUI_PACKAGES if importlib.util.find_spec(name) is None]
+    if missing:
+        raise SkipBenchmark(f"missing {', '.join(missing)}")
+    import info
+    return info
+
+def require_display():
+    info = require_gui()
+    import tkinter
+    try:
+        root = tkinter.Tk()
+    except tkinter.TclError as e:
+        raise SkipBenchmark(f"no display ({e})")
+    root.destroy()
+    return info
+
+def real_module_available(name):
+    # psutil is replaced by the stub in this process; child processes see
+    # the real installation.
+    code = f"import importlib.util, sys; sys.exit(importlib.util.find_spec({name!r}) is None)"
+    return subprocess.run([sys.executable, '-c', code], cwd=ROOT).returncode == 0
+
+@benchmark('import.zinfo.collectors')
+def bench_import_collectors():
+    if not real_module_available('psutil'):
+        raise SkipBenchmark("psutil not installed")
+    interpreter = measure_process('pass')
+    return max(measure_process('import zinfo.collectors') - interpreter, 0.0)
+
+@benchmark('import.info')
+def bench_import_gui():
+    require_gui()
+    if not real_module_available('psutil'):
+        raise SkipBenchmark("psutil not installed")
+    interpreter = measure_process('pass')
+    return max(measure_process('import info') - interpreter, 0.0)
+
+@benchmark('startup.first_section')
+def bench_first_paint():
+    require_display()
+    timings = []
+    for _ in range(3):
+        start = time.time()
+        result = subprocess.run(
+            [sys.executable, '-c', FIRST_PAINT_SCRIPT],
+            cwd=ROOT, capture_output=True, text=True, timeout=60
+        )
+        if result.returncode != 0 or not result.stdout.strip():
+            raise SkipBenchmark("window did not paint")
+        timings.append(float(result.stdout.split()[-1]) - start)
+    return statistics.median(timings)
+
+def register_collector_benchmarks(collectors):
+    import zinfo.cache as cache
+
+    for key, func in collectors.SECTION_COLLECTORS:
+        def run(func=func):
+            # The snapshot cache is off so static facts are re-probed on
+            # every call and the numbers measure the probing itself.
+            cache.SNAPSHOT_CACHE.enabled = False
+            try:
+                return measure(func)
+            finally:
+                cache.SNAPSHOT_CACHE.enabled = True
+        BENCHMARKS.append((f"collector.{key}", run))
+
+    BENCHMARKS.append(('collector.all.cached', lambda: measure(collectors.collect_sections)))
+
+@benchmark('format_bytes')
+def bench_format_bytes():
+    from zinfo.render import format_bytes
+    values = [0, 512, 1536, 10 ** 6, 3 * 10 ** 9, 7 * 10 ** 12, 2 ** 60]
+    return measure(lambda: [format_bytes(v) for v in values]) / len(values)
+
+@benchmark('alerts.evaluate.300_rules')
+def bench_alerts():
+    from zinfo.alerts import METRICS, AlertEngine, Rule
+    from zinfo.collectors import collect_sections
+    # 300 rules spread over every metric, fed one full set of sections:
+    # the per-tick cost the GUI and `watch` pay on top of collection.
+    names = sorted(METRICS)
+    rules = [Rule(names[i % len(names)], '>', 50 + i % 50, duration=30, hysteresis=5) for i in range(300)]
+    engine = AlertEngine(rules)
+    sections = collect_sections()
+    return measure(lambda: engine.evaluate_all(sections))
+
+def bench_gradient(width, height):
+    info = require_gui()
+    def render():
+        info._gradient_cache.clear()
+        info.generate_gradient_image(width, height, *info.THEME_GRADIENTS['dark'])
+    return measure(render)
+
+for _size in ((800, 900), (3840, 2160)):
+    BENCHMARKS.append((f"generate_gradient_image.{_size[0]}x{_size[1]}", lambda size=_size: bench_gradient(*size)))
+
+@benchmark('get_background_images.cached')
+def bench_background_cached():
+    info = require_gui()
+    info.get_background_images(3840, 2160)
+    return measure(lambda: info.get_background_images(3840, 2160))
+
+def bench_update_gui(entries):
+    info = require_display()
+    app = info.ZInformationApp()
+    try:
+        deadline = time.time() + 10
+        while len(getattr(app, 'section_records', {})) < len(info.SECTION_COLLECTORS) and time.time() < deadline:
+            app.update()
+        from zinfo.model import MountUsage, StorageInfo
+        records = [
+            StorageInfo([
+                MountUsage(f"/dev/sd{i}", f"/mnt/volume{i}", 'ext4', 'ok', 456 * 1024 ** 3, (123 + flip) * 1024 ** 3, 27.0 + flip)
+                for i in range(entries)
+            ], {})
+            for flip in (0, 1)
+        ]
+        state = {'flip': 0}
+        def render():
+            state['flip'] ^= 1
+            app.update_gui('disks', records[state['flip']])
+            app.update_idletasks()
+        return measure(render, repeat=5)
+    finally:
+        app.destroy()
+
+for _entries in (10, 100, 1000):
+    BENCHMARKS.append((f"update_gui.{_entries}", lambda entries=_entries: bench_update_gui(entries)))
+
+def load_baseline(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_baseline(path, results):
+    baseline = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+def format_time(seconds):
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.2f} µs"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="zInfo benchmark suite with baseline regression gates.")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="baseline JSON file (default: %(default)s)")
+    parser.add_argument('--update-baseline', action='store_true', help="store this run as the new baseline")
+    parser.add_argument(
+        '--threshold', type=float, default=DEFAULT_THRESHOLD,
+        help="allowed slowdown as a fraction of the baseline (default: %(default)s)"
+    )
+    parser.add_argument('--filter', help="only run benchmarks whose name contains this text")
+    parser.add_argument(
+        '--allow-missing-baseline', action='store_true',
+        help="exit 0 without a baseline instead of failing (local runs only: nothing is gated)"
+    )
+    args = parser.parse_args(argv)
+
+    collectors = install_stubs()
+    register_collector_benchmarks(collectors)
+
+    baseline = load_baseline(args.baseline)
+    previous = (baseline or {}).get('results', {})
+    results = {}
+    regressions = []
+
+    for name, func in BENCHMARKS:
+        if args.filter and args.filter not in name:
+            continue
+        try:
+            seconds = func()
+        except SkipBenchmark as e:
+            print(f"{name:<40} skipped: {e}")
+            continue
+        results[name] = seconds
+        line = f"{name:<40} {format_time(seconds):>12}"
+        reference = previous.get(name)
+        if reference:
+            change = (seconds - reference) / reference
+            line += f"   baseline {format_time(reference):>12}  {change:+7.1%}"
+            if change > args.threshold and seconds - reference > NOISE_FLOOR:
+                regressions.append(name)
+                line += "  REGRESSION"
+        print(line)
+
+    if args.update_baseline:
+        merged = dict(previous)
+        merged.update(results)
+        save_baseline(args.baseline, merged)
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+    if baseline is None:
+        # Without a baseline nothing is compared, so a gate run must not
+        # pass as if it had been.
+        print(
+            f"\nNo baseline at {args.baseline}: nothing was gated. Run with --update-baseline "
+            "on the reference machine to create one.", file=sys.stderr
+        )
+        return 0 if args.allow_missing_baseline else 2
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+import os
+import sys
+import types
+import atexit
+import shutil
+import tempfile
+import socket
+import contextlib
+import importlib.machinery
+import platform
+import subprocess
+from collections import namedtuple
+
+scputimes = namedtuple('scputimes', 'user nice system idle iowait irq softirq steal guest guest_nice')
+scpufreq = namedtuple('scpufreq', 'current min max')
+svmem = namedtuple('svmem', 'total available percent used free')
+sdiskpart = namedtuple('sdiskpart', 'device mountpoint fstype opts')
+sdiskusage = namedtuple('sdiskusage', 'total used free percent')
+pcputimes = namedtuple('pcputimes', 'user system children_user children_system')
+pmem = namedtuple('pmem', 'rss vms')
+pio = namedtuple('pio', 'read_count write_count read_bytes write_bytes')
+snetio = namedtuple('snetio', 'bytes_sent bytes_recv packets_sent packets_recv errin errout dropin dropout')
+snicaddr = namedtuple('snicaddr', 'family address netmask broadcast ptp')
+snicstats = namedtuple('snicstats', 'isup duplex speed mtu flags')
+
+FAKE_LSPCI = "\n".join([
+    "00:02.0 VGA compatible controller: Intel Corporation UHD Graphics 620 (rev 07)",
+    "00:1f.3 Audio device: Intel Corporation Sunrise Point-LP HD Audio (rev 21)",
+    "02:00.0 Network controller: Intel Corporation Wireless 8265 / 8275 (rev 78)",
+    "03:00.0 Ethernet controller: Realtek Semiconductor Co., Ltd. RTL8111/8168/8411 (rev 15)",
+]) + "\n"
+
+class FakeCpuClock:
+    # cpu_times() advances by the same amount on every call, so every delta
+    # the sampler computes is identical from run to run.
+    def __init__(self, cores):
+        self.cores = cores
+        self.ticks = 0
+
+    def cpu_times(self, percpu=False):
+        self.ticks += 1
+        t = float(self.ticks)
+        per_core = [
+            scputimes(t * (1 + i % 4), 0.0, t, t * 4, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+            for i in range(self.cores)
+        ]
+        if percpu:
+            return per_core
+        return scputimes(*(sum(values) for values in zip(*per_core)))
+
+class FakeProcess:
+    # Counters grow by a pid-dependent step per read, so the ranking is
+    # stable and the same on every run.
+    def __init__(self, pid):
+        self.pid = pid
+        self.reads = 0
+
+    def oneshot(self):
+        return contextlib.nullcontext()
+
+    def create_time(self):
+        return 1700000000.0
+
+    def name(self):
+        return f"worker-{self.pid}"
+
+    def cpu_times(self):
+        self.reads += 1
+        return pcputimes(self.reads * (self.pid % 7) * 0.01, self.reads * 0.001, 0.0, 0.0)
+
+    def memory_info(self):
+        return pmem((self.pid % 97 + 1) * 1024 ** 2, (self.pid % 97 + 1) * 4 * 1024 ** 2)
+
+    def io_counters(self):
+        return pio(self.reads, self.reads, self.reads * (self.pid % 13) * 4096, self.reads * 4096)
+
+class FakeNetwork:
+    # A container host: two physical NICs and a long tail of veth pairs,
+    # with counters that grow by a fixed step per read.
+    def __init__(self, veths):
+        self.names = ['lo', 'eth0', 'eth1'] + [f"veth{i:04x}" for i in range(veths)]
+        self.reads = 0
+
+    def net_io_counters(self, pernic=False):
+        self.reads += 1
+        step = self.reads
+        counters = {
+            name: snetio(step * 1500 * (i + 1), step * 9000 * (i + 1), step * (i + 1), step * 6 * (i + 1), 0, 0, 0, i % 2)
+            for i, name in enumerate(self.names)
+        }
+        if pernic:
+            return counters
+        return snetio(*(sum(values) for values in zip(*counters.values())))
+
+    def net_if_addrs(self):
+        return {
+            name: [
+                snicaddr(-1, f"02:42:ac:11:{i >> 8 & 0xff:02x}:{i & 0xff:02x}", None, None, None),
+                snicaddr(socket.AF_INET, f"172.17.{i >> 8 & 0xff}.{i & 0xff}", '255.255.0.0', None, None),
+            ]
+            for i, name in enumerate(self.names)
+        }
+
+    def net_if_stats(self):
+        return {name: snicstats(True, 2, 10000 if name.startswith('eth') else 0, 1500, '') for name in self.names}
+
+def write_fake_block_devices(root, namespaces=64, mappers=32):
+    # A /proc/diskstats with many NVMe namespaces, their partitions and dm
+    # devices, plus the /sys/block entries that mark the whole disks.
+    names = [f"nvme{i // 8}n{i % 8 + 1}" for i in range(namespaces)]
+    names += [f"dm-{i}" for i in range(mappers)]
+    block = os.path.join(root, 'block')
+    lines = []
+    for idx, name in enumerate(names):
+        os.makedirs(os.path.join(block, name))
+        base = (idx + 1) * 1000
+        lines.append(f"{259:4d} {idx * 2:7d} {name} {base} 12 {base * 8} {base // 4} {base // 2} 3 {base * 4} {base // 8} 0 {base // 3} {base // 3} 0 0 0 0 0 0")
+        if name.startswith('nvme'):
+            lines.append(f"{259:4d} {idx * 2 + 1:7d} {name}p1 {base} 12 {base * 8} {base // 4} {base // 2} 3 {base * 4} {base // 8} 0 {base // 3} {base // 3} 0 0 0 0 0 0")
+    path = os.path.join(root, 'diskstats')
+    with open(path, 'w') as f:
+        f.write("\n".join(lines) + "\n")
+    return path, block
+
+def write_fake_hwmon(root, chips=4, temps=8, fans=2):
+    # A sysfs hwmon tree with dozens of inputs, and one thermal zone that
+    # duplicates a hwmon chip and so must be skipped.
+    hwmon = os.path.join(root, 'hwmon')
+    thermal = os.path.join(root, 'thermal')
+    for chip in range(chips):
+        directory = os.path.join(hwmon, f"hwmon{chip}")
+        os.makedirs(directory)
+        files = {'name': 'acpitz' if chip == 0 else f"coretemp{chip}"}
+        for i in range(1, temps + 1):
+            files[f"temp{i}_input"] = str(40000 + 1000 * i + chip * 500)
+            files[f"temp{i}_label"] = f"Core {i - 1}"
+            files[f"temp{i}_max"] = "80000"
+            files[f"temp{i}_crit"] = "100000"
+        for i in range(1, fans + 1):
+            files[f"fan{i}_input"] = str(1200 + 100 * i)
+        files['power1_average'] = "15250000"
+        for name, content in files.items():
+            with open(os.path.join(directory, name), 'w') as f:
+                f.write(content + "\n")
+    zone = os.path.join(thermal, 'thermal_zone0')
+    os.makedirs(zone)
+    for name, content in (('type', 'acpitz'), ('temp', '45000')):
+        with open(os.path.join(zone, name), 'w') as f:
+            f.write(content + "\n")
+    return hwmon, thermal
+
+FAKE_MEMINFO = """MemTotal:       65536000 kB
+MemFree:        12000000 kB
+MemAvailable:   40000000 kB
+Buffers:          800000 kB
+Cached:         26000000 kB
+SwapCached:        12000 kB
+Active:         30000000 kB
+Inactive:       18000000 kB
+SwapTotal:       8388604 kB
+SwapFree:        8000000 kB
+Dirty:              4200 kB
+Writeback:             0 kB
+AnonPages:      20000000 kB
+Shmem:            900000 kB
+Slab:            2400000 kB
+SReclaimable:    1800000 kB
+SUnreclaim:       600000 kB
+CommitLimit:    41156604 kB
+Committed_AS:   35000000 kB
+HugePages_Total:     512
+HugePages_Free:      128
+Hugepagesize:       2048 kB
+"""
+
+def write_fake_procfs(root):
+    # /proc/meminfo, PSI files and a cgroup v2 hierarchy with a memory
+    # limit, as seen from inside a container.
+    proc = os.path.join(root, 'proc')
+    pressure = os.path.join(proc, 'pressure')
+    cgroup = os.path.join(root, 'cgroup', 'container.scope')
+    os.makedirs(pressure)
+    os.makedirs(cgroup)
+    files = {
+        os.path.join(proc, 'meminfo'): FAKE_MEMINFO,
+        os.path.join(proc, 'mountinfo'): f"30 24 0:26 / {os.path.join(root, 'cgroup')} rw,nosuid - cgroup2 cgroup2 rw\n",
+        os.path.join(proc, 'cgroup'): "0::/container.scope\n",
+        os.path.join(cgroup, 'memory.current'): "1610612736\n",
+        os.path.join(cgroup, 'memory.max'): "4294967296\n",
+    }
+    for resource in ('cpu', 'memory', 'io'):
+        files[os.path.join(pressure, resource)] = (
+            "some avg10=1.25 avg60=0.80 avg300=0.30 total=123456\n"
+            "full avg10=0.50 avg60=0.20 avg300=0.05 total=45678\n"
+        )
+    for path, content in files.items():
+        with open(path, 'w') as f:
+            f.write(content)
+    return (
+        os.path.join(proc, 'meminfo'), pressure,
+        os.path.join(proc, 'mountinfo'), os.path.join(proc, 'cgroup')
+    )
+
+def build_psutil_stub(cores=8, mounts=10, processes=300, veths=200):
+    psutil = types.ModuleType('psutil')
+    psutil.__spec__ = importlib.machinery.ModuleSpec('psutil', None)
+    clock = FakeCpuClock(cores)
+    partitions = [sdiskpart('/dev/sda1', '/', 'ext4', 'rw')]
+    partitions += [sdiskpart(f'/dev/sdb{i}', f'/mnt/data{i}', 'xfs', 'rw') for i in range(1, mounts)]
+    partitions += [sdiskpart('tmpfs', f'/run/user/{i}', 'tmpfs', 'rw') for i in range(mounts)]
+
+    psutil.cpu_count = lambda logical=True: cores if logical else max(cores // 2, 1)
+    psutil.cpu_freq = lambda percpu=False: (
+        [scpufreq(2400.0, 800.0, 3600.0)] * cores if percpu else scpufreq(2400.0, 800.0, 3600.0)
+    )
+    psutil.cpu_times = clock.cpu_times
+    psutil.cpu_percent = lambda interval=None, percpu=False: [25.0] * cores if percpu else 25.0
+    psutil.virtual_memory = lambda: svmem(16 * 1024 ** 3, 9 * 1024 ** 3, 43.75, 7 * 1024 ** 3, 5 * 1024 ** 3)
+    psutil.disk_partitions = lambda all=False: list(partitions if all else partitions[:mounts])
+    psutil.disk_usage = lambda path: sdiskusage(512 * 1024 ** 3, 200 * 1024 ** 3, 312 * 1024 ** 3, 39.1)
+    psutil.boot_time = lambda: 1700000000.0
+    pids = list(range(1, processes + 1))
+    table = {pid: FakeProcess(pid) for pid in pids}
+    psutil.Error = type('Error', (Exception,), {})
+    psutil.AccessDenied = type('AccessDenied', (psutil.Error,), {})
+    psutil.NoSuchProcess = type('NoSuchProcess', (psutil.Error,), {})
+    psutil.pids = lambda: list(pids)
+    network = FakeNetwork(veths)
+    psutil.AF_LINK = -1
+    psutil.net_io_counters = network.net_io_counters
+    psutil.net_if_addrs = network.net_if_addrs
+    psutil.net_if_stats = network.net_if_stats
+    psutil.Process = lambda pid: table[pid]
+    return psutil
+
+def fake_subprocess_run(args, *posargs, **kwargs):
+    if args and args[0] == 'lspci':
+        return subprocess.CompletedProcess(args, 0, stdout=FAKE_LSPCI, stderr='')
+    return subprocess.CompletedProcess(args, 1, stdout='', stderr='')
+
+# Replaces psutil and process spawning with deterministic fakes; has to
+# run before anything under zinfo is imported.
+def install_stubs(cores=8, mounts=10):
+    if any(name == 'zinfo' or name.startswith('zinfo.') for name in sys.modules):
+        raise RuntimeError("install_stubs() must run before zinfo is imported")
+    sys.modules['psutil'] = build_psutil_stub(cores, mounts)
+    platform.system = lambda: 'Linux'
+
+    import zinfo.collectors as collectors
+    import zinfo.cache as cache
+    import zinfo.isolation as isolation
+    import zinfo.probes as probes
+
+    # Worker processes would import the real psutil; probes run in-process
+    # against the stubs instead.
+    isolation.PROBE_POOL.isolated = False
+    probes.subprocess = types.SimpleNamespace(
+        run=fake_subprocess_run,
+        CREATE_NO_WINDOW=0,
+        CompletedProcess=subprocess.CompletedProcess
+    )
+    # Always take the lspci path so the devices collector does not depend
+    # on the host's PCI bus.
+    collectors.sysfs_pci_available = lambda: False
+    cache.SNAPSHOT_CACHE.path = None
+
+    import zinfo.diskio as diskio
+    root = tempfile.mkdtemp(prefix='zinfo-bench-')
+    atexit.register(shutil.rmtree, root, True)
+    diskstats_path, diskio.SYS_BLOCK_PATH = write_fake_block_devices(root)
+    diskio.DISK_IO_SAMPLER.open(diskstats_path)
+
+    import zinfo.sensors as sensors
+    sensors.SENSOR_SAMPLER.open(*write_fake_hwmon(root))
+
+    import zinfo.meminfo as meminfo
+    meminfo.MEMORY_PRESSURE_SAMPLER.open(*write_fake_procfs(root))
+    return collectors
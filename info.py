@@ -1,4 +1,14 @@
 import sys
+
+HEADLESS_FLAGS = ('--json', '--text')
+HEADLESS_COMMANDS = ('history', 'record', 'agent', 'aggregate', 'watch')
+
+if __name__ == "__main__" and (
+    any(arg in HEADLESS_FLAGS for arg in sys.argv[1:]) or sys.argv[1:2] and sys.argv[1] in HEADLESS_COMMANDS
+):
+    from zinfo.cli import main
+    sys.exit(main(sys.argv[1:]))
+
 import subprocess
 import importlib.util
 import os
@@ -11,10 +21,14 @@ REQUIRED_PACKAGES = {
     'pythoncom': 'pywin32'
 }
 
+WINDOWS_ONLY_PACKAGES = {'wmi', 'pythoncom'}
+
 def check_and_install_packages():
     missing_packages = []
     
     for module_name, package_name in REQUIRED_PACKAGES.items():
+        if module_name in WINDOWS_ONLY_PACKAGES and sys.platform != "win32":
+            continue
         if importlib.util.find_spec(module_name) is None:
             missing_packages.append(package_name)
     
@@ -44,336 +58,308 @@ check_and_install_packages()
 import customtkinter as ctk
 import tkinter as tk
 import threading
-import psutil
-import platform
-import math
-import traceback
-from PIL import Image, ImageDraw
-
-try:
-    import wmi
-    import pythoncom
-    WMI_AVAILABLE = True
-except ImportError:
-    WMI_AVAILABLE = False
-
-def get_system_language():
-    try:
-        import locale
-        try:
-            sys_lang = locale.getlocale()[0]
-        except:
-            sys_lang = None
-        
-        if not sys_lang:
-            try:
-                sys_lang = locale.getdefaultlocale()[0]
-            except:
-                sys_lang = None
-        
-        if sys_lang:
-            if sys_lang.startswith('it'):
-                return 'it'
-            elif sys_lang.startswith('en'):
-                return 'en'
-            elif sys_lang.startswith('es'):
-                return 'es'
-            elif sys_lang.startswith('fr'):
-                return 'fr'
-            elif sys_lang.startswith('de'):
-                return 'de'
-        return 'en'
-    except:
-        return 'en'
-
-TRANSLATIONS = {
-    'it': {
-        'title': 'zInfo Pro',
-        'analyzing': 'Analisi del sistema in corso...',
-        'light_mode': 'Modalità Chiara',
-        'dark_mode': 'Modalità Scura',
-        'changing_in': 'Cambio in {}s',
-        'footer': '✨ zInfo Pro | v2.0.0 | Multi-Platform System Tool ✨',
-        'os': 'SISTEMA OPERATIVO',
-        'cpu': 'PROCESSORE',
-        'memory': 'MEMORIA RAM',
-        'disks': 'ARCHIVIAZIONE',
-        'devices': 'PERIFERICHE E DRIVER',
-        'license': 'LICENZA WINDOWS',
-        'os_label': 'Sistema',
-        'edition': 'Edizione',
-        'version': 'Versione',
-        'architecture': 'Architettura',
-        'computer_name': 'Nome Computer',
-        'processor': 'Processore',
-        'physical_cores': 'Core Fisici',
-        'logical_cores': 'Thread Logici',
-        'max_frequency': 'Frequenza Max',
-        'frequency_unavailable': 'Frequenza: Non disponibile',
-        'total': 'Totale',
-        'available': 'Disponibile',
-        'in_use': 'In Uso',
-        'drive': 'Unità',
-        'space': 'Spazio',
-        'info_unavailable': 'Informazioni non disponibili',
-        'graphics': '  ▸ Schede Grafiche:',
-        'driver': '     ├─ Driver',
-        'audio': '\n  ▸ Dispositivi Audio:',
-        'network': '\n  ▸ Schede di Rete:',
-        'ip': '     ├─ IP',
-        'wmi_error': '  Errore WMI: {}',
-        'wmi_not_installed': '  WMI non disponibile',
-        'drivers_windows_only': '  Info driver disponibili solo su Windows',
-        'license_key': 'Chiave Prodotto',
-        'license_status': 'Stato Licenza',
-        'license_error': 'Impossibile recuperare la licenza',
-        'license_linux': 'Sistema Linux - Licenza non applicabile',
-        'fatal_error': 'ERRORE CRITICO',
-        'refresh': 'Aggiorna Dati',
-        'refreshing': 'Aggiornamento...'
-    },
-    'en': {
-        'title': 'zInfo Pro',
-        'analyzing': 'System analysis in progress...',
-        'light_mode': 'Light Mode',
-        'dark_mode': 'Dark Mode',
-        'changing_in': 'Changing in {}s',
-        'footer': '✨ zInfo Pro | v2.0.0 | Multi-Platform System Tool ✨',
-        'os': 'OPERATING SYSTEM',
-        'cpu': 'PROCESSOR',
-        'memory': 'RAM MEMORY',
-        'disks': 'STORAGE',
-        'devices': 'DEVICES AND DRIVERS',
-        'license': 'WINDOWS LICENSE',
-        'os_label': 'System',
-        'edition': 'Edition',
-        'version': 'Version',
-        'architecture': 'Architecture',
-        'computer_name': 'Computer Name',
-        'processor': 'Processor',
-        'physical_cores': 'Physical Cores',
-        'logical_cores': 'Logical Threads',
-        'max_frequency': 'Max Frequency',
-        'frequency_unavailable': 'Frequency: Not available',
-        'total': 'Total',
-        'available': 'Available',
-        'in_use': 'In Use',
-        'drive': 'Drive',
-        'space': 'Space',
-        'info_unavailable': 'Information not available',
-        'graphics': '  ▸ Graphics Cards:',
-        'driver': '     ├─ Driver',
-        'audio': '\n  ▸ Audio Devices:',
-        'network': '\n  ▸ Network Adapters:',
-        'ip': '     ├─ IP',
-        'wmi_error': '  WMI Error: {}',
-        'wmi_not_installed': '  WMI not available',
-        'drivers_windows_only': '  Driver info available only on Windows',
-        'license_key': 'Product Key',
-        'license_status': 'License Status',
-        'license_error': 'Unable to retrieve license',
-        'license_linux': 'Linux System - License not applicable',
-        'fatal_error': 'CRITICAL ERROR',
-        'refresh': 'Refresh Data',
-        'refreshing': 'Refreshing...'
-    }
+from array import array
+from collections import OrderedDict
+from PIL import Image, ImageDraw, ImagePath, ImageTk
+
+from zinfo.alerts import DEFAULT_RULES, AlertEngine, load_rules
+from zinfo.collectors import SECTION_COLLECTORS, VOLATILE_SECTIONS, collect_sections
+from zinfo.i18n import get_translations
+from zinfo.history import METRIC_HISTORY
+from zinfo.profiling import TRACER, summarize_spans
+from zinfo.model import ProcessInfo
+from zinfo.processes import TOP_PROCESSES
+from zinfo.recorder import SnapshotLog, default_log_path, snapshot_values
+from zinfo.render import PROCESS_GROUPS, format_process_row, render_section
+from zinfo.sampler import CPU_SAMPLER
+
+LIVE_INTERVALS = {'1s': 1000, '2s': 2000, '5s': 5000, '10s': 10000}
+
+SPARKLINE_METRICS = {'cpu': 'cpu.percent', 'memory': 'memory.percent', 'disks': 'disks.percent'}
+SPARKLINE_COLORS = {
+    True: ("#252525", "#42A5F5"),
+    False: ("#F5F5F5", "#1976D2")
 }
 
-def format_bytes(bytes_val):
-    if bytes_val < 1024:
-        return f"{bytes_val} B"
-    exp = int(math.log(bytes_val) / math.log(1024))
-    pre = "KMGTPE"[exp - 1] + "B"
-    return f"{bytes_val / (1024 ** exp):.2f} {pre}"
-
-def get_windows_license():
-    try:
-        result = subprocess.run(
-            ['wmic', 'path', 'softwarelicensingservice', 'get', 'OA3xOriginalProductKey'],
-            capture_output=True, text=True, timeout=5, creationflags=subprocess.CREATE_NO_WINDOW
+SECTION_BORDER_COLOR = ("#E0E0E0", "#353535")
+ALERT_BORDER_COLOR = ("#E53935", "#EF5350")
+MAX_LISTED_ALERTS = 4
+
+THEME_GRADIENTS = {
+    'dark': ((20, 25, 35), (10, 15, 25)),
+    'light': ((248, 249, 252), (235, 237, 242))
+}
+
+# Enough for a few recent window sizes in both themes; a 4K gradient is
+# about 25 MB, so the cache is bounded rather than kept per size forever.
+GRADIENT_CACHE_SIZE = 6
+_gradient_cache = OrderedDict()
+
+WINDOW_SIZE = (800, 900)
+MIN_WINDOW_SIZE = (640, 600)
+RESIZE_DEBOUNCE_MS = 120
+# Content labels wrap this many logical pixels short of the window width
+# (680 at the default 800).
+WRAP_MARGIN = 120
+
+def render_gradient_image(width, height, start_color, end_color):
+    # A single vertical ramp, mapped to each colour channel through a
+    # lookup table and stretched sideways; no per-row Python work.
+    ramp = Image.linear_gradient('L').resize((1, height), Image.BILINEAR)
+    channels = [
+        ramp.point(lambda v, s=s, e=e: int(s + (e - s) * v / 255))
+        for s, e in zip(start_color, end_color)
+    ]
+    return Image.merge('RGB', channels).resize((width, height), Image.NEAREST)
+
+def generate_gradient_image(width, height, start_color, end_color):
+    # Rendering is cheaper than decoding a stored PNG, so gradients are
+    # only cached in memory and nothing is written to disk.
+    key = (width, height, tuple(start_color), tuple(end_color))
+    img = _gradient_cache.get(key)
+    if img is None:
+        img = render_gradient_image(width, height, start_color, end_color)
+        _gradient_cache[key] = img
+        while len(_gradient_cache) > GRADIENT_CACHE_SIZE:
+            _gradient_cache.popitem(last=False)
+    else:
+        _gradient_cache.move_to_end(key)
+    return img
+
+def get_background_images(width, height):
+    light = generate_gradient_image(width, height, *THEME_GRADIENTS['light'])
+    dark = generate_gradient_image(width, height, *THEME_GRADIENTS['dark'])
+    return light, dark
+
+class Sparkline:
+    def __init__(self, master, history, width=640, height=36):
+        self.history = history
+        self.width = width
+        self.height = height
+        
+        # Buffers are sized once for the full ring; a redraw copies samples
+        # into them with slice assignments and lets Pillow scale and draw
+        # the float32 path in C, so no per-point Python objects are built.
+        capacity = history.capacity
+        self.samples = array('f', bytes(4 * capacity))
+        self.coords = array('f', bytes(8 * capacity))
+        step = (width - 1) / max(capacity - 1, 1)
+        self.coords[0::2] = array('f', [i * step for i in range(capacity)])
+        
+        self.image = Image.new('RGB', (width, height))
+        self.draw = ImageDraw.Draw(self.image)
+        self.photo = ImageTk.PhotoImage(self.image)
+        self.label = tk.Label(master, image=self.photo, bd=0, highlightthickness=0)
+
+    def redraw(self):
+        bg, fg = SPARKLINE_COLORS[ctk.get_appearance_mode() == "Dark"]
+        self.draw.rectangle((0, 0, self.width, self.height), fill=bg)
+        
+        n = self.history.copy_into(self.samples)
+        if n >= 2:
+            self.coords[1:2 * n:2] = self.samples[:n]
+            path = ImagePath.Path(self.coords[:2 * n])
+            scale = (self.height - 4) / 100.0
+            path.transform((1, 0, 0, 0, -scale, self.height - 2))
+            self.draw.line(path, fill=fg, width=2)
+        
+        self.label.configure(bg=bg)
+        self.photo.paste(self.image)
+
+def build_heat_palette():
+    stops = [(0, (76, 175, 80)), (128, (255, 193, 7)), (255, (244, 67, 54))]
+    palette = []
+    for (start, start_color), (end, end_color) in zip(stops, stops[1:]):
+        for i in range(start, end):
+            ratio = (i - start) / (end - start)
+            palette.extend(int(a + (b - a) * ratio) for a, b in zip(start_color, end_color))
+    palette.extend(stops[-1][1])
+    return palette
+
+HEAT_PALETTE = build_heat_palette()
+
+class HeatStrip:
+    def __init__(self, master, width=640, height=14):
+        self.width = width
+        self.height = height
+        self.photo = ImageTk.PhotoImage(Image.new('RGB', (width, height)))
+        self.label = tk.Label(master, image=self.photo, bd=0, highlightthickness=0)
+
+    def redraw(self, per_core):
+        # One pixel per core straight from the sampler's float32 buffer,
+        # coloured through a palette and stretched by Pillow.
+        n = len(per_core)
+        if not n:
+            return
+        cells = Image.frombuffer('F', (n, 1), per_core, 'raw', 'F', 0, 1)
+        cells = cells.point(lambda v: v * 2.55).convert('L')
+        cells.putpalette(HEAT_PALETTE)
+        strip = cells.resize((self.width, self.height), Image.NEAREST).convert('RGB')
+        self.photo.paste(strip)
+
+class ProcessTable:
+    # A fixed set of row labels created once; a tick only reconfigures the
+    # rows whose text changed, however often the ranking shuffles.
+    def __init__(self, master, font, rows=TOP_PROCESSES):
+        self.frame = ctk.CTkFrame(master, fg_color="transparent")
+        self.frame.grid_columnconfigure(0, weight=1)
+        self.texts = {}
+        self.groups = []
+        
+        label_options = dict(
+            font=font, 
+            justify="left", 
+            anchor="w", 
+            height=18,
+            text_color=("#424242", "#E0E0E0")
         )
-        lines = result.stdout.strip().split('\n')
-        if len(lines) > 1:
-            key = lines[1].strip()
-            if key:
-                return key
-        
-        result = subprocess.run(
-            ['wmic', 'path', 'SoftwareLicensingProduct', 'where', 
-             'ApplicationID="55c92734-d682-4d71-983e-d6ec3f16059f"', 
-             'get', 'LicenseStatus'],
-            capture_output=True, text=True, timeout=5, creationflags=subprocess.CREATE_NO_WINDOW
+        self.summary_label = ctk.CTkLabel(self.frame, text="", **label_options)
+        self.summary_label.grid(row=0, column=0, sticky="ew")
+        
+        row_idx = 1
+        for field, title in PROCESS_GROUPS:
+            title_label = ctk.CTkLabel(self.frame, text="", **label_options)
+            title_label.grid(row=row_idx, column=0, sticky="ew", pady=(6, 0))
+            row_idx += 1
+            row_labels = []
+            for _ in range(rows):
+                row_label = ctk.CTkLabel(self.frame, text="", **label_options)
+                row_label.grid(row=row_idx, column=0, sticky="ew")
+                row_labels.append(row_label)
+                row_idx += 1
+            self.groups.append((field, title, title_label, row_labels))
+
+    def set_text(self, label, text):
+        if self.texts.get(label) != text:
+            label.configure(text=text)
+            self.texts[label] = text
+
+    def update(self, info, t):
+        if not isinstance(info, ProcessInfo):
+            self.set_text(self.summary_label, render_section('processes', info, t))
+            for _, _, title_label, row_labels in self.groups:
+                self.set_text(title_label, "")
+                for row_label in row_labels:
+                    self.set_text(row_label, "")
+            return
+        
+        summary = f"{t['process_count']}: {info.total}"
+        if info.since_start:
+            summary += f" ({t['since_start']})"
+        self.set_text(self.summary_label, summary)
+        for field, title, title_label, row_labels in self.groups:
+            self.set_text(title_label, f"▸ {t[title]}")
+            rows = getattr(info, field)
+            for idx, row_label in enumerate(row_labels):
+                self.set_text(row_label, format_process_row(rows[idx]) if idx < len(rows) else "")
+
+# Sections longer than this are shown through a VirtualList: only this many
+# row labels ever exist and scrolling re-targets them at other lines.
+VISIBLE_ROWS = 24
+WHEEL_LINES = 3
+
+class VirtualList:
+    def __init__(self, master, font, rows=VISIBLE_ROWS):
+        self.frame = ctk.CTkFrame(master, fg_color="transparent")
+        self.frame.grid_columnconfigure(0, weight=1)
+        self.lines = []
+        self.offset = 0
+        self.texts = {}
+        self.labels = []
+        for row_idx in range(rows):
+            label = ctk.CTkLabel(
+                self.frame, 
+                text="", 
+                font=font, 
+                justify="left", 
+                anchor="w", 
+                height=18,
+                text_color=("#424242", "#E0E0E0")
+            )
+            label.grid(row=row_idx, column=0, sticky="ew")
+            label.bind("<MouseWheel>", self.on_wheel)
+            label.bind("<Button-4>", self.on_wheel)
+            label.bind("<Button-5>", self.on_wheel)
+            self.labels.append(label)
+        self.scrollbar = ctk.CTkScrollbar(
+            self.frame, 
+            command=self.yview,
+            button_color=("#BDBDBD", "#4A4A4A"),
+            button_hover_color=("#9E9E9E", "#6A6A6A")
         )
-        lines = result.stdout.strip().split('\n')
-        if len(lines) > 1:
-            status = lines[1].strip()
-            if status == '1':
-                return 'Licensed ✓'
-            elif status == '0':
-                return 'Unlicensed ✗'
-        
-        return 'Status Unknown'
-    except Exception:
-        return 'Unable to retrieve'
-
-def get_system_info():
-    lang = get_system_language()
-    t = TRANSLATIONS.get(lang, TRANSLATIONS['en'])
-    
-    if WMI_AVAILABLE and platform.system() == "Windows":
-        try:
-            pythoncom.CoInitialize()
-        except Exception:
-            pass
-            
-    info_sections = {}
-    try:
-        uname = platform.uname()
-
-        os_info = []
-        os_info.append(f"┌─ {t['os_label']}: {uname.system} {uname.release}")
-        if uname.system == "Windows":
-            try:
-                edition = platform.win32_edition()
-                if edition:
-                    os_info.append(f"├─ {t['edition']}: {edition}")
-            except:
-                pass
-        os_info.append(f"├─ {t['version']}: {uname.version}")
-        os_info.append(f"├─ {t['architecture']}: {uname.machine}")
-        os_info.append(f"└─ {t['computer_name']}: {uname.node}")
-        info_sections[t['os']] = "\n".join(os_info)
-
-        cpu_info = []
-        cpu_info.append(f"┌─ {t['processor']}: {uname.processor}")
-        cpu_info.append(f"├─ {t['physical_cores']}: {psutil.cpu_count(logical=False)}")
-        cpu_info.append(f"├─ {t['logical_cores']}: {psutil.cpu_count(logical=True)}")
-        try:
-            cpu_freq = psutil.cpu_freq()
-            if cpu_freq:
-                cpu_info.append(f"├─ {t['max_frequency']}: {cpu_freq.max:.2f} MHz")
-                cpu_info.append(f"└─ Utilizzo: {psutil.cpu_percent(interval=0.1)}%")
-            else:
-                cpu_info.append(f"└─ {t['frequency_unavailable']}")
-        except Exception:
-            cpu_info.append(f"└─ {t['frequency_unavailable']}")
-        info_sections[t['cpu']] = "\n".join(cpu_info)
-
-        memory_info = []
-        memory = psutil.virtual_memory()
-        memory_info.append(f"┌─ {t['total']}: {format_bytes(memory.total)}")
-        memory_info.append(f"├─ {t['available']}: {format_bytes(memory.available)}")
-        memory_info.append(f"└─ {t['in_use']}: {format_bytes(memory.used)} ({memory.percent}%)")
-        info_sections[t['memory']] = "\n".join(memory_info)
-
-        disk_info = []
-        partitions = psutil.disk_partitions()
-        for idx, p in enumerate(partitions):
-            prefix = "└─" if idx == len(partitions) - 1 else "├─"
-            disk_info.append(f"{prefix} {t['drive']}: {p.device} ({p.fstype})")
-            try:
-                usage = psutil.disk_usage(p.mountpoint)
-                sub_prefix = "    " if idx == len(partitions) - 1 else "│   "
-                disk_info.append(f"{sub_prefix}{t['space']}: {format_bytes(usage.used)} / {format_bytes(usage.total)} ({usage.percent}%)")
-            except (PermissionError, FileNotFoundError):
-                sub_prefix = "    " if idx == len(partitions) - 1 else "│   "
-                disk_info.append(f"{sub_prefix}{t['info_unavailable']}")
-        info_sections[t['disks']] = "\n".join(disk_info)
-        
-        driver_info = []
-        if WMI_AVAILABLE and uname.system == "Windows":
-            try:
-                c = wmi.WMI() 
-                driver_info.append(t['graphics'])
-                for controller in c.Win32_VideoController():
-                    driver_info.append(f"     ├─ {controller.Name}")
-                    if controller.DriverVersion:
-                        driver_info.append(f"     │  {t['driver']}: {controller.DriverVersion}")
-                
-                driver_info.append(t['audio'])
-                for sound in c.Win32_SoundDevice():
-                    if sound.Name:
-                        driver_info.append(f"     ├─ {sound.Name}")
-
-                driver_info.append(t['network'])
-                for adapter in c.Win32_NetworkAdapterConfiguration(IPEnabled=True):
-                    if adapter.IPAddress:
-                        driver_info.append(f"     ├─ {adapter.Description}")
-                        driver_info.append(f"     │  {t['ip']}: {adapter.IPAddress[0]}")
-                        
-            except Exception as e:
-                driver_info.append(t['wmi_error'].format(str(e)[:50]))
-        elif uname.system == "Windows":
-            driver_info.append(t['wmi_not_installed'])
+        self.scrollbar.grid(row=0, column=1, rowspan=rows, sticky="ns")
+
+    def set_lines(self, lines):
+        self.lines = lines
+        self.scroll_to(self.offset)
+
+    def scroll_to(self, offset):
+        rows = len(self.labels)
+        self.offset = max(0, min(offset, len(self.lines) - rows))
+        for idx, label in enumerate(self.labels):
+            line_idx = self.offset + idx
+            text = self.lines[line_idx] if line_idx < len(self.lines) else ""
+            if self.texts.get(idx) != text:
+                label.configure(text=text)
+                self.texts[idx] = text
+        if self.lines:
+            self.scrollbar.set(self.offset / len(self.lines), min((self.offset + rows) / len(self.lines), 1.0))
         else:
-            try:
-                result = subprocess.run(['lspci'], capture_output=True, text=True, timeout=2)
-                if result.returncode == 0:
-                    lines = result.stdout.split('\n')
-                    gpu_lines = [l for l in lines if 'VGA' in l or 'Display' in l or '3D' in l]
-                    if gpu_lines:
-                        driver_info.append(t['graphics'])
-                        for gpu in gpu_lines[:3]:
-                            driver_info.append(f"     ├─ {gpu.split(': ')[-1]}")
-                    
-                    audio_lines = [l for l in lines if 'Audio' in l]
-                    if audio_lines:
-                        driver_info.append(t['audio'])
-                        for audio in audio_lines[:3]:
-                            driver_info.append(f"     ├─ {audio.split(': ')[-1]}")
-                    
-                    net_lines = [l for l in lines if 'Network' in l or 'Ethernet' in l]
-                    if net_lines:
-                        driver_info.append(t['network'])
-                        for net in net_lines[:3]:
-                            driver_info.append(f"     ├─ {net.split(': ')[-1]}")
-            except:
-                driver_info.append(t['drivers_windows_only'])
-        
-        if not driver_info:
-            driver_info.append(t['drivers_windows_only'])
-        info_sections[t['devices']] = "\n".join(driver_info)
-
-        license_info = []
-        if uname.system == "Windows":
-            license_key = get_windows_license()
-            license_info.append(f"┌─ {t['license_key']}: {license_key}")
-            license_info.append(f"└─ {t['license_status']}: Active")
+            self.scrollbar.set(0.0, 1.0)
+
+    def yview(self, action, value, unit=None):
+        if action == 'moveto':
+            self.scroll_to(round(float(value) * len(self.lines)))
+        elif action == 'scroll':
+            step = len(self.labels) if unit == 'pages' else 1
+            self.scroll_to(self.offset + int(value) * step)
+
+    def on_wheel(self, event):
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            self.scroll_to(self.offset - WHEEL_LINES)
         else:
-            license_info.append(f"└─ {t['license_linux']}")
-        info_sections[t['license']] = "\n".join(license_info)
-
-        return info_sections
-    except Exception as e:
-        return {t['fatal_error']: traceback.format_exc()}
-
-def generate_gradient_image(width, height, start_color, end_color, filename):
-    try:
-        Image.open(filename)
-    except FileNotFoundError:
-        img = Image.new('RGB', (width, height), start_color)
-        draw = ImageDraw.Draw(img)
-        for i in range(height):
-            r = int(start_color[0] + (end_color[0] - start_color[0]) * i / height)
-            g = int(start_color[1] + (end_color[1] - start_color[1]) * i / height)
-            b = int(start_color[2] + (end_color[2] - start_color[2]) * i / height)
-            draw.line((0, i, width, i), fill=(r, g, b))
-        img.save(filename)
+            self.scroll_to(self.offset + WHEEL_LINES)
+        # Keep the outer scroll frame's bind_all handler from also scrolling.
+        return "break"
 
 class ZInformationApp(ctk.CTk):
-    def __init__(self):
+    def __init__(self, debug=False, trace_path=None, record_path=None, alert_rules=DEFAULT_RULES):
         super().__init__()
 
-        self.lang = get_system_language()
-        self.t = TRANSLATIONS.get(self.lang, TRANSLATIONS['en'])
+        self.t = get_translations()
+        self.debug = debug or bool(trace_path)
+        self.trace_path = trace_path
+        if self.debug:
+            TRACER.enabled = True
+        self.recorder = SnapshotLog(record_path) if record_path else None
+        self.alerts = AlertEngine(alert_rules)
         
         self.is_dark_mode = True
         self.theme_changing = False
         self.is_refreshing = False
+        self.generation = 0
+        self.has_pending_load = False
+        self.pending_keys = None
+        self.resize_job = None
+        self.rewrap_job = None
+        self.applied_size = WINDOW_SIZE
+        self.wraplength = WINDOW_SIZE[0] - WRAP_MARGIN
+        self.unwrapped_labels = set()
+        self.live_job = None
+        self.section_frames = None
+        self.sparklines = {}
+        self.heat_strip = None
+        self.process_table = None
         
+        with TRACER.span('gui.init', 'gui'):
+            self.build_window()
+
+        self.request_data_load()
+
+    def build_window(self):
         self.title(self.t['title'])
-        self.geometry("800x900")
-        self.resizable(False, False)
+        self.geometry(f"{WINDOW_SIZE[0]}x{WINDOW_SIZE[1]}")
+        self.minsize(*MIN_WINDOW_SIZE)
 
         self.title_font = ctk.CTkFont(family="Segoe UI", size=38, weight="bold")
         self.section_title_font = ctk.CTkFont(family="Segoe UI", size=20, weight="bold")
@@ -386,9 +372,8 @@ class ZInformationApp(ctk.CTk):
         except Exception:
             pass 
 
-        self.light_img = Image.open("gradient_bg_light.png")
-        self.dark_img = Image.open("gradient_bg_dark.png")
-        self.bg_image_ctk = ctk.CTkImage(light_image=self.light_img, dark_image=self.dark_img, size=(800, 900))
+        self.light_img, self.dark_img = get_background_images(*WINDOW_SIZE)
+        self.bg_image_ctk = ctk.CTkImage(light_image=self.light_img, dark_image=self.dark_img, size=WINDOW_SIZE)
         self.bg_image_label = ctk.CTkLabel(self, image=self.bg_image_ctk, text="")
         self.bg_image_label.grid(row=0, column=0, sticky="nsew")
         self.grid_rowconfigure(0, weight=1)
@@ -420,6 +405,27 @@ class ZInformationApp(ctk.CTk):
         self.button_container = ctk.CTkFrame(self.header_frame, fg_color="transparent")
         self.button_container.grid(row=0, column=2, sticky="e")
         
+        self.live_switch = ctk.CTkSwitch(
+            self.button_container, 
+            text=self.t['live'], 
+            command=self.toggle_live,
+            font=self.button_font,
+            progress_color=("#4CAF50", "#388E3C")
+        )
+        self.live_switch.grid(row=0, column=0, padx=(0, 10))
+        
+        self.live_interval_menu = ctk.CTkOptionMenu(
+            self.button_container, 
+            values=list(LIVE_INTERVALS), 
+            command=self.change_live_interval,
+            width=70, 
+            height=42, 
+            font=self.button_font, 
+            corner_radius=12
+        )
+        self.live_interval_menu.set('1s')
+        self.live_interval_menu.grid(row=0, column=1, padx=(0, 10))
+        
         self.refresh_button = ctk.CTkButton(
             self.button_container, 
             text="↻", 
@@ -431,7 +437,7 @@ class ZInformationApp(ctk.CTk):
             fg_color=("#4CAF50", "#388E3C"),
             hover_color=("#45A049", "#2E7D32")
         )
-        self.refresh_button.grid(row=0, column=0, padx=(0, 10))
+        self.refresh_button.grid(row=0, column=2, padx=(0, 10))
         
         self.toggle_button = ctk.CTkButton(
             self.button_container, 
@@ -444,7 +450,7 @@ class ZInformationApp(ctk.CTk):
             fg_color=("#2196F3", "#1976D2"),
             hover_color=("#1976D2", "#1565C0")
         )
-        self.toggle_button.grid(row=0, column=1)
+        self.toggle_button.grid(row=0, column=3)
         
         self.loading_label = ctk.CTkLabel(
             self.glass_frame, 
@@ -471,6 +477,15 @@ class ZInformationApp(ctk.CTk):
             scrollbar_button_hover_color=("#9E9E9E", "#6A6A6A")
         )
         self.info_scroll_frame.grid_columnconfigure(0, weight=1)
+        # CTkScrollableFrame has no scroll callback; chaining onto its
+        # canvas's yscrollcommand lets labels scrolled into view pick up a
+        # wrap width deferred by a resize. The canvas and scrollbar are
+        # private (customtkinter 5.x); without them deferred labels are
+        # only rewrapped on the next resize or update.
+        scroll_canvas = getattr(self.info_scroll_frame, '_parent_canvas', None)
+        scrollbar = getattr(self.info_scroll_frame, '_scrollbar', None)
+        if scroll_canvas is not None and scrollbar is not None:
+            scroll_canvas.configure(yscrollcommand=lambda first, last: (scrollbar.set(first, last), self.schedule_rewrap()))
         
         self.footer_label = ctk.CTkLabel(
             self.glass_frame, 
@@ -479,26 +494,115 @@ class ZInformationApp(ctk.CTk):
             text_color=("#757575", "#9E9E9E")
         )
         self.footer_label.grid(row=3, column=0, pady=20, sticky="s")
-
-        self.start_data_load()
+        
+        # add="+" keeps CTk's own <Configure> handler, which tracks the
+        # window size for its DPI scaling.
+        self.bind("<Configure>", self.on_configure, add="+")
+
+    def on_configure(self, event):
+        # Every child's <Configure> also reaches the toplevel binding; only
+        # the window's own are of interest, and a drag produces dozens, so
+        # the relayout runs once the size has settled.
+        if event.widget is not self:
+            return
+        if self.resize_job is not None:
+            self.after_cancel(self.resize_job)
+        self.resize_job = self.after(RESIZE_DEBOUNCE_MS, self.apply_resize)
+
+    def apply_resize(self):
+        self.resize_job = None
+        width, height = self.winfo_width(), self.winfo_height()
+        if (width, height) == self.applied_size or width <= 1:
+            return
+        self.applied_size = (width, height)
+        
+        # The gradient is rendered at the real pixel size and handed to
+        # CTkImage at the matching logical size, so it is not resampled.
+        # _get_window_scaling() is private to customtkinter 5.x; Tk's own
+        # scaling (pixels per point, 1.333 at 96 DPI) is the fallback.
+        get_scaling = getattr(self, '_get_window_scaling', None)
+        scaling = get_scaling() if get_scaling else self.tk.call('tk', 'scaling') * 72 / 96
+        logical_size = (round(width / scaling), round(height / scaling))
+        with TRACER.span('gui.resize.background', 'gui'):
+            self.light_img, self.dark_img = get_background_images(width, height)
+            self.bg_image_ctk.configure(light_image=self.light_img, dark_image=self.dark_img, size=logical_size)
+        
+        wraplength = max(logical_size[0] - WRAP_MARGIN, 200)
+        if wraplength != self.wraplength:
+            self.wraplength = wraplength
+            self.unwrapped_labels = set(getattr(self, 'content_labels', {}).values())
+            self.rewrap_visible_labels()
+
+    def schedule_rewrap(self):
+        if self.unwrapped_labels and self.rewrap_job is None:
+            self.rewrap_job = self.after_idle(self.rewrap_visible_labels)
+
+    def rewrap_visible_labels(self):
+        # Rewrapping re-lays out the label's text; only labels in the
+        # viewport are done now, the rest when they are scrolled into view.
+        self.rewrap_job = None
+        top = self.glass_frame.winfo_rooty()
+        bottom = top + self.glass_frame.winfo_height()
+        for label in list(self.unwrapped_labels):
+            if not label.winfo_exists():
+                self.unwrapped_labels.discard(label)
+                continue
+            if not label.winfo_ismapped():
+                continue
+            label_top = label.winfo_rooty()
+            if label_top < bottom and label_top + label.winfo_height() > top:
+                label.configure(wraplength=self.wraplength)
+                self.unwrapped_labels.discard(label)
 
     def refresh_data(self):
+        self.refresh_button.configure(state="disabled", text="↻")
+        self.request_data_load()
+
+    def request_data_load(self, keys=None):
+        # At most one load is in flight. Requests arriving meanwhile are
+        # merged into a single follow-up generation, started when the
+        # current one finishes.
         if self.is_refreshing:
+            if self.has_pending_load and self.pending_keys is not None and keys is not None:
+                self.pending_keys = self.pending_keys | set(keys)
+            elif not self.has_pending_load:
+                self.pending_keys = None if keys is None else set(keys)
+            else:
+                self.pending_keys = None
+            self.has_pending_load = True
             return
         
         self.is_refreshing = True
-        self.refresh_button.configure(state="disabled", text="↻")
-        
-        for widget in self.info_scroll_frame.winfo_children():
-            widget.destroy()
-        
-        self.loading_label.configure(text=self.t['refreshing'])
-        self.loading_label.grid(row=1, column=0, pady=20, sticky="ew")
-        self.progress_bar.grid(row=2, column=0, padx=30, pady=(0, 30), sticky="new")
-        self.progress_bar.start()
-        self.info_scroll_frame.grid_forget()
+        self.generation += 1
+        TRACER.begin_refresh()
+        self.start_data_load(keys, self.generation)
+
+    def toggle_live(self):
+        if self.live_switch.get():
+            self.schedule_live_tick()
+        elif self.live_job is not None:
+            self.after_cancel(self.live_job)
+            self.live_job = None
+
+    def change_live_interval(self, choice):
+        if self.live_job is not None:
+            self.after_cancel(self.live_job)
+            self.live_job = None
+            self.schedule_live_tick()
+
+    def schedule_live_tick(self):
+        if self.live_job is None:
+            interval = LIVE_INTERVALS.get(self.live_interval_menu.get(), 1000)
+            self.live_job = self.after(interval, self.live_tick)
+
+    def live_tick(self):
+        self.live_job = None
+        if not self.live_switch.get():
+            return
         
-        self.start_data_load()
+        # Static sections come from the snapshot cache and never change
+        # between ticks, so only the volatile collectors are re-run.
+        self.request_data_load(keys=VOLATILE_SECTIONS)
 
     def toggle_theme_with_delay(self):
         if self.theme_changing:
@@ -530,71 +634,258 @@ class ZInformationApp(ctk.CTk):
         
         self.toggle_button.configure(state="normal")
         self.theme_changing = False
-
-    def start_data_load(self):
-        thread = threading.Thread(target=self.load_data_in_background, daemon=True)
+        
+        for sparkline in self.sparklines.values():
+            sparkline.redraw()
+
+    def start_data_load(self, keys=None, generation=None):
+        if self.section_frames is None:
+            with TRACER.span('gui.build_sections', 'gui'):
+                self.build_section_placeholders()
+        thread = threading.Thread(target=self.load_data_in_background, args=(keys, generation), daemon=True)
         thread.start()
 
-    def load_data_in_background(self):
-        info_sections = get_system_info()
-        self.after(0, self.update_gui, info_sections)
+    def load_data_in_background(self, keys=None, generation=None):
+        collect_sections(
+            on_section=lambda key, record: self.after(0, self.update_gui, key, record, generation),
+            keys=keys
+        )
+        self.after(0, self.finish_data_load, generation)
 
-    def update_gui(self, info_sections):
-        if not hasattr(self, 'progress_bar'):
-            return
-            
-        self.progress_bar.stop()
-        self.progress_bar.grid_forget()
-        self.loading_label.grid_forget()
+    def build_section_placeholders(self):
+        if hasattr(self, 'progress_bar'):
+            self.progress_bar.stop()
+            self.progress_bar.grid_forget()
+            self.loading_label.grid_forget()
         
         self.info_scroll_frame.grid(row=1, column=0, rowspan=2, padx=30, pady=(0, 20), sticky="nsew")
 
-        row_idx = 0
+        self.section_frames = {}
+        self.section_spinners = {}
+        self.content_labels = {}
+        self.virtual_lists = {}
+        self.section_records = {}
+        self.section_labels = {}
+        self.alert_labels = {}
         
-        for title, content in info_sections.items():
+        for row_idx, (key, _) in enumerate(SECTION_COLLECTORS):
             
             section_frame = ctk.CTkFrame(
                 self.info_scroll_frame,
                 fg_color=("#F5F5F5", "#252525"),
                 corner_radius=15,
                 border_width=2,
-                border_color=("#E0E0E0", "#353535")
+                border_color=SECTION_BORDER_COLOR
             )
             section_frame.grid(row=row_idx, column=0, sticky="ew", pady=(0, 15), padx=5)
             section_frame.grid_columnconfigure(0, weight=1)
             
             section_label = ctk.CTkLabel(
                 section_frame, 
-                text=title, 
+                text=self.t[key], 
                 font=self.section_title_font,
                 anchor="w",
                 text_color=("#0D47A1", "#42A5F5")
             )
             section_label.grid(row=0, column=0, sticky="ew", padx=15, pady=12)
             
-            content_label = ctk.CTkLabel(
+            spinner = ctk.CTkProgressBar(
                 section_frame, 
-                text=content, 
-                font=self.info_text_font,
-                wraplength=680, 
-                justify="left", 
-                anchor="nw",
-                text_color=("#424242", "#E0E0E0")
+                mode="indeterminate", 
+                height=6, 
+                corner_radius=3,
+                progress_color=("#2196F3", "#42A5F5")
             )
-            content_label.grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 15))
+            spinner.grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 15))
+            spinner.start()
             
-            row_idx += 1
+            if key in SPARKLINE_METRICS:
+                sparkline = Sparkline(section_frame, METRIC_HISTORY.get(SPARKLINE_METRICS[key]))
+                sparkline.label.grid(row=2, column=0, sticky="w", padx=20, pady=(0, 15))
+                sparkline.redraw()
+                self.sparklines[key] = sparkline
+            
+            if key == 'cpu':
+                self.heat_strip = HeatStrip(section_frame)
+                self.heat_strip.label.grid(row=3, column=0, sticky="w", padx=20, pady=(0, 15))
+            
+            if key == 'processes':
+                self.process_table = ProcessTable(section_frame, self.info_text_font)
+            
+            self.section_frames[key] = section_frame
+            self.section_labels[key] = section_label
+            self.section_spinners[key] = spinner
+
+    def update_gui(self, key, record, generation=None):
+        # A result from an older generation never repaints over a newer one.
+        if generation is not None and generation < self.generation:
+            return
+        with TRACER.span(f"gui.update.{key}", 'gui'):
+            self.show_section(key, record)
+            # Rules see every sample, but Tk is only touched when an alert
+            # fires or clears.
+            if self.alerts.evaluate(key, record):
+                self.show_alerts(key)
+
+    def show_alerts(self, key):
+        section_frame = self.section_frames.get(key)
+        if section_frame is None or not section_frame.winfo_exists():
+            return
+        alerts = self.alerts.section_alerts(key)
+        section_frame.configure(border_color=ALERT_BORDER_COLOR if alerts else SECTION_BORDER_COLOR)
+        self.section_labels[key].configure(text=f"⚠ {self.t[key]}" if alerts else self.t[key])
         
-        if hasattr(self, 'refresh_button') and self.refresh_button.winfo_exists():
-            self.refresh_button.configure(state="normal", text="↻")
+        alert_label = self.alert_labels.get(key)
+        if not alerts:
+            if alert_label is not None:
+                alert_label.grid_remove()
+            return
+        lines = [f"⚠ {alert.describe()}" for alert in alerts[:MAX_LISTED_ALERTS]]
+        if len(alerts) > MAX_LISTED_ALERTS:
+            lines.append(f"… +{len(alerts) - MAX_LISTED_ALERTS} {self.t['more_alerts']}")
+        if alert_label is None:
+            alert_label = ctk.CTkLabel(
+                section_frame,
+                text="",
+                font=self.info_text_font,
+                justify="left",
+                anchor="w",
+                text_color=ALERT_BORDER_COLOR
+            )
+            self.alert_labels[key] = alert_label
+        alert_label.configure(text="\n".join(lines))
+        alert_label.grid(row=4, column=0, sticky="ew", padx=20, pady=(0, 15))
+
+    def show_section(self, key, record):
+        section_frame = self.section_frames.get(key)
+        if section_frame is None or not section_frame.winfo_exists():
+            return
+        
+        sparkline = self.sparklines.get(key)
+        if sparkline is not None:
+            sparkline.redraw()
+        if key == 'cpu' and self.heat_strip is not None and CPU_SAMPLER.latest is not None:
+            self.heat_strip.redraw(CPU_SAMPLER.latest.per_core)
+        
+        # Widgets outlive refreshes: an unchanged record is neither formatted
+        # nor touches Tk, and a changed one costs a single configure() on
+        # its existing label.
+        if self.section_records.get(key) == record:
+            return
+        self.section_records[key] = record
+        
+        spinner = self.section_spinners.pop(key, None)
+        if spinner is not None:
+            spinner.stop()
+            spinner.destroy()
+        
+        if key == 'processes' and self.process_table is not None:
+            if spinner is not None:
+                self.process_table.frame.grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 15))
+            self.process_table.update(record, self.t)
+            return
+        
+        content = render_section(key, record, self.t)
+        lines = content.split("\n")
+        content_label = self.content_labels.get(key)
+        virtual_list = self.virtual_lists.get(key)
+        
+        # Long sections go through a fixed pool of row labels, so the Tk
+        # widget count and layout cost do not grow with the number of
+        # mounts or devices; short ones keep a single wrapping label.
+        if len(lines) > VISIBLE_ROWS:
+            if virtual_list is None:
+                virtual_list = VirtualList(section_frame, self.info_text_font)
+                self.virtual_lists[key] = virtual_list
+            if content_label is not None:
+                content_label.grid_remove()
+            virtual_list.frame.grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 15))
+            virtual_list.set_lines(lines)
+            return
+        
+        if virtual_list is not None:
+            virtual_list.frame.grid_remove()
+        if content_label is not None:
+            content_label.configure(text=content)
+            content_label.grid()
+            self.schedule_rewrap()
+            return
+            
+        content_label = ctk.CTkLabel(
+            section_frame, 
+            text=content, 
+            font=self.info_text_font,
+            wraplength=self.wraplength, 
+            justify="left", 
+            anchor="nw",
+            text_color=("#424242", "#E0E0E0")
+        )
+        content_label.grid(row=1, column=0, sticky="ew", padx=20, pady=(0, 15))
+        self.content_labels[key] = content_label
+
+    def finish_data_load(self, generation=None):
+        if generation is not None and generation < self.generation:
+            return
+        # A refresh merged into the pending follow-up is still in progress,
+        # so the button stays disabled until that load finishes too.
+        if not self.has_pending_load and hasattr(self, 'refresh_button') and self.refresh_button.winfo_exists():
+            if self.refresh_button.cget("state") == "disabled":
+                self.refresh_button.configure(state="normal", text="↻")
         self.is_refreshing = False
+        
+        if self.recorder is not None:
+            try:
+                self.recorder.append(snapshot_values(self.section_records))
+            except OSError:
+                self.recorder = None
+        
+        if self.debug:
+            self.report_timings()
+        
+        if self.has_pending_load:
+            keys = self.pending_keys
+            self.has_pending_load = False
+            self.pending_keys = None
+            self.request_data_load(keys)
+        elif self.live_switch.get():
+            self.schedule_live_tick()
+
+    def report_timings(self):
+        spans = TRACER.snapshot()
+        self.footer_label.configure(text=f"{self.t['footer']}\n{summarize_spans(spans)}")
+        TRACER.log_refresh(spans)
+        if self.trace_path:
+            try:
+                TRACER.export_chrome_trace(self.trace_path, spans)
+            except OSError:
+                pass
 
 if __name__ == "__main__":
-    generate_gradient_image(800, 900, (20, 25, 35), (10, 15, 25), "gradient_bg_dark.png")
-    generate_gradient_image(800, 900, (248, 249, 252), (235, 237, 242), "gradient_bg_light.png")
+    import argparse
+    import logging
+
+    parser = argparse.ArgumentParser(prog="info.py", description="zInfo Pro system information tool.")
+    parser.add_argument('--debug', action='store_true', help="show per-refresh timings in the footer and log them to stderr")
+    parser.add_argument('--trace', metavar='PATH', help="write the last refresh as Chrome trace-event JSON to PATH")
+    parser.add_argument(
+        '--record', metavar='PATH', nargs='?', const=default_log_path(),
+        help="append every refresh to a history log (default: %(const)s); see 'info.py history'"
+    )
+    parser.add_argument('--rules', metavar='PATH', help="JSON list of alert rules (default: the built-in rules); see 'info.py watch'")
+    args = parser.parse_args()
+    
+    alert_rules = DEFAULT_RULES
+    if args.rules:
+        try:
+            alert_rules = load_rules(args.rules)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+    
+    if args.debug or args.trace:
+        logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stderr)
 
     ctk.set_appearance_mode("Dark")
     ctk.set_default_color_theme("blue")
     
-    app = ZInformationApp()
+    app = ZInformationApp(debug=args.debug, trace_path=args.trace, record_path=args.record, alert_rules=alert_rules)
     app.mainloop()
\ No newline at end of file
@@ -0,0 +1,5 @@
+import sys
+
+from zinfo.cli import main
+
+sys.exit(main(sys.argv[1:]))
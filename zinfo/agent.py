@@ -0,0 +1,291 @@
+import os
+import json
+import time
+import asyncio
+from urllib.parse import parse_qs, urlsplit
+
+from zinfo.collectors import VOLATILE_SECTIONS, collect_sections
+
+DEFAULT_PORT = 8765
+SAMPLE_INTERVAL = 1.0
+STATIC_REFRESH = 300.0
+MAX_HEADER_BYTES = 16 * 1024
+# Delta bodies are cached per `since` value until the next version; most
+# pollers ask for the same one or two.
+MAX_CACHED_DELTAS = 32
+
+REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed'}
+
+def encode_json(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+class SnapshotStore:
+    # Every top-level field of every section carries the version in which
+    # it last changed, so a `since` delta is a filter over versions. Bodies
+    # are encoded once per version and shared by all requests.
+    def __init__(self):
+        self.instance = f"{os.getpid():x}{int(time.time()):x}"
+        self.version = 0
+        self.sections = {}
+        self.field_versions = {}
+        self.reset_versions = {}
+        self.full_body = None
+        self.delta_bodies = {}
+
+    @property
+    def token(self):
+        return f"{self.instance}-{self.version}"
+
+    @property
+    def etag(self):
+        return f'"{self.token}"'
+
+    def update(self, results):
+        version = self.version + 1
+        changed = False
+        for key, record in results.items():
+            data = record.as_dict()
+            data['_type'] = type(record).__name__
+            previous = self.sections.get(key)
+            versions = self.field_versions.setdefault(key, {})
+            if previous is None or previous.keys() != data.keys():
+                # New section, or a different record type (e.g. an error):
+                # clients replace it instead of merging fields.
+                self.reset_versions[key] = version
+                versions.clear()
+                versions.update(dict.fromkeys(data, version))
+                changed = True
+            else:
+                for field, value in data.items():
+                    if previous[field] != value:
+                        versions[field] = version
+                        changed = True
+            self.sections[key] = data
+        if changed:
+            self.version = version
+            self.full_body = None
+            self.delta_bodies.clear()
+        return changed
+
+    def full(self):
+        if self.full_body is None:
+            self.full_body = encode_json({
+                'instance': self.instance, 'version': self.version, 'sections': self.sections
+            })
+        return self.full_body
+
+    def delta(self, since):
+        body = self.delta_bodies.get(since)
+        if body is None:
+            sections = {}
+            reset = []
+            for key, versions in self.field_versions.items():
+                if self.reset_versions.get(key, 0) > since:
+                    reset.append(key)
+                    sections[key] = self.sections[key]
+                    continue
+                fields = {field: self.sections[key][field] for field, v in versions.items() if v > since}
+                if fields:
+                    sections[key] = fields
+            body = encode_json({
+                'instance': self.instance, 'version': self.version, 'since': since,
+                'reset': reset, 'sections': sections
+            })
+            if len(self.delta_bodies) >= MAX_CACHED_DELTAS:
+                self.delta_bodies.clear()
+            self.delta_bodies[since] = body
+        return body
+
+class Agent:
+    # Volatile sections are sampled on one shared schedule and static ones
+    # every STATIC_REFRESH seconds (their collectors answer from the
+    # snapshot cache); requests only ever read the store.
+    def __init__(self, interval=SAMPLE_INTERVAL, static_refresh=STATIC_REFRESH):
+        self.interval = interval
+        self.static_refresh = static_refresh
+        self.store = SnapshotStore()
+        self.ready = asyncio.Event()
+
+    async def sample_forever(self):
+        loop = asyncio.get_running_loop()
+        static_due = 0.0
+        while True:
+            started = loop.time()
+            keys = VOLATILE_SECTIONS
+            if started >= static_due:
+                keys = None
+                static_due = started + self.static_refresh
+            results = await loop.run_in_executor(None, lambda: collect_sections(keys=keys))
+            self.store.update(results)
+            self.ready.set()
+            await asyncio.sleep(max(self.interval - (loop.time() - started), 0.0))
+
+    def respond(self, method, target, headers):
+        if method not in ('GET', 'HEAD'):
+            return 405, {}, b''
+        url = urlsplit(target)
+        if url.path != '/snapshot':
+            return 404, {}, b''
+        store = self.store
+        response_headers = {'ETag': store.etag, 'Content-Type': 'application/json; charset=utf-8'}
+        if headers.get('if-none-match') == store.etag:
+            return 304, response_headers, b''
+        # `since` is a version, optionally prefixed with the instance it came
+        # from; a token from another instance (a restarted agent) gets the
+        # full snapshot.
+        since = parse_qs(url.query).get('since')
+        if since is None:
+            return 200, response_headers, store.full()
+        instance, _, since = since[0].rpartition('-')
+        try:
+            since = int(since)
+        except ValueError:
+            return 400, {}, b''
+        if instance and instance != store.instance or since > store.version:
+            return 200, response_headers, store.full()
+        if since == store.version:
+            return 304, response_headers, b''
+        return 200, response_headers, store.delta(since)
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ', 2)
+                except ValueError:
+                    status, response_headers, body, method, version = 400, {}, b'', 'GET', 'HTTP/1.0'
+                    headers = {}
+                else:
+                    headers = {}
+                    for line in lines[1:]:
+                        name, _, value = line.partition(':')
+                        if name:
+                            headers[name.strip().lower()] = value.strip()
+                    status, response_headers, body = self.respond(method, target, headers)
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                writer.write(b''.join([
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n".encode('latin-1'),
+                    *(f"{name}: {value}\r\n".encode('latin-1') for name, value in response_headers.items()),
+                    f"Content-Length: {len(body)}\r\n".encode('latin-1'),
+                    b"Connection: keep-alive\r\n\r\n" if keep_alive else b"Connection: close\r\n\r\n",
+                    b'' if method == 'HEAD' else body
+                ]))
+                await writer.drain()
+                if not keep_alive:
+                    return
+        finally:
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=DEFAULT_PORT, on_ready=None):
+        sampler = asyncio.ensure_future(self.sample_forever())
+        await self.ready.wait()
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_HEADER_BYTES)
+        if on_ready:
+            on_ready(server)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            sampler.cancel()
+
+class AgentClient:
+    # Keeps one keep-alive connection per agent and a merged copy of its
+    # snapshot, asking only for what changed since the last version seen.
+    def __init__(self, host, port, timeout=5.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.reader = None
+        self.writer = None
+        self.token = None
+        self.etag = None
+        self.sections = {}
+        self.error = None
+
+    @property
+    def name(self):
+        return f"{self.host}:{self.port}"
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+    async def request(self, target):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port, limit=MAX_HEADER_BYTES)
+        headers = f"GET {target} HTTP/1.1\r\nHost: {self.name}\r\n"
+        if self.etag:
+            headers += f"If-None-Match: {self.etag}\r\n"
+        self.writer.write((headers + "\r\n").encode('latin-1'))
+        await self.writer.drain()
+        head = await self.reader.readuntil(b'\r\n\r\n')
+        lines = head.decode('latin-1').split('\r\n')
+        status = int(lines[0].split(' ', 2)[1])
+        response_headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(':')
+            if name:
+                response_headers[name.strip().lower()] = value.strip()
+        length = int(response_headers.get('content-length', 0))
+        body = await self.reader.readexactly(length) if length else b''
+        if response_headers.get('connection', '').lower() == 'close':
+            await self.close()
+        return status, response_headers, body
+
+    async def poll(self):
+        target = '/snapshot' if self.token is None else f"/snapshot?since={self.token}"
+        try:
+            status, headers, body = await asyncio.wait_for(self.request(target), self.timeout)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError, IndexError) as e:
+            await self.close()
+            self.error = str(e) or type(e).__name__
+            return False
+        self.error = None
+        if status == 304:
+            return False
+        if status != 200:
+            self.error = f"HTTP {status}"
+            return False
+        data = json.loads(body)
+        if 'since' not in data:
+            self.sections = data['sections']
+        else:
+            reset = set(data['reset'])
+            for key, fields in data['sections'].items():
+                if key in reset:
+                    self.sections[key] = fields
+                else:
+                    self.sections.setdefault(key, {}).update(fields)
+        self.token = f"{data['instance']}-{data['version']}"
+        self.etag = headers.get('etag')
+        return True
+
+async def poll_agents(clients):
+    # One round: every agent is polled concurrently; returns the clients
+    # whose snapshot changed.
+    changed = await asyncio.gather(*(client.poll() for client in clients))
+    return [client for client, updated in zip(clients, changed) if updated]
+
+async def aggregate(addresses, interval=SAMPLE_INTERVAL, rounds=None, on_round=None):
+    clients = [AgentClient(host, port) for host, port in addresses]
+    loop = asyncio.get_running_loop()
+    done = 0
+    try:
+        while rounds is None or done < rounds:
+            started = loop.time()
+            changed = await poll_agents(clients)
+            done += 1
+            if on_round:
+                on_round(clients, changed)
+            if rounds is None or done < rounds:
+                await asyncio.sleep(max(interval - (loop.time() - started), 0.0))
+    finally:
+        for client in clients:
+            await client.close()
+    return clients
@@ -0,0 +1,248 @@
+import json
+import time
+import bisect
+import operator
+
+from zinfo.model import CpuInfo, DiskIoInfo, MemoryInfo, MemoryPressureInfo, NetworkInfo, SensorInfo, StorageInfo
+
+COMPARATORS = {'>': operator.gt, '>=': operator.ge, '<': operator.lt, '<=': operator.le}
+
+# metric name -> (section key, reader); a reader turns the section's record
+# into (instance, value) pairs, instance being None for a single value, or
+# returns None when the section failed and holds no record to read.
+METRICS = {}
+
+def metric(name, section, record_type):
+    def register(func):
+        def read(record):
+            return func(record) if isinstance(record, record_type) else None
+        METRICS[name] = (section, read)
+        return func
+    return register
+
+@metric('cpu.usage', 'cpu', CpuInfo)
+def read_cpu_usage(cpu):
+    return ((None, cpu.usage),)
+
+@metric('cpu.core', 'cpu', CpuInfo)
+def read_cpu_cores(cpu):
+    return enumerate(cpu.per_core or ())
+
+@metric('memory.percent', 'memory', MemoryInfo)
+def read_memory_percent(memory):
+    return ((None, memory.percent),)
+
+@metric('memory.available', 'memory', MemoryInfo)
+def read_memory_available(memory):
+    return ((None, memory.available),)
+
+@metric('swap.percent', 'memory_pressure', MemoryPressureInfo)
+def read_swap_percent(info):
+    if not info.swap_total:
+        return ()
+    return ((None, 100.0 * (info.swap_total - (info.swap_free or 0)) / info.swap_total),)
+
+@metric('pressure.some10', 'memory_pressure', MemoryPressureInfo)
+def read_pressure_some(info):
+    return ((stall.resource, stall.some10) for stall in info.pressure)
+
+@metric('pressure.full10', 'memory_pressure', MemoryPressureInfo)
+def read_pressure_full(info):
+    return ((stall.resource, stall.full10) for stall in info.pressure)
+
+@metric('disks.percent', 'disks', StorageInfo)
+def read_mount_percent(storage):
+    return ((mount.mountpoint, mount.percent) for mount in storage.mounts)
+
+@metric('disk_io.utilization', 'disk_io', DiskIoInfo)
+def read_disk_utilization(info):
+    return ((device.name, device.utilization) for device in info.devices)
+
+@metric('disk_io.latency', 'disk_io', DiskIoInfo)
+def read_disk_latency(info):
+    return ((device.name, device.latency) for device in info.devices)
+
+@metric('interfaces.error_rate', 'interfaces', NetworkInfo)
+def read_interface_errors(info):
+    return ((interface.name, interface.error_rate) for interface in info.interfaces)
+
+@metric('interfaces.drop_rate', 'interfaces', NetworkInfo)
+def read_interface_drops(info):
+    return ((interface.name, interface.drop_rate) for interface in info.interfaces)
+
+@metric('sensors.temperature', 'sensors', SensorInfo)
+def read_temperatures(info):
+    return (
+        (f"{sensor.chip}/{sensor.label}", sensor.value)
+        for sensor in info.sensors if sensor.kind == 'temperature'
+    )
+
+class Rule:
+    # Fires once `metric comparator threshold` has held for `duration`
+    # seconds, and clears only when the value is back past the threshold by
+    # `hysteresis`, so a value hovering at the limit does not flap.
+    __slots__ = ('name', 'metric', 'comparator', 'threshold', 'duration', 'hysteresis', 'section', 'read', 'test', 'release')
+
+    def __init__(self, metric, comparator, threshold, duration=0.0, hysteresis=0.0, name=None):
+        if metric not in METRICS:
+            raise ValueError(f"unknown metric {metric!r} (available: {', '.join(sorted(METRICS))})")
+        if comparator not in COMPARATORS:
+            raise ValueError(f"unknown comparator {comparator!r} (use one of {' '.join(COMPARATORS)})")
+        self.name = name or f"{metric} {comparator} {threshold:g}"
+        self.metric = metric
+        self.comparator = comparator
+        self.threshold = float(threshold)
+        self.duration = float(duration)
+        self.hysteresis = abs(float(hysteresis))
+        self.section, self.read = METRICS[metric]
+        self.test = COMPARATORS[comparator]
+        if comparator in ('>', '>='):
+            self.release = self.threshold - self.hysteresis
+        else:
+            self.release = self.threshold + self.hysteresis
+
+    # The index range of `ordered` (ascending values) that meets the
+    # threshold.
+    def span(self, ordered):
+        if self.comparator == '>':
+            return bisect.bisect_right(ordered, self.threshold), len(ordered)
+        if self.comparator == '>=':
+            return bisect.bisect_left(ordered, self.threshold), len(ordered)
+        if self.comparator == '<':
+            return 0, bisect.bisect_left(ordered, self.threshold)
+        return 0, bisect.bisect_right(ordered, self.threshold)
+
+DEFAULT_RULES = (
+    Rule('memory.percent', '>', 90, duration=30, hysteresis=5),
+    Rule('disks.percent', '>', 95, hysteresis=1),
+    Rule('cpu.core', '>=', 99, duration=30, hysteresis=10, name="cpu.core pinned"),
+)
+
+def load_rules(path):
+    # A JSON list of objects with metric, comparator, threshold and
+    # optionally duration (seconds), hysteresis and name.
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError(f"{path}: expected a JSON list of rules")
+    rules = []
+    for idx, entry in enumerate(entries):
+        try:
+            rules.append(Rule(**entry))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"{path}: rule {idx + 1}: {e}")
+    return rules
+
+class AlertState:
+    # All that is kept per rule and instance, and only while the condition
+    # holds: no history is rescanned.
+    __slots__ = ('pending_since', 'active', 'value')
+
+    def __init__(self, pending_since):
+        self.pending_since = pending_since
+        self.active = False
+        self.value = None
+
+class AlertEvent:
+    __slots__ = ('rule', 'instance', 'value', 'fired', 'timestamp')
+
+    def __init__(self, rule, instance, value, fired, timestamp):
+        self.rule = rule
+        self.instance = instance
+        self.value = value
+        self.fired = fired
+        self.timestamp = timestamp
+
+    def describe(self):
+        subject = self.rule.name if self.instance is None else f"{self.rule.name} [{self.instance}]"
+        return f"{subject}: {self.value:.1f}" if self.value is not None else subject
+
+class AlertEngine:
+    # Rules are grouped by section and then by metric, so a sample only
+    # touches the rules that read it and each metric is extracted once
+    # however many rules share it.
+    def __init__(self, rules=DEFAULT_RULES):
+        self.rules = list(rules)
+        self.by_section = {}
+        for rule in self.rules:
+            self.by_section.setdefault(rule.section, {}).setdefault(rule.metric, []).append(rule)
+        self.states = {rule: {} for rule in self.rules}
+        self.active_counts = dict.fromkeys(self.by_section, 0)
+
+    def step(self, rule, states, state, instance, value, now, wall, events):
+        state.value = value
+        if state.active:
+            if not rule.test(value, rule.release):
+                del states[instance]
+                self.active_counts[rule.section] -= 1
+                events.append(AlertEvent(rule, instance, value, False, wall))
+        elif rule.test(value, rule.threshold):
+            if now - state.pending_since >= rule.duration:
+                state.active = True
+                self.active_counts[rule.section] += 1
+                events.append(AlertEvent(rule, instance, value, True, wall))
+        else:
+            del states[instance]
+
+    # Feeds one section's new record to its rules and returns the alerts
+    # that fired or cleared.
+    def evaluate(self, key, record, now=None):
+        metrics = self.by_section.get(key)
+        if not metrics:
+            return []
+        now = time.monotonic() if now is None else now
+        wall = time.time()
+        events = []
+        for rules in metrics.values():
+            pairs = rules[0].read(record)
+            if pairs is None:
+                continue
+            # Readings are sorted once per metric; each rule then finds the
+            # instances past its threshold by bisection, so a rule whose
+            # values are all inside the limit costs O(log n) however many
+            # mounts, cores or interfaces there are. A reading of None (a
+            # stale mount, a sensor in EIO) leaves its state as it is.
+            pairs = list(pairs)
+            values = {instance: value for instance, value in pairs if value is not None}
+            stale = {instance for instance, value in pairs if value is None}
+            readings = sorted(values.items(), key=operator.itemgetter(1))
+            ordered = [value for _, value in readings]
+            for rule in rules:
+                states = self.states[rule]
+                lo, hi = rule.span(ordered)
+                for instance, value in readings[lo:hi]:
+                    state = states.get(instance)
+                    if state is None:
+                        state = states[instance] = AlertState(now)
+                    self.step(rule, states, state, instance, value, now, wall, events)
+                if not states:
+                    continue
+                for instance in list(states):
+                    value = values.get(instance)
+                    if value is not None:
+                        if not rule.test(value, rule.threshold):
+                            self.step(rule, states, states[instance], instance, value, now, wall, events)
+                    elif instance not in stale:
+                        # An instance that went away (an unmounted volume, a
+                        # removed NIC) takes its alert with it.
+                        if states.pop(instance).active:
+                            self.active_counts[key] -= 1
+                            events.append(AlertEvent(rule, instance, None, False, wall))
+        return events
+
+    def evaluate_all(self, sections, now=None):
+        events = []
+        for key, record in sections.items():
+            events.extend(self.evaluate(key, record, now))
+        return events
+
+    def section_alerts(self, key):
+        if not self.active_counts.get(key):
+            return []
+        return [
+            AlertEvent(rule, instance, state.value, True, None)
+            for rules in self.by_section[key].values()
+            for rule in rules
+            for instance, state in self.states[rule].items()
+            if state.active
+        ]
@@ -0,0 +1,117 @@
+import os
+import sys
+import time
+import platform
+import threading
+import functools
+
+import psutil
+
+# Bump when the shape of a cached fact changes.
+CACHE_VERSION = 2
+
+def user_cache_dir():
+    if sys.platform == "win32":
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser(os.path.join('~', 'AppData', 'Local'))
+        return os.path.join(base, 'zInfo', 'Cache')
+    if sys.platform == "darwin":
+        return os.path.expanduser(os.path.join('~', 'Library', 'Caches', 'zInfo'))
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(os.path.join('~', '.cache'))
+    return os.path.join(base, 'zinfo')
+
+def get_invalidation_key():
+    # Anything cached is only valid for the current boot of the current
+    # kernel on the current machine.
+    uname = platform.uname()
+    try:
+        boot_time = int(psutil.boot_time())
+    except Exception:
+        boot_time = 0
+    return f"{CACHE_VERSION}|{uname.node}|{uname.system}|{uname.release}|{boot_time}"
+
+class SnapshotCache:
+    def __init__(self, path=None):
+        self.path = path
+        self.enabled = True
+        self.facts = None
+        self.key = None
+        self.lock = threading.Lock()
+
+    def load(self):
+        self.key = get_invalidation_key()
+        self.facts = {}
+        if not self.path:
+            return
+        import json
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(stored, dict) and stored.get('key') == self.key:
+            self.facts = stored.get('facts') or {}
+
+    def save(self):
+        if not self.path:
+            return
+        import json
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'key': self.key, 'facts': self.facts}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # A read-only home or cache directory only costs persistence;
+            # the in-memory copy keeps working.
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def get(self, name, ttl, loader):
+        if not self.enabled:
+            return loader()
+        now = time.time()
+        with self.lock:
+            if self.facts is None:
+                self.load()
+            entry = self.facts.get(name)
+            if entry and 0 <= now - entry['time'] < ttl:
+                return entry['value']
+
+        value = loader()
+
+        with self.lock:
+            self.facts[name] = {'time': now, 'value': value}
+            self.save()
+        return value
+
+    # The last stored value whatever its age, for serving while a fresh
+    # probe is failing.
+    def last(self, name):
+        with self.lock:
+            if self.facts is None:
+                self.load()
+            entry = self.facts.get(name)
+            return entry['value'] if entry else None
+
+    def invalidate(self, name=None):
+        with self.lock:
+            if self.facts is None:
+                return
+            if name is None:
+                self.facts.clear()
+            else:
+                self.facts.pop(name, None)
+            self.save()
+
+SNAPSHOT_CACHE = SnapshotCache(os.path.join(user_cache_dir(), 'snapshot.json'))
+
+def static_fact(name, ttl):
+    def decorate(func):
+        @functools.wraps(func)
+        def cached():
+            return SNAPSHOT_CACHE.get(name, ttl, func)
+        return cached
+    return decorate
@@ -0,0 +1,312 @@
+import sys
+import argparse
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="info.py",
+        description="zInfo headless mode: print the system report without opening the GUI."
+    )
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument('--json', action='store_true', help="print the report as JSON")
+    output.add_argument('--text', action='store_true', help="print the report as plain text")
+    parser.add_argument(
+        '--sections',
+        help="comma-separated section keys to collect (default: all), e.g. os,memory"
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help="re-probe static facts (devices, license, ...) instead of using the snapshot cache"
+    )
+    parser.add_argument(
+        '--trace', metavar='PATH',
+        help="write per-collector timings to PATH as Chrome trace-event JSON"
+    )
+    parser.add_argument(
+        '--log-timings', action='store_true',
+        help="log one structured JSON line with per-collector timings to stderr"
+    )
+    return parser
+
+def render_json(sections):
+    import json
+
+    # JSON carries the raw values; only the text report is translated.
+    report = {key: record.as_dict() for key, record in sections.items()}
+    return json.dumps(report, ensure_ascii=False, indent=2)
+
+def render_text(sections, t):
+    from zinfo.render import render_section
+
+    blocks = [f"{t[key]}\n{render_section(key, record, t)}" for key, record in sections.items()]
+    return "\n\n".join(blocks)
+
+def parse_time(value, now=None):
+    # Accepts epoch seconds, an ISO 8601 date/time, or an age such as 90s,
+    # 15m, 1h or 2d counted back from now.
+    import time
+    from datetime import datetime
+
+    units = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+    now = time.time() if now is None else now
+    if value[-1:] in units:
+        try:
+            return now - float(value[:-1]) * units[value[-1]]
+        except ValueError:
+            pass
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a time: {value!r} (use epoch seconds, ISO 8601 or an age like 1h)")
+
+def write_history(rows, fmt, out):
+    from zinfo.recorder import RECORD_FIELDS
+
+    # Rows are streamed straight from the memory-mapped log.
+    if fmt == 'csv':
+        import csv
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(RECORD_FIELDS)
+        writer.writerows(rows)
+        return
+    import json
+    import math
+    out.write("[")
+    separator = "\n"
+    for row in rows:
+        values = [None if isinstance(value, float) and math.isnan(value) else value for value in row]
+        out.write(separator + json.dumps(dict(zip(RECORD_FIELDS, values))))
+        separator = ",\n"
+    out.write("\n]\n")
+
+def history_main(argv):
+    from zinfo.recorder import default_log_path, query_log
+
+    parser = argparse.ArgumentParser(
+        prog="info.py history",
+        description="Export recorded snapshots from the history log."
+    )
+    parser.add_argument('--log', metavar='PATH', default=default_log_path(), help="history log (default: %(default)s)")
+    parser.add_argument('--since', type=parse_time, help="first timestamp: epoch, ISO 8601 or an age like 1h")
+    parser.add_argument('--until', type=parse_time, help="last timestamp: epoch, ISO 8601 or an age like 10m")
+    parser.add_argument('--format', choices=('csv', 'json'), default='csv', help="output format (default: %(default)s)")
+    parser.add_argument('--output', metavar='PATH', help="write to PATH instead of stdout")
+    args = parser.parse_args(argv)
+
+    rows = query_log(args.log, args.since, args.until)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8', newline='') as out:
+            write_history(rows, args.format, out)
+    else:
+        write_history(rows, args.format, sys.stdout)
+    return 0
+
+def record_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="info.py record",
+        description="Sample CPU, memory, disk and network headlessly and append them to the history log."
+    )
+    parser.add_argument('--log', metavar='PATH', help="history log (default: in the user cache directory)")
+    parser.add_argument('--interval', type=float, default=1.0, help="seconds between samples (default: %(default)s)")
+    parser.add_argument('--count', type=int, help="stop after this many samples (default: run until interrupted)")
+    args = parser.parse_args(argv)
+
+    try:
+        from zinfo.collectors import collect_sections
+        from zinfo.recorder import RECORDED_SECTIONS, SnapshotLog, default_log_path, snapshot_values
+    except ImportError as e:
+        print(f"zInfo: {e}. Install it with: pip install {e.name}", file=sys.stderr)
+        return 2
+
+    import time
+
+    log = SnapshotLog(args.log or default_log_path())
+    taken = 0
+    next_at = time.monotonic()
+    try:
+        while args.count is None or taken < args.count:
+            log.append(snapshot_values(collect_sections(keys=RECORDED_SECTIONS)))
+            taken += 1
+            next_at += args.interval
+            time.sleep(max(next_at - time.monotonic(), 0.0))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        log.close()
+    return 0
+
+def watch_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="info.py watch",
+        description="Sample the live sections and report threshold alerts as they fire and clear."
+    )
+    parser.add_argument('--rules', metavar='PATH', help="JSON list of alert rules (default: the built-in rules)")
+    parser.add_argument('--interval', type=float, default=1.0, help="seconds between samples (default: %(default)s)")
+    parser.add_argument('--count', type=int, help="stop after this many samples (default: run until interrupted)")
+    parser.add_argument('--log', action='store_true', help="emit alerts through logging on stderr instead of stdout")
+    args = parser.parse_args(argv)
+
+    try:
+        from zinfo.alerts import DEFAULT_RULES, AlertEngine, load_rules
+        from zinfo.collectors import collect_sections
+    except ImportError as e:
+        print(f"zInfo: {e}. Install it with: pip install {e.name}", file=sys.stderr)
+        return 2
+
+    import time
+    from datetime import datetime
+
+    try:
+        engine = AlertEngine(load_rules(args.rules) if args.rules else DEFAULT_RULES)
+    except (OSError, ValueError) as e:
+        print(f"zInfo: {e}", file=sys.stderr)
+        return 2
+
+    if args.log:
+        import logging
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s", stream=sys.stderr)
+        logger = logging.getLogger('zinfo.alerts')
+        def emit(event):
+            if event.fired:
+                logger.warning("alert: %s", event.describe())
+            else:
+                logger.info("cleared: %s", event.describe())
+    else:
+        def emit(event):
+            stamp = datetime.fromtimestamp(event.timestamp).isoformat(timespec='seconds')
+            print(f"{stamp} {'ALERT' if event.fired else 'CLEAR'} {event.describe()}", flush=True)
+
+    keys = set(engine.by_section)
+    taken = 0
+    next_at = time.monotonic()
+    try:
+        while args.count is None or taken < args.count:
+            for event in engine.evaluate_all(collect_sections(keys=keys)):
+                emit(event)
+            taken += 1
+            next_at += args.interval
+            time.sleep(max(next_at - time.monotonic(), 0.0))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+def parse_address(value):
+    host, _, port = value.rpartition(':')
+    try:
+        return host or '127.0.0.1', int(port)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not an address: {value!r} (use HOST:PORT or PORT)")
+
+def agent_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="info.py agent",
+        description="Serve the system report as JSON over HTTP (GET /snapshot, with ETag and ?since= deltas)."
+    )
+    parser.add_argument('--host', default='127.0.0.1', help="address to listen on (default: %(default)s)")
+    parser.add_argument('--port', type=int, default=8765, help="port to listen on (default: %(default)s)")
+    parser.add_argument('--interval', type=float, default=1.0, help="seconds between samples of the volatile sections (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    try:
+        from zinfo.agent import Agent
+    except ImportError as e:
+        print(f"zInfo: {e}. Install it with: pip install {e.name}", file=sys.stderr)
+        return 2
+
+    import asyncio
+
+    def on_ready(server):
+        for sock in server.sockets:
+            host, port = sock.getsockname()[:2]
+            print(f"zInfo agent listening on http://{host}:{port}/snapshot", file=sys.stderr)
+
+    try:
+        asyncio.run(Agent(args.interval).serve(args.host, args.port, on_ready))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+def aggregate_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="info.py aggregate",
+        description="Poll several zInfo agents concurrently and print what changed."
+    )
+    parser.add_argument('agents', nargs='+', type=parse_address, metavar='HOST:PORT', help="agents to poll")
+    parser.add_argument('--interval', type=float, default=1.0, help="seconds between polling rounds (default: %(default)s)")
+    parser.add_argument('--count', type=int, help="stop after this many rounds (default: run until interrupted)")
+    args = parser.parse_args(argv)
+
+    import json
+    import asyncio
+    from zinfo.agent import aggregate
+
+    # One JSON line per agent and round: the merged snapshot when it
+    # changed, or the error when the agent could not be reached.
+    def on_round(clients, changed):
+        for client in clients:
+            if client.error:
+                line = {'agent': client.name, 'error': client.error}
+            elif client in changed:
+                line = {'agent': client.name, 'version': client.token, 'sections': client.sections}
+            else:
+                continue
+            print(json.dumps(line, ensure_ascii=False), flush=True)
+
+    try:
+        asyncio.run(aggregate(args.agents, args.interval, args.count, on_round))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+SUBCOMMANDS = {'history': history_main, 'record': record_main, 'agent': agent_main, 'aggregate': aggregate_main, 'watch': watch_main}
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in SUBCOMMANDS:
+        return SUBCOMMANDS[argv[0]](argv[1:])
+    args = build_parser().parse_args(argv)
+
+    # Headless mode never installs anything: a missing dependency is
+    # reported and left to the operator.
+    try:
+        from zinfo.collectors import SECTION_COLLECTORS, collect_sections, get_translations
+    except ImportError as e:
+        print(f"zInfo: {e}. Install it with: pip install {e.name}", file=sys.stderr)
+        return 2
+
+    known = [key for key, _ in SECTION_COLLECTORS]
+    keys = None
+    if args.sections:
+        keys = [key.strip() for key in args.sections.split(',') if key.strip()]
+        unknown = [key for key in keys if key not in known]
+        if unknown:
+            print(f"zInfo: unknown sections: {', '.join(unknown)} (available: {', '.join(known)})", file=sys.stderr)
+            return 2
+
+    if args.no_cache:
+        from zinfo.cache import SNAPSHOT_CACHE
+        SNAPSHOT_CACHE.enabled = False
+
+    if args.trace or args.log_timings:
+        from zinfo.profiling import TRACER
+        TRACER.enabled = True
+
+    t = get_translations()
+    results = collect_sections(keys=keys)
+    sections = {key: results[key] for key in known if key in results}
+
+    if args.json:
+        print(render_json(sections))
+    else:
+        print(render_text(sections, t))
+
+    if args.trace:
+        TRACER.export_chrome_trace(args.trace)
+    if args.log_timings:
+        import logging
+        logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stderr)
+        TRACER.log_refresh()
+    return 0
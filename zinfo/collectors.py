@@ -0,0 +1,287 @@
+import queue
+import platform
+import threading
+
+import psutil
+
+from zinfo.cache import SNAPSHOT_CACHE, static_fact
+from zinfo.diskio import sample_disk_io
+from zinfo.history import record_metric
+from zinfo.i18n import get_translations
+from zinfo.meminfo import PRESSURE_RESOURCES, sample_memory_pressure
+from zinfo.model import (
+    CpuInfo, Device, DeviceInfo, DiskIo, DiskIoInfo, LicenseInfo, MemoryInfo, MemoryPressureInfo, MountUsage,
+    NetInterface, NetworkInfo, OsInfo, Pressure, ProcessInfo, ProcessRow, SectionError, Sensor, SensorInfo,
+    StorageInfo
+)
+from zinfo.network import sample_network
+from zinfo.pci import classify_pci_device, describe_pci_device, read_pci_devices, sysfs_pci_available
+from zinfo.processes import sample_processes
+from zinfo.profiling import TRACER
+from zinfo.render import render_section
+from zinfo.sampler import get_cpu_sample
+from zinfo.sensors import sample_sensors
+from zinfo.storage import classify_partitions, probe_mounts
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+# Hard deadlines for probes that run in the isolated worker processes. The
+# wmic queries take two subprocess timeouts of 5 s each. zinfo.isolation
+# and zinfo.probes (pickle, subprocess plumbing) are imported only on the
+# paths that probe, so a headless run on Linux never loads them.
+LSPCI_DEADLINE = 3.0
+WMI_DEADLINE = 15.0
+LICENSE_DEADLINE = 12.0
+
+def get_windows_license():
+    from zinfo.isolation import run_probe
+    from zinfo.probes import query_windows_license
+    with TRACER.span('license.wmic'):
+        return run_probe(query_windows_license, deadline=LICENSE_DEADLINE)
+
+SECTION_COLLECTORS = []
+VOLATILE_SECTIONS = set()
+
+def section_collector(key, volatile=False):
+    def register(func):
+        SECTION_COLLECTORS.append((key, func))
+        if volatile:
+            VOLATILE_SECTIONS.add(key)
+        return func
+    return register
+
+@static_fact('os', ttl=DAY)
+def read_os_facts():
+    uname = platform.uname()
+    edition = None
+    if uname.system == "Windows":
+        try:
+            edition = platform.win32_edition()
+        except:
+            pass
+    return {
+        'system': uname.system,
+        'release': uname.release,
+        'edition': edition,
+        'version': uname.version,
+        'machine': uname.machine,
+        'node': uname.node
+    }
+
+@static_fact('cpu', ttl=DAY)
+def read_cpu_facts():
+    max_mhz = None
+    try:
+        cpu_freq = psutil.cpu_freq()
+        if cpu_freq:
+            max_mhz = cpu_freq.max
+    except Exception:
+        pass
+    return {
+        'processor': platform.uname().processor,
+        'physical_cores': psutil.cpu_count(logical=False),
+        'logical_cores': psutil.cpu_count(logical=True),
+        'max_mhz': max_mhz
+    }
+
+@section_collector('os')
+def collect_os_info():
+    return OsInfo(**read_os_facts())
+
+@section_collector('cpu', volatile=True)
+def collect_cpu_info():
+    facts = read_cpu_facts()
+    sample = get_cpu_sample()
+    freqs = [(freq.current, freq.min, freq.max) for freq in sample.freqs]
+    return CpuInfo(
+        processor=facts['processor'],
+        physical_cores=facts['physical_cores'],
+        logical_cores=facts['logical_cores'],
+        max_mhz=facts['max_mhz'],
+        usage=sample.total,
+        since_boot=sample.since_boot,
+        per_core=sample.per_core,
+        freqs=freqs if len(freqs) == len(sample.per_core) else []
+    )
+
+@section_collector('memory', volatile=True)
+def collect_memory_info():
+    memory = psutil.virtual_memory()
+    record_metric('memory.percent', memory.percent)
+    return MemoryInfo(memory.total, memory.available, memory.used, memory.percent)
+
+@section_collector('memory_pressure', volatile=True)
+def collect_memory_pressure_info():
+    source, meminfo, pressure, cgroup = sample_memory_pressure()
+    stalls = []
+    for resource in PRESSURE_RESOURCES:
+        if resource in pressure:
+            some, full = pressure[resource]
+            stalls.append(Pressure(resource, *(some or (None, None, None)), *(full or (None, None, None))))
+    cgroup_dir, current, limit = cgroup or (None, None, None)
+    return MemoryPressureInfo(source, *meminfo, stalls, cgroup_dir, current, limit)
+
+@section_collector('disks', volatile=True)
+def collect_disk_info():
+    partitions, pseudo_counts = classify_partitions(psutil.disk_partitions(all=True))
+    mounts = []
+    for probe in probe_mounts(partitions):
+        p = probe.partition
+        usage = probe.usage
+        mounts.append(MountUsage(
+            p.device, p.mountpoint, p.fstype, probe.status,
+            usage.total if usage else None,
+            usage.used if usage else None,
+            usage.percent if usage else None
+        ))
+    storage = StorageInfo(mounts, pseudo_counts)
+    used, total = storage.totals()
+    if total:
+        record_metric('disks.percent', 100.0 * used / total)
+    return storage
+
+@section_collector('disk_io', volatile=True)
+def collect_disk_io_info():
+    since_boot, source, entries = sample_disk_io()
+    devices = [DiskIo(name, *(rates or (None,) * 6)) for name, rates in entries]
+    return DiskIoInfo(since_boot, source, devices)
+
+@section_collector('processes', volatile=True)
+def collect_process_info():
+    total, since_start, top_cpu, top_rss, top_io = sample_processes()
+    def rows(entries):
+        return [
+            ProcessRow(pid, state.name, state.cpu_percent, state.rss, state.io_rate)
+            for pid, state in entries
+        ]
+    return ProcessInfo(total, since_start, rows(top_cpu), rows(top_rss), rows(top_io))
+
+@section_collector('interfaces', volatile=True)
+def collect_network_info():
+    since_boot, entries = sample_network()
+    interfaces = []
+    for name, rates, link_stats, (mac, addresses) in entries:
+        is_up, speed, mtu = link_stats or (None, None, None)
+        interfaces.append(NetInterface(name, is_up, speed, mtu, mac, addresses, *(rates or (None,) * 6)))
+    return NetworkInfo(since_boot, interfaces)
+
+@section_collector('sensors', volatile=True)
+def collect_sensor_info():
+    source, readings = sample_sensors()
+    return SensorInfo(source, [Sensor(*reading) for reading in readings])
+
+@static_fact('devices', ttl=HOUR)
+def read_device_facts():
+    system = platform.system()
+    facts = {'status': 'unavailable', 'graphics': [], 'audio': [], 'network': []}
+    if system == "Windows":
+        # WMI errors and timeouts propagate so that a failed enumeration is
+        # not cached.
+        from zinfo.isolation import run_probe
+        from zinfo.probes import read_wmi_devices
+        facts = run_probe(read_wmi_devices, deadline=WMI_DEADLINE)
+    elif sysfs_pci_available():
+        facts['status'] = 'sysfs'
+        for device in read_pci_devices():
+            category = classify_pci_device(device['class'])
+            if category:
+                facts[category].append({
+                    'name': describe_pci_device(device['vendor'], device['device']),
+                    'driver': device['driver']
+                })
+    else:
+        # A timeout propagates (nothing is cached); lspci missing or
+        # failing just leaves the lists empty.
+        from zinfo.isolation import ProbeTimeout, run_probe
+        from zinfo.probes import run_lspci
+        output = None
+        try:
+            output = run_probe(run_lspci, deadline=LSPCI_DEADLINE)
+        except ProbeTimeout:
+            raise
+        except Exception:
+            pass
+        if output is not None:
+            facts['status'] = 'lspci'
+            lines = output.split('\n')
+            gpu_lines = [l for l in lines if 'VGA' in l or 'Display' in l or '3D' in l]
+            facts['graphics'] = [{'name': gpu.split(': ')[-1]} for gpu in gpu_lines]
+            audio_lines = [l for l in lines if 'Audio' in l]
+            facts['audio'] = [{'name': audio.split(': ')[-1]} for audio in audio_lines]
+            net_lines = [l for l in lines if 'Network' in l or 'Ethernet' in l]
+            facts['network'] = [{'name': net.split(': ')[-1]} for net in net_lines]
+    return facts
+
+@section_collector('devices')
+def collect_device_info():
+    stale = False
+    try:
+        facts = read_device_facts()
+    except Exception as e:
+        # Only a probe can time out, so zinfo.isolation is loaded by then.
+        from zinfo.isolation import ProbeTimeout
+        if not isinstance(e, ProbeTimeout):
+            return DeviceInfo('wmi_error', str(e)[:50], [], [], [])
+        # The probe was killed at its deadline; show the last enumeration
+        # that succeeded, if there ever was one.
+        facts = SNAPSHOT_CACHE.last('devices')
+        if facts is None:
+            return DeviceInfo('wmi_error' if platform.system() == "Windows" else 'unavailable', str(e)[:50], [], [], [])
+        stale = True
+    return DeviceInfo(
+        facts['status'], None,
+        *([Device(**device) for device in facts[category]] for category in ('graphics', 'audio', 'network')),
+        stale=stale
+    )
+
+@static_fact('license', ttl=DAY)
+def read_license_facts():
+    return {'key': get_windows_license()}
+
+@section_collector('license')
+def collect_license_info():
+    if platform.system() == "Windows":
+        from zinfo.isolation import ProbeTimeout
+        try:
+            return LicenseInfo(True, read_license_facts()['key'])
+        except ProbeTimeout:
+            facts = SNAPSHOT_CACHE.last('license')
+            return LicenseInfo(True, facts['key'] if facts else 'Unable to retrieve', stale=facts is not None)
+    return LicenseInfo(False, None)
+
+def run_collector(key, func):
+    try:
+        with TRACER.span(f"collector.{key}"):
+            return func()
+    except Exception:
+        import traceback
+        return SectionError(traceback.format_exc())
+
+def collect_sections(on_section=None, keys=None):
+    # One daemon thread per section, reported as each finishes; threads
+    # are cheap next to a collector and keep concurrent.futures (and the
+    # logging it imports) off the headless start-up path.
+    done = queue.SimpleQueue()
+    selected = [(key, func) for key, func in SECTION_COLLECTORS if keys is None or key in keys]
+    for key, func in selected:
+        threading.Thread(
+            target=lambda key=key, func=func: done.put((key, run_collector(key, func))),
+            name=f"zinfo-collector-{key}", daemon=True
+        ).start()
+    results = {}
+    for _ in selected:
+        key, record = done.get()
+        results[key] = record
+        if on_section:
+            on_section(key, record)
+    return results
+
+def get_system_info(keys=None):
+    t = get_translations()
+    results = collect_sections(keys=keys)
+    return {
+        t[key]: render_section(key, results[key], t)
+        for key, _ in SECTION_COLLECTORS
+        if key in results
+    }
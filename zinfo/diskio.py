@@ -0,0 +1,189 @@
+import os
+import time
+import operator
+import threading
+
+import psutil
+
+from zinfo.procfs import ProcFile
+
+DISKSTATS_PATH = '/proc/diskstats'
+SYS_BLOCK_PATH = '/sys/block'
+SECTOR_SIZE = 512
+INITIAL_BUFFER = 64 * 1024
+
+# Field positions in a /proc/diskstats line: major, minor, name, then
+# reads, reads merged, sectors read, ms reading, writes, writes merged,
+# sectors written, ms writing, in flight, ms doing I/O, ...
+FIELDS = (3, 5, 6, 7, 9, 10, 12)
+FIELD_GETTER = operator.itemgetter(*FIELDS)
+
+class DiskStatsReader:
+    # Keeps /proc/diskstats open as a ProcFile and parses its buffer in
+    # place. Each line is checked against the bytes it had last time with
+    # bytearray.startswith, which allocates nothing: an unchanged line (an
+    # idle device) reuses its parsed values, and a line that is not a whole
+    # device only has its major, minor and name prefix checked. Only the
+    # lines of devices that did I/O are split and converted.
+    def __init__(self, path=DISKSTATS_PATH):
+        self.file = ProcFile(path, INITIAL_BUFFER)
+        self.names = {}
+        # Per line: [prefix up to and including the name, name or None for
+        # lines not reported, line bytes at the last parse, counters].
+        self.lines = []
+
+    def close(self):
+        self.file.close()
+
+    def device_name(self, raw):
+        name = self.names.get(raw, False)
+        if name is False:
+            # Partitions have no /sys/block entry; whole disks, NVMe
+            # namespaces, md and dm devices do.
+            name = raw.decode('ascii', 'replace')
+            if not os.path.exists(os.path.join(SYS_BLOCK_PATH, name)):
+                name = None
+            self.names[raw] = name
+        return name
+
+    def index(self, size):
+        buffer = self.file.buffer
+        self.lines = []
+        start = 0
+        while start < size:
+            end = buffer.find(b'\n', start, size)
+            if end < 0:
+                end = size
+            raw = bytes(buffer[start:end])
+            tokens = raw.split()
+            if len(tokens) > FIELDS[-1]:
+                name = self.device_name(tokens[2])
+                prefix = raw[:raw.index(tokens[2], len(tokens[0]) + len(tokens[1])) + len(tokens[2]) + 1]
+                counters = tuple(map(int, FIELD_GETTER(tokens))) if name is not None else None
+                self.lines.append([prefix, name, raw, counters])
+            start = end + 1
+
+    # Returns {name: (reads, sectors_read, read_ms, writes, sectors_written,
+    # write_ms, busy_ms)} for every whole block device.
+    def read(self):
+        size = self.file.fill()
+        buffer = self.file.buffer
+        lines = self.lines
+        counters = {}
+        start = 0
+        count = 0
+        while start < size:
+            end = buffer.find(b'\n', start, size)
+            if end < 0:
+                end = size
+            if count == len(lines):
+                break
+            line = lines[count]
+            if line[1] is not None and end - start == len(line[2]) and buffer.startswith(line[2], start):
+                counters[line[1]] = line[3]
+            elif buffer.startswith(line[0], start):
+                if line[1] is not None:
+                    raw = bytes(buffer[start:end])
+                    line[2] = raw
+                    line[3] = tuple(map(int, FIELD_GETTER(raw.split())))
+                    counters[line[1]] = line[3]
+            else:
+                break
+            count += 1
+            start = end + 1
+        if start < size or count != len(lines):
+            # A device came, went or was renumbered.
+            self.index(size)
+            return {line[1]: line[3] for line in self.lines if line[1] is not None}
+        return counters
+
+# psutil reports bytes where /proc/diskstats has 512-byte sectors; the
+# sampler scales by the source's unit.
+def read_psutil_counters():
+    counters = {}
+    for name, disk in (psutil.disk_io_counters(perdisk=True) or {}).items():
+        counters[name] = (
+            disk.read_count, disk.read_bytes, disk.read_time,
+            disk.write_count, disk.write_bytes, disk.write_time,
+            getattr(disk, 'busy_time', None)
+        )
+    return counters
+
+def io_rates(current, previous, elapsed, unit):
+    reads = current[0] - previous[0]
+    writes = current[3] - previous[3]
+    utilization = None
+    if current[6] is not None and previous[6] is not None:
+        utilization = min(100.0 * (current[6] - previous[6]) / (1000.0 * elapsed), 100.0)
+    return (
+        reads / elapsed,
+        writes / elapsed,
+        (current[1] - previous[1]) * unit / elapsed,
+        (current[4] - previous[4]) * unit / elapsed,
+        (current[2] - previous[2] + current[5] - previous[5]) / (reads + writes) if reads + writes else 0.0,
+        utilization
+    )
+
+class DiskIoSampler:
+    def __init__(self):
+        self.reader = None
+        self.source = None
+        self.unit = 1
+        self.previous = {}
+        self.read_at = None
+        self.lock = threading.Lock()
+
+    def open(self, path=DISKSTATS_PATH):
+        try:
+            self.reader = DiskStatsReader(path)
+            self.source = 'diskstats'
+            self.unit = SECTOR_SIZE
+        except (OSError, AttributeError):
+            # No procfs, or no os.preadv on this platform.
+            self.source = 'psutil'
+
+    def read_counters(self):
+        if self.source is None:
+            self.open()
+        if self.reader is not None:
+            try:
+                return self.reader.read()
+            except (OSError, ValueError):
+                self.reader.close()
+                self.reader = None
+                self.source = 'psutil'
+                self.unit = 1
+                self.previous = {}
+        return read_psutil_counters()
+
+    # Returns (since_boot, source, devices) where each device is
+    # (name, rates) with rates as produced by io_rates(); the first sample
+    # is averaged since boot.
+    def sample(self):
+        with self.lock:
+            now = time.time()
+            counters = self.read_counters()
+            since_boot = self.read_at is None
+            elapsed = now - (psutil.boot_time() if since_boot else self.read_at)
+            zero = (0, 0, 0, 0, 0, 0, 0)
+            devices = []
+            for name, current in counters.items():
+                # Devices that have never done any I/O (unused loop and
+                # ram devices) are left out.
+                if not current[0] and not current[3]:
+                    continue
+                previous = zero if since_boot else self.previous.get(name, current)
+                if current[0] < previous[0] or current[3] < previous[3]:
+                    # Counters went backwards: the device was recreated
+                    # under the same name.
+                    previous = current
+                rates = io_rates(current, previous, elapsed, self.unit) if elapsed > 0 else None
+                devices.append((name, rates))
+            self.previous = counters
+            self.read_at = now
+            return since_boot, self.source, devices
+
+DISK_IO_SAMPLER = DiskIoSampler()
+
+def sample_disk_io():
+    return DISK_IO_SAMPLER.sample()
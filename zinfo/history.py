@@ -0,0 +1,61 @@
+import threading
+from array import array
+
+HISTORY_CAPACITY = 300
+
+class MetricHistory:
+    __slots__ = ('capacity', 'values', 'head', 'count')
+
+    def __init__(self, capacity=HISTORY_CAPACITY):
+        self.capacity = capacity
+        self.values = array('f', bytes(4 * capacity))
+        self.head = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, value):
+        self.values[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def latest(self):
+        if not self.count:
+            return None
+        return self.values[self.head - 1]
+
+    def copy_into(self, out):
+        # Copies the samples oldest-first into the caller's array with two
+        # slice assignments, so no per-sample Python objects are created.
+        n = self.count
+        start = (self.head - n) % self.capacity
+        if start + n <= self.capacity:
+            out[0:n] = self.values[start:start + n]
+        else:
+            first = self.capacity - start
+            out[0:first] = self.values[start:]
+            out[first:n] = self.values[:self.head]
+        return n
+
+class MetricStore:
+    def __init__(self, capacity=HISTORY_CAPACITY):
+        self.capacity = capacity
+        self.metrics = {}
+        self.lock = threading.Lock()
+
+    def get(self, name):
+        history = self.metrics.get(name)
+        if history is None:
+            with self.lock:
+                history = self.metrics.setdefault(name, MetricHistory(self.capacity))
+        return history
+
+    def record(self, name, value):
+        self.get(name).append(value)
+
+METRIC_HISTORY = MetricStore()
+
+def record_metric(name, value):
+    METRIC_HISTORY.record(name, value)
@@ -0,0 +1,233 @@
+import functools
+
+@functools.lru_cache(maxsize=1)
+def get_system_language():
+    try:
+        import locale
+        try:
+            sys_lang = locale.getlocale()[0]
+        except:
+            sys_lang = None
+        
+        if not sys_lang:
+            try:
+                sys_lang = locale.getdefaultlocale()[0]
+            except:
+                sys_lang = None
+        
+        if sys_lang:
+            if sys_lang.startswith('it'):
+                return 'it'
+            elif sys_lang.startswith('en'):
+                return 'en'
+            elif sys_lang.startswith('es'):
+                return 'es'
+            elif sys_lang.startswith('fr'):
+                return 'fr'
+            elif sys_lang.startswith('de'):
+                return 'de'
+        return 'en'
+    except:
+        return 'en'
+
+TRANSLATIONS = {
+    'it': {
+        'title': 'zInfo Pro',
+        'analyzing': 'Analisi del sistema in corso...',
+        'light_mode': 'Modalità Chiara',
+        'dark_mode': 'Modalità Scura',
+        'changing_in': 'Cambio in {}s',
+        'footer': '✨ zInfo Pro | v2.0.0 | Multi-Platform System Tool ✨',
+        'os': 'SISTEMA OPERATIVO',
+        'cpu': 'PROCESSORE',
+        'memory': 'MEMORIA RAM',
+        'disks': 'ARCHIVIAZIONE',
+        'devices': 'PERIFERICHE E DRIVER',
+        'license': 'LICENZA WINDOWS',
+        'os_label': 'Sistema',
+        'edition': 'Edizione',
+        'version': 'Versione',
+        'architecture': 'Architettura',
+        'computer_name': 'Nome Computer',
+        'processor': 'Processore',
+        'physical_cores': 'Core Fisici',
+        'logical_cores': 'Thread Logici',
+        'max_frequency': 'Frequenza Max',
+        'frequency_unavailable': 'Frequenza: Non disponibile',
+        'usage': 'Utilizzo',
+        'since_boot': "media dall'avvio",
+        'per_core': 'Per Core',
+        'core': 'Core',
+        'total': 'Totale',
+        'available': 'Disponibile',
+        'in_use': 'In Uso',
+        'drive': 'Unità',
+        'space': 'Spazio',
+        'info_unavailable': 'Informazioni non disponibili',
+        'timed_out': 'Tempo scaduto (mount non risponde)',
+        'mounts': 'Punti di Montaggio',
+        'more_mounts': 'altri',
+        'pseudo_filesystems': 'File System Virtuali',
+        'graphics': '  ▸ Schede Grafiche:',
+        'driver': '     ├─ Driver',
+        'audio': '\n  ▸ Dispositivi Audio:',
+        'network': '\n  ▸ Schede di Rete:',
+        'ip': '     ├─ IP',
+        'wmi_error': '  Errore WMI: {}',
+        'wmi_not_installed': '  WMI non disponibile',
+        'drivers_windows_only': '  Info driver disponibili solo su Windows',
+        'license_key': 'Chiave Prodotto',
+        'license_status': 'Stato Licenza',
+        'license_error': 'Impossibile recuperare la licenza',
+        'license_linux': 'Sistema Linux - Licenza non applicabile',
+        'fatal_error': 'ERRORE CRITICO',
+        'refresh': 'Aggiorna Dati',
+        'refreshing': 'Aggiornamento...',
+        'live': 'Tempo Reale',
+        'processes': 'PROCESSI',
+        'process_count': 'Processi Totali',
+        'since_start': 'media sulla vita del processo',
+        'top_cpu': 'Per CPU',
+        'top_memory': 'Per Memoria (RSS)',
+        'top_io': 'Per I/O',
+        'no_processes': 'Nessun dato',
+        'interfaces': 'RETE',
+        'interface_count': 'Interfacce',
+        'link_up': 'attiva',
+        'link_down': 'inattiva',
+        'packets': 'pacchetti/s',
+        'errors': 'errori',
+        'drops': 'scartati',
+        'more_interfaces': 'altre interfacce',
+        'disk_io': 'ATTIVITÀ DISCHI',
+        'io_devices': 'Dispositivi',
+        'read': 'lettura',
+        'write': 'scrittura',
+        'latency': 'latenza',
+        'busy': 'occupato',
+        'more_disks': 'altri dispositivi',
+        'no_disk_io': 'Nessuna attività rilevata',
+        'sensors': 'SENSORI',
+        'no_sensors': 'Nessun sensore rilevato',
+        'high': 'alta',
+        'critical': 'critica',
+        'stale': 'ultimo valore noto, probe scaduto',
+        'more_alerts': 'altri avvisi',
+        'memory_pressure': 'MEMORIA E PRESSIONE',
+        'page_cache': 'Cache',
+        'buffers': 'Buffer',
+        'shared': 'Condivisa',
+        'dirty': 'Da scrivere',
+        'writeback': 'In scrittura',
+        'reclaimable': 'recuperabile',
+        'swap_cached': 'in cache',
+        'no_swap': 'non configurato',
+        'committed': 'Impegnata',
+        'commit_limit': 'limite',
+        'pressure': 'Pressione (PSI)',
+        'pressure_unavailable': 'Pressione (PSI): non disponibile',
+        'unlimited': 'senza limite'
+    },
+    'en': {
+        'title': 'zInfo Pro',
+        'analyzing': 'System analysis in progress...',
+        'light_mode': 'Light Mode',
+        'dark_mode': 'Dark Mode',
+        'changing_in': 'Changing in {}s',
+        'footer': '✨ zInfo Pro | v2.0.0 | Multi-Platform System Tool ✨',
+        'os': 'OPERATING SYSTEM',
+        'cpu': 'PROCESSOR',
+        'memory': 'RAM MEMORY',
+        'disks': 'STORAGE',
+        'devices': 'DEVICES AND DRIVERS',
+        'license': 'WINDOWS LICENSE',
+        'os_label': 'System',
+        'edition': 'Edition',
+        'version': 'Version',
+        'architecture': 'Architecture',
+        'computer_name': 'Computer Name',
+        'processor': 'Processor',
+        'physical_cores': 'Physical Cores',
+        'logical_cores': 'Logical Threads',
+        'max_frequency': 'Max Frequency',
+        'frequency_unavailable': 'Frequency: Not available',
+        'usage': 'Usage',
+        'since_boot': 'average since boot',
+        'per_core': 'Per Core',
+        'core': 'Core',
+        'total': 'Total',
+        'available': 'Available',
+        'in_use': 'In Use',
+        'drive': 'Drive',
+        'space': 'Space',
+        'info_unavailable': 'Information not available',
+        'timed_out': 'Timed out (mount not responding)',
+        'mounts': 'Mounts',
+        'more_mounts': 'more',
+        'pseudo_filesystems': 'Virtual Filesystems',
+        'graphics': '  ▸ Graphics Cards:',
+        'driver': '     ├─ Driver',
+        'audio': '\n  ▸ Audio Devices:',
+        'network': '\n  ▸ Network Adapters:',
+        'ip': '     ├─ IP',
+        'wmi_error': '  WMI Error: {}',
+        'wmi_not_installed': '  WMI not available',
+        'drivers_windows_only': '  Driver info available only on Windows',
+        'license_key': 'Product Key',
+        'license_status': 'License Status',
+        'license_error': 'Unable to retrieve license',
+        'license_linux': 'Linux System - License not applicable',
+        'fatal_error': 'CRITICAL ERROR',
+        'refresh': 'Refresh Data',
+        'refreshing': 'Refreshing...',
+        'live': 'Live',
+        'processes': 'PROCESSES',
+        'process_count': 'Total Processes',
+        'since_start': 'averaged over process lifetime',
+        'top_cpu': 'By CPU',
+        'top_memory': 'By Memory (RSS)',
+        'top_io': 'By I/O',
+        'no_processes': 'No data',
+        'interfaces': 'NETWORK',
+        'interface_count': 'Interfaces',
+        'link_up': 'up',
+        'link_down': 'down',
+        'packets': 'pkt/s',
+        'errors': 'errors',
+        'drops': 'drops',
+        'more_interfaces': 'more interfaces',
+        'disk_io': 'DISK ACTIVITY',
+        'io_devices': 'Devices',
+        'read': 'read',
+        'write': 'write',
+        'latency': 'latency',
+        'busy': 'busy',
+        'more_disks': 'more devices',
+        'no_disk_io': 'No activity recorded',
+        'sensors': 'SENSORS',
+        'no_sensors': 'No sensors found',
+        'high': 'high',
+        'critical': 'crit',
+        'stale': 'last known value, probe timed out',
+        'more_alerts': 'more alerts',
+        'memory_pressure': 'MEMORY & PRESSURE',
+        'page_cache': 'Page cache',
+        'buffers': 'Buffers',
+        'shared': 'Shared',
+        'dirty': 'Dirty',
+        'writeback': 'Writeback',
+        'reclaimable': 'reclaimable',
+        'swap_cached': 'cached',
+        'no_swap': 'not configured',
+        'committed': 'Committed',
+        'commit_limit': 'limit',
+        'pressure': 'Pressure (PSI)',
+        'pressure_unavailable': 'Pressure (PSI): not available',
+        'unlimited': 'no limit'
+    }
+}
+
+# Language detection runs once per process; every formatter shares the
+# same translation table.
+def get_translations(lang=None):
+    return TRANSLATIONS.get(lang or get_system_language(), TRANSLATIONS['en'])
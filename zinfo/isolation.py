@@ -0,0 +1,162 @@
+import os
+import sys
+import queue
+import pickle
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+PROBE_PROCESSES = 4
+PROBE_DEADLINE = 5.0
+
+class ProbeTimeout(Exception):
+    pass
+
+class ProbeFailed(Exception):
+    pass
+
+class WorkerProcess:
+    # One `python -m zinfo.isolation` child fed pickled (func, args) calls
+    # over its stdin; a reader thread turns its stdout back into a queue so
+    # the caller can wait with a timeout on every platform.
+    def __init__(self):
+        flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+        self.process = subprocess.Popen(
+            [sys.executable, '-m', 'zinfo.isolation'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            creationflags=flags
+        )
+        self.killed = False
+        self.replies = queue.Queue()
+        self.reader = threading.Thread(target=self.read_replies, name="zinfo-probe-reader", daemon=True)
+        self.reader.start()
+
+    def read_replies(self):
+        # Only this thread touches stdout: kill() ends the process and the
+        # read finishes on EOF rather than on a stream closed under it.
+        stdout = self.process.stdout
+        try:
+            while True:
+                self.replies.put(pickle.load(stdout))
+        except (EOFError, OSError, ValueError, pickle.UnpicklingError):
+            self.replies.put(None)
+        finally:
+            stdout.close()
+
+    def call(self, func, args, deadline):
+        try:
+            pickle.dump((func, args), self.process.stdin, protocol=pickle.HIGHEST_PROTOCOL)
+            self.process.stdin.flush()
+        except (OSError, ValueError):
+            raise ProbeFailed("probe worker exited")
+        try:
+            reply = self.replies.get(timeout=deadline)
+        except queue.Empty:
+            self.kill()
+            raise ProbeTimeout(f"{getattr(func, '__name__', func)} exceeded {deadline:.1f} s")
+        if reply is None:
+            raise ProbeFailed("probe worker exited")
+        ok, value = reply
+        if ok is None:
+            self.killed = True
+        if not ok:
+            raise ProbeFailed(value)
+        return value
+
+    def alive(self):
+        return not self.killed and self.process.poll() is None
+
+    def kill(self):
+        # A process stuck in uninterruptible I/O (a dead NFS server) only
+        # dies once the kernel lets go; it is not waited for.
+        self.killed = True
+        try:
+            self.process.kill()
+        except OSError:
+            pass
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+
+class ProbePool:
+    # A few long-lived worker processes for calls that can hang: each call
+    # gets a hard deadline, and a worker that misses it is killed and
+    # replaced on next use. Functions and results must be picklable, so
+    # probes live in light modules such as zinfo.probes.
+    def __init__(self, processes=PROBE_PROCESSES):
+        self.processes = processes
+        # Frozen builds have no interpreter to start workers with; probes
+        # then run in-process and the deadline is best effort.
+        self.isolated = not getattr(sys, 'frozen', False) and bool(sys.executable)
+        self.executor = None
+        self.local = threading.local()
+        self.workers = []
+        self.lock = threading.Lock()
+
+    def get_executor(self):
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.processes, thread_name_prefix="zinfo-probe")
+            return self.executor
+
+    def worker(self):
+        worker = getattr(self.local, 'worker', None)
+        if worker is None or not worker.alive():
+            worker = WorkerProcess()
+            self.local.worker = worker
+            with self.lock:
+                self.workers = [w for w in self.workers if w.alive()] + [worker]
+        return worker
+
+    def call(self, func, args, deadline):
+        if not self.isolated:
+            return func(*args)
+        return self.worker().call(func, args, deadline)
+
+    def submit(self, func, *args, deadline=PROBE_DEADLINE):
+        return self.get_executor().submit(self.call, func, args, deadline)
+
+    def run(self, func, *args, deadline=PROBE_DEADLINE):
+        return self.submit(func, *args, deadline=deadline).result()
+
+    def shutdown(self):
+        with self.lock:
+            workers, self.workers = self.workers, []
+        for worker in workers:
+            worker.kill()
+
+PROBE_POOL = ProbePool()
+
+def run_probe(func, *args, deadline=PROBE_DEADLINE):
+    return PROBE_POOL.run(func, *args, deadline=deadline)
+
+def worker_main():
+    # The protocol owns the real stdout; anything a probe prints goes to
+    # stderr instead.
+    stdin = sys.stdin.buffer
+    stdout = os.fdopen(os.dup(sys.stdout.fileno()), 'wb')
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+    while True:
+        try:
+            func, args = pickle.load(stdin)
+        except EOFError:
+            return
+        except Exception as e:
+            # A function this interpreter cannot import. The rest of the
+            # stream may be out of step, so the worker answers that it is
+            # exiting (ok is None) and the pool starts a new one.
+            stdout.write(pickle.dumps((None, f"{type(e).__name__}: {e}"), protocol=pickle.HIGHEST_PROTOCOL))
+            stdout.flush()
+            return
+        try:
+            data = pickle.dumps((True, func(*args)), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            data = pickle.dumps((False, f"{type(e).__name__}: {e}"), protocol=pickle.HIGHEST_PROTOCOL)
+        stdout.write(data)
+        stdout.flush()
+
+if __name__ == "__main__":
+    worker_main()
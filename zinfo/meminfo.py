@@ -0,0 +1,181 @@
+import os
+import operator
+import threading
+
+import psutil
+
+from zinfo.procfs import ProcFile
+
+MEMINFO_PATH = '/proc/meminfo'
+PRESSURE_PATH = '/proc/pressure'
+MOUNTINFO_PATH = '/proc/self/mountinfo'
+CGROUP_PATH = '/proc/self/cgroup'
+PRESSURE_RESOURCES = ('cpu', 'memory', 'io')
+READ_SIZE = 256
+
+# /proc/meminfo key -> multiplier to bytes; the HugePages_ counts have no
+# unit.
+MEMINFO_FIELDS = (
+    (b'Cached:', 1024), (b'Buffers:', 1024), (b'Dirty:', 1024), (b'Writeback:', 1024),
+    (b'Slab:', 1024), (b'SReclaimable:', 1024), (b'Shmem:', 1024),
+    (b'SwapTotal:', 1024), (b'SwapFree:', 1024), (b'SwapCached:', 1024),
+    (b'HugePages_Total:', 1), (b'HugePages_Free:', 1), (b'Hugepagesize:', 1024),
+    (b'Committed_AS:', 1024), (b'CommitLimit:', 1024),
+)
+
+class MemInfoReader:
+    # /proc/meminfo is split once per read; which token holds each wanted
+    # value is worked out again only when the key tokens are not where
+    # they were, which does not happen while the kernel stays the same.
+    def __init__(self, path=MEMINFO_PATH):
+        self.file = ProcFile(path)
+        self.keys = tuple(key for key, _ in MEMINFO_FIELDS)
+        self.scales = tuple(scale for _, scale in MEMINFO_FIELDS)
+        self.key_getter = None
+        self.value_getter = None
+        self.expected = None
+
+    def close(self):
+        self.file.close()
+
+    def index(self, tokens):
+        # A key this kernel does not have (no swap accounting, no hugetlbfs)
+        # points at the empty sentinel token at the end and reads as None.
+        missing = len(tokens) - 1
+        positions = {token: idx for idx, token in enumerate(tokens) if token.endswith(b':')}
+        self.key_getter = operator.itemgetter(*(positions.get(key, missing) for key in self.keys))
+        self.value_getter = operator.itemgetter(*(
+            positions[key] + 1 if key in positions else missing for key in self.keys
+        ))
+        self.expected = tuple(key if key in positions else b'' for key in self.keys)
+
+    # Returns the MEMINFO_FIELDS values in bytes (a count for the hugepage
+    # totals), in order, None where missing.
+    def read(self):
+        tokens = self.file.read().split()
+        tokens.append(b'')
+        if self.key_getter is None or self.key_getter(tokens) != self.expected:
+            self.index(tokens)
+        return tuple(
+            int(value) * scale if value else None
+            for value, scale in zip(self.value_getter(tokens), self.scales)
+        )
+
+def parse_pressure(data):
+    # "some avg10=0.12 avg60=0.05 avg300=0.01 total=123\nfull ..." ->
+    # ((some avg10, avg60, avg300), (full ...) or None). The cpu file has
+    # no full line on kernels before 5.13.
+    lines = {}
+    for line in data.split(b'\n'):
+        tokens = line.split()
+        if len(tokens) >= 4:
+            lines[tokens[0]] = tuple(float(token.partition(b'=')[2]) for token in tokens[1:4])
+    return lines.get(b'some'), lines.get(b'full')
+
+def find_cgroup2_dir(mountinfo_path=MOUNTINFO_PATH, cgroup_path=CGROUP_PATH):
+    # The unified hierarchy's mount point (which may be /sys/fs/cgroup or,
+    # on hybrid hosts, /sys/fs/cgroup/unified) joined with this process's
+    # cgroup from its "0::" line. Inside a container with a cgroup
+    # namespace that is the container's own cgroup.
+    mount = None
+    try:
+        with open(mountinfo_path, 'r') as f:
+            for line in f:
+                fields, _, rest = line.partition(' - ')
+                if rest.split(' ', 1)[0] == 'cgroup2':
+                    mount = fields.split(' ')[4]
+                    break
+        with open(cgroup_path, 'r') as f:
+            for line in f:
+                if line.startswith('0::'):
+                    relative = line[3:].strip()
+                    break
+            else:
+                return None
+    except OSError:
+        return None
+    if mount is None or '..' in relative.split('/'):
+        return None
+    return os.path.join(mount, relative.lstrip('/'))
+
+def read_limit(file):
+    value = file.read().strip()
+    return None if value == b'max' else int(value)
+
+class MemoryPressureSampler:
+    def __init__(self):
+        self.meminfo = None
+        self.pressure = {}
+        self.cgroup_current = None
+        self.cgroup_max = None
+        self.cgroup_dir = None
+        self.source = None
+        self.lock = threading.Lock()
+
+    def open(self, meminfo_path=MEMINFO_PATH, pressure_root=PRESSURE_PATH,
+             mountinfo_path=MOUNTINFO_PATH, cgroup_path=CGROUP_PATH):
+        try:
+            self.meminfo = MemInfoReader(meminfo_path)
+        except (OSError, AttributeError):
+            # No procfs, or no os.preadv on this platform.
+            self.source = 'psutil'
+            return
+        self.source = 'procfs'
+        for resource in PRESSURE_RESOURCES:
+            # PSI needs CONFIG_PSI (and psi=1 on some distributions).
+            try:
+                self.pressure[resource] = ProcFile(os.path.join(pressure_root, resource), READ_SIZE)
+            except OSError:
+                pass
+        # The root cgroup has no memory.current, so outside a container or
+        # service cgroup nothing is shown.
+        directory = find_cgroup2_dir(mountinfo_path, cgroup_path)
+        if directory is not None:
+            try:
+                self.cgroup_current = ProcFile(os.path.join(directory, 'memory.current'), READ_SIZE)
+                self.cgroup_max = ProcFile(os.path.join(directory, 'memory.max'), READ_SIZE)
+                self.cgroup_dir = directory
+            except OSError:
+                if self.cgroup_current is not None:
+                    self.cgroup_current.close()
+                self.cgroup_current = None
+
+    def read_psutil(self):
+        swap = psutil.swap_memory()
+        memory = psutil.virtual_memory()
+        fields = dict.fromkeys(key for key, _ in MEMINFO_FIELDS)
+        fields[b'Cached:'] = getattr(memory, 'cached', None)
+        fields[b'Buffers:'] = getattr(memory, 'buffers', None)
+        fields[b'Shmem:'] = getattr(memory, 'shared', None)
+        fields[b'SwapTotal:'] = swap.total
+        fields[b'SwapFree:'] = swap.free
+        return tuple(fields.values())
+
+    # Returns (source, meminfo, pressure, cgroup): meminfo as ordered in
+    # MEMINFO_FIELDS, pressure as {resource: (some, full)} and cgroup as
+    # (path, current, max) or None. max is None when unlimited.
+    def sample(self):
+        with self.lock:
+            if self.source is None:
+                self.open()
+            if self.meminfo is None:
+                return self.source, self.read_psutil(), {}, None
+            meminfo = self.meminfo.read()
+            pressure = {}
+            for resource, file in self.pressure.items():
+                try:
+                    pressure[resource] = parse_pressure(file.read())
+                except (OSError, ValueError):
+                    pass
+            cgroup = None
+            if self.cgroup_current is not None:
+                try:
+                    cgroup = (self.cgroup_dir, int(self.cgroup_current.read()), read_limit(self.cgroup_max))
+                except (OSError, ValueError):
+                    pass
+            return self.source, meminfo, pressure, cgroup
+
+MEMORY_PRESSURE_SAMPLER = MemoryPressureSampler()
+
+def sample_memory_pressure():
+    return MEMORY_PRESSURE_SAMPLER.sample()
@@ -0,0 +1,146 @@
+from array import array
+
+# Snapshot records keep raw values (bytes, percents, MHz, device lists);
+# turning them into text is left to zinfo.render. Records compare by value
+# so a new snapshot can be diffed against the previous one cheaply.
+class Record:
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs):
+        if len(args) > len(self.__slots__):
+            raise TypeError(f"{type(self).__name__} takes at most {len(self.__slots__)} values")
+        for name, value in zip(self.__slots__, args):
+            setattr(self, name, value)
+        for name in self.__slots__[len(args):]:
+            setattr(self, name, kwargs.pop(name, None))
+        if kwargs:
+            raise TypeError(f"{type(self).__name__} has no field(s) {', '.join(kwargs)}")
+
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def as_dict(self):
+        return {name: to_plain(getattr(self, name)) for name in self.__slots__}
+
+def to_plain(value):
+    if isinstance(value, Record):
+        return value.as_dict()
+    if isinstance(value, array):
+        return value.tolist()
+    if isinstance(value, (list, tuple)):
+        return [to_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: to_plain(item) for key, item in value.items()}
+    return value
+
+class OsInfo(Record):
+    __slots__ = ('system', 'release', 'edition', 'version', 'machine', 'node')
+
+class CpuInfo(Record):
+    # per_core is the sampler's float32 array; freqs holds one
+    # (current, min, max) MHz tuple per core when the platform reports them.
+    __slots__ = (
+        'processor', 'physical_cores', 'logical_cores', 'max_mhz',
+        'usage', 'since_boot', 'per_core', 'freqs'
+    )
+
+class MemoryInfo(Record):
+    __slots__ = ('total', 'available', 'used', 'percent')
+
+class Pressure(Record):
+    # PSI averages, in percent of wall time over 10 s, 60 s and 300 s; the
+    # full ones are None where the kernel only reports some (cpu before
+    # 5.13).
+    __slots__ = ('resource', 'some10', 'some60', 'some300', 'full10', 'full60', 'full300')
+
+class MemoryPressureInfo(Record):
+    # source is 'procfs' or 'psutil'. Sizes are bytes and None where the
+    # source does not have them; the hugepage totals are page counts.
+    # cgroup is the cgroup v2 directory when one with memory accounting
+    # applies, cgroup_max None when it is unlimited.
+    __slots__ = (
+        'source', 'cached', 'buffers', 'dirty', 'writeback', 'slab', 'slab_reclaimable', 'shared',
+        'swap_total', 'swap_free', 'swap_cached', 'hugepages_total', 'hugepages_free', 'hugepage_size',
+        'committed', 'commit_limit', 'pressure', 'cgroup', 'cgroup_current', 'cgroup_max'
+    )
+
+class MountUsage(Record):
+    # status is 'ok', 'stale' (the last good sizes, served because the probe
+    # timed out), 'timed_out' or 'unavailable'; sizes are None otherwise.
+    __slots__ = ('device', 'mountpoint', 'fstype', 'status', 'total', 'used', 'percent')
+
+class StorageInfo(Record):
+    __slots__ = ('mounts', 'pseudo_counts')
+
+    def totals(self):
+        used = sum(mount.used for mount in self.mounts if mount.used is not None)
+        total = sum(mount.total for mount in self.mounts if mount.total is not None)
+        return used, total
+
+class DiskIo(Record):
+    # Rates are per second and latency is the mean ms per completed I/O.
+    # utilization is None where the platform reports no busy time, and
+    # every rate is None if the device appeared between two samples.
+    __slots__ = (
+        'name', 'read_iops', 'write_iops', 'read_rate', 'write_rate',
+        'latency', 'utilization'
+    )
+
+class DiskIoInfo(Record):
+    # source is 'diskstats' or 'psutil'; since_boot marks the first sample,
+    # whose rates are averages since boot.
+    __slots__ = ('since_boot', 'source', 'devices')
+
+class Sensor(Record):
+    # kind is 'temperature' (°C), 'fan' (RPM) or 'power' (W); value is None
+    # while the driver cannot be read, high/critical when it has no limits.
+    __slots__ = ('chip', 'label', 'kind', 'value', 'high', 'critical')
+
+class SensorInfo(Record):
+    # source is 'sysfs' or 'psutil'.
+    __slots__ = ('source', 'sensors')
+
+class Device(Record):
+    __slots__ = ('name', 'driver', 'ip')
+
+class DeviceInfo(Record):
+    # status is 'wmi', 'sysfs', 'lspci', 'wmi_missing', 'wmi_error' or
+    # 'unavailable'; stale marks the last good enumeration served because
+    # the probe missed its deadline.
+    __slots__ = ('status', 'error', 'graphics', 'audio', 'network', 'stale')
+
+class LicenseInfo(Record):
+    __slots__ = ('applicable', 'key', 'stale')
+
+class ProcessRow(Record):
+    # io_rate is bytes/s, or None where the OS does not expose the
+    # process's I/O counters to us.
+    __slots__ = ('pid', 'name', 'cpu_percent', 'rss', 'io_rate')
+
+class ProcessInfo(Record):
+    # since_start marks the first sample, whose rates are averages over
+    # each process's lifetime.
+    __slots__ = ('total', 'since_start', 'top_cpu', 'top_rss', 'top_io')
+
+class NetInterface(Record):
+    # Rates are per second; they are None until the interface has been
+    # sampled twice. speed is in Mb/s and 0 when the driver does not say.
+    __slots__ = (
+        'name', 'is_up', 'speed', 'mtu', 'mac', 'addresses',
+        'rx_rate', 'tx_rate', 'rx_packets', 'tx_packets', 'error_rate', 'drop_rate'
+    )
+
+class NetworkInfo(Record):
+    # since_boot marks the first sample, whose rates are averages since boot.
+    __slots__ = ('since_boot', 'interfaces')
+
+class SectionError(Record):
+    __slots__ = ('message',)
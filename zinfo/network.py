@@ -0,0 +1,120 @@
+import time
+import socket
+import threading
+
+import psutil
+
+# Addresses and link state are re-read only when interfaces come or go, or
+# after this many seconds; net_if_addrs() walks every interface and on a
+# container host with hundreds of veth pairs costs far more than the
+# counters themselves.
+ADDRESS_REFRESH = 30.0
+
+class InterfaceState:
+    __slots__ = (
+        'bytes_sent', 'bytes_recv', 'packets_sent', 'packets_recv',
+        'errors', 'drops', 'rates'
+    )
+
+    def __init__(self, counters):
+        self.update(counters)
+        self.rates = None
+
+    def update(self, counters):
+        self.bytes_sent = counters.bytes_sent
+        self.bytes_recv = counters.bytes_recv
+        self.packets_sent = counters.packets_sent
+        self.packets_recv = counters.packets_recv
+        self.errors = counters.errin + counters.errout
+        self.drops = counters.dropin + counters.dropout
+
+def counter_rates(counters, state, elapsed):
+    # Counters that went backwards belong to an interface that was
+    # recreated under the same name; its rate restarts at zero.
+    def rate(current, previous):
+        return max(current - previous, 0) / elapsed
+    return (
+        rate(counters.bytes_recv, state.bytes_recv),
+        rate(counters.bytes_sent, state.bytes_sent),
+        rate(counters.packets_recv, state.packets_recv),
+        rate(counters.packets_sent, state.packets_sent),
+        rate(counters.errin + counters.errout, state.errors),
+        rate(counters.dropin + counters.dropout, state.drops)
+    )
+
+def read_addresses():
+    link_family = getattr(psutil, 'AF_LINK', None)
+    addresses = {}
+    for name, entries in psutil.net_if_addrs().items():
+        mac = None
+        ips = []
+        for entry in entries:
+            if entry.family == link_family:
+                mac = entry.address
+            elif entry.family in (socket.AF_INET, socket.AF_INET6):
+                ips.append(entry.address.split('%', 1)[0])
+        addresses[name] = (mac, ips)
+    return addresses
+
+def read_link_stats():
+    return {
+        name: (stats.isup, stats.speed, stats.mtu)
+        for name, stats in psutil.net_if_stats().items()
+    }
+
+class NetworkSampler:
+    def __init__(self, address_refresh=ADDRESS_REFRESH):
+        self.address_refresh = address_refresh
+        self.states = {}
+        self.read_at = None
+        self.addresses = {}
+        self.link_stats = {}
+        self.addresses_read_at = None
+        self.lock = threading.Lock()
+
+    def refresh_addresses(self, names, now):
+        stale = self.addresses_read_at is None or now - self.addresses_read_at > self.address_refresh
+        if stale or names != self.states.keys():
+            self.addresses = read_addresses()
+            self.link_stats = read_link_stats()
+            self.addresses_read_at = now
+
+    # Returns (since_boot, interfaces) where each interface is
+    # (name, rates, link_stats, addresses); rates are per second over the
+    # time since the previous sample, or since boot on the first one.
+    def sample(self):
+        with self.lock:
+            now = time.time()
+            counters = psutil.net_io_counters(pernic=True)
+            self.refresh_addresses(counters.keys(), now)
+
+            since_boot = self.read_at is None
+            elapsed = now - (psutil.boot_time() if since_boot else self.read_at)
+            states = {}
+            for name, nic in counters.items():
+                state = self.states.get(name)
+                if state is None:
+                    state = InterfaceState(nic)
+                    if since_boot and elapsed > 0:
+                        state.rates = tuple(value / elapsed for value in (
+                            nic.bytes_recv, nic.bytes_sent, nic.packets_recv, nic.packets_sent,
+                            nic.errin + nic.errout, nic.dropin + nic.dropout
+                        ))
+                else:
+                    if elapsed > 0:
+                        state.rates = counter_rates(nic, state, elapsed)
+                    state.update(nic)
+                states[name] = state
+            self.states = states
+            self.read_at = now
+
+            interfaces = [
+                (name, state.rates, self.link_stats.get(name), self.addresses.get(name, (None, [])))
+                for name, state in states.items()
+            ]
+            return since_boot, interfaces
+
+NETWORK_SAMPLER = NetworkSampler()
+
+def sample_network():
+    return NETWORK_SAMPLER.sample()
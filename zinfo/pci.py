@@ -0,0 +1,148 @@
+import os
+import re
+import threading
+
+SYSFS_PCI_DEVICES = '/sys/bus/pci/devices'
+
+PCI_IDS_PATHS = (
+    '/usr/share/hwdata/pci.ids',
+    '/usr/share/misc/pci.ids',
+    '/usr/share/pci.ids',
+    '/usr/local/share/pci.ids',
+    '/usr/local/share/hwdata/pci.ids',
+)
+
+PCI_CLASS_DISPLAY = 0x03
+PCI_CLASS_MULTIMEDIA = 0x04
+PCI_CLASS_NETWORK = 0x02
+PCI_SUBCLASS_AUDIO = (0x01, 0x03)
+
+VENDOR_LINE = re.compile(rb'^([0-9a-f]{4})  ([^\n]*)$', re.M)
+DEVICE_LINE = re.compile(rb'^\t([0-9a-f]{4})  ([^\n]*)$', re.M)
+
+# Name lookups against a memory-mapped pci.ids file. The vendor index is
+# built on first use with one regex pass over the map; a vendor's device
+# table is indexed the first time one of its devices is looked up. Names
+# stay in the map as offsets until asked for.
+class PciIds:
+    def __init__(self, path):
+        self.path = path
+        self.map = None
+        self.vendors = None
+        self.devices = {}
+        self.lock = threading.Lock()
+
+    def build_index(self):
+        import mmap
+        with open(self.path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # The class list after the vendors uses the same indentation, so
+        # vendor scanning stops where it starts.
+        end = self.map.find(b'\nC ')
+        if end < 0:
+            end = len(self.map)
+        matches = list(VENDOR_LINE.finditer(self.map, 0, end))
+        self.vendors = {}
+        for idx, match in enumerate(matches):
+            block_end = matches[idx + 1].start() if idx + 1 < len(matches) else end
+            self.vendors[int(match.group(1), 16)] = (match.start(2), match.end(2), match.end(), block_end)
+
+    def ensure_index(self):
+        if self.vendors is None:
+            with self.lock:
+                if self.vendors is None:
+                    self.build_index()
+
+    def vendor_name(self, vendor_id):
+        self.ensure_index()
+        entry = self.vendors.get(vendor_id)
+        if entry is None:
+            return None
+        return self.map[entry[0]:entry[1]].decode('utf-8', 'replace')
+
+    def device_name(self, vendor_id, device_id):
+        self.ensure_index()
+        entry = self.vendors.get(vendor_id)
+        if entry is None:
+            return None
+        devices = self.devices.get(vendor_id)
+        if devices is None:
+            devices = {
+                int(match.group(1), 16): (match.start(2), match.end(2))
+                for match in DEVICE_LINE.finditer(self.map, entry[2], entry[3])
+            }
+            self.devices[vendor_id] = devices
+        span = devices.get(device_id)
+        if span is None:
+            return None
+        return self.map[span[0]:span[1]].decode('utf-8', 'replace')
+
+_pci_ids = None
+_pci_ids_lock = threading.Lock()
+
+def get_pci_ids():
+    global _pci_ids
+    with _pci_ids_lock:
+        if _pci_ids is None:
+            for path in PCI_IDS_PATHS:
+                if os.path.isfile(path):
+                    _pci_ids = PciIds(path)
+                    break
+            else:
+                _pci_ids = False
+        return _pci_ids or None
+
+def read_sysfs_hex(path):
+    with open(path, 'r') as f:
+        return int(f.read().strip(), 16)
+
+def describe_pci_device(vendor_id, device_id):
+    pci_ids = get_pci_ids()
+    vendor = device = None
+    if pci_ids is not None:
+        try:
+            vendor = pci_ids.vendor_name(vendor_id)
+            device = pci_ids.device_name(vendor_id, device_id)
+        except (OSError, ValueError):
+            pass
+    # Same fallback wording as lspci for ids missing from the database.
+    vendor = vendor or f"Vendor {vendor_id:04x}"
+    device = device or f"Device {device_id:04x}"
+    return f"{vendor} {device}"
+
+def read_pci_devices():
+    devices = []
+    for address in sorted(os.listdir(SYSFS_PCI_DEVICES)):
+        path = os.path.join(SYSFS_PCI_DEVICES, address)
+        try:
+            pci_class = read_sysfs_hex(os.path.join(path, 'class'))
+            vendor_id = read_sysfs_hex(os.path.join(path, 'vendor'))
+            device_id = read_sysfs_hex(os.path.join(path, 'device'))
+        except (OSError, ValueError):
+            continue
+        try:
+            driver = os.path.basename(os.readlink(os.path.join(path, 'driver')))
+        except OSError:
+            driver = None
+        devices.append({
+            'address': address,
+            'class': pci_class,
+            'vendor': vendor_id,
+            'device': device_id,
+            'driver': driver
+        })
+    return devices
+
+def classify_pci_device(pci_class):
+    base = (pci_class >> 16) & 0xff
+    sub = (pci_class >> 8) & 0xff
+    if base == PCI_CLASS_DISPLAY:
+        return 'graphics'
+    if base == PCI_CLASS_MULTIMEDIA and sub in PCI_SUBCLASS_AUDIO:
+        return 'audio'
+    if base == PCI_CLASS_NETWORK:
+        return 'network'
+    return None
+
+def sysfs_pci_available():
+    return os.path.isdir(SYSFS_PCI_DEVICES)
@@ -0,0 +1,72 @@
+import subprocess
+
+# Calls that can hang on a sick machine. They run inside the probe worker
+# processes of zinfo.isolation, so this module stays light to import and
+# everything returned is plain picklable data.
+
+def run_lspci():
+    result = subprocess.run(['lspci'], capture_output=True, text=True, timeout=2)
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+def query_windows_license():
+    try:
+        result = subprocess.run(
+            ['wmic', 'path', 'softwarelicensingservice', 'get', 'OA3xOriginalProductKey'],
+            capture_output=True, text=True, timeout=5, creationflags=subprocess.CREATE_NO_WINDOW
+        )
+        lines = result.stdout.strip().split('\n')
+        if len(lines) > 1:
+            key = lines[1].strip()
+            if key:
+                return key
+        
+        result = subprocess.run(
+            ['wmic', 'path', 'SoftwareLicensingProduct', 'where', 
+             'ApplicationID="55c92734-d682-4d71-983e-d6ec3f16059f"', 
+             'get', 'LicenseStatus'],
+            capture_output=True, text=True, timeout=5, creationflags=subprocess.CREATE_NO_WINDOW
+        )
+        lines = result.stdout.strip().split('\n')
+        if len(lines) > 1:
+            status = lines[1].strip()
+            if status == '1':
+                return 'Licensed ✓'
+            elif status == '0':
+                return 'Unlicensed ✗'
+        
+        return 'Status Unknown'
+    except Exception:
+        return 'Unable to retrieve'
+
+def load_wmi():
+    try:
+        import wmi
+        import pythoncom
+        return wmi, pythoncom
+    except ImportError:
+        return None, None
+
+def read_wmi_devices():
+    facts = {'status': 'wmi_missing', 'graphics': [], 'audio': [], 'network': []}
+    wmi, pythoncom = load_wmi()
+    if wmi is None:
+        return facts
+    # WMI needs COM initialised on every thread that uses it.
+    try:
+        pythoncom.CoInitialize()
+    except Exception:
+        pass
+    # WMI errors propagate so that a failed enumeration is not cached.
+    c = wmi.WMI() 
+    facts['status'] = 'wmi'
+    for controller in c.Win32_VideoController():
+        facts['graphics'].append({'name': controller.Name, 'driver': controller.DriverVersion})
+    for sound in c.Win32_SoundDevice():
+        if sound.Name:
+            facts['audio'].append({'name': sound.Name})
+    for adapter in c.Win32_NetworkAdapterConfiguration(IPEnabled=True):
+        if adapter.IPAddress:
+            facts['network'].append({'name': adapter.Description, 'ip': adapter.IPAddress[0]})
+    return facts
@@ -0,0 +1,157 @@
+import time
+import heapq
+import threading
+
+import psutil
+
+TOP_PROCESSES = 10
+# Wall-clock budget for re-reading processes on each tick after the first
+# full scan. The previous leaders and newly started processes are read
+# first, the rest round-robin, so a host with tens of thousands of
+# processes costs the same per tick as a small one.
+PROCESS_SAMPLE_BUDGET = 0.004
+BUDGET_CHECK_EVERY = 32
+
+class ProcessState:
+    __slots__ = (
+        'process', 'name', 'cpu_time', 'io_bytes', 'read_at',
+        'rss', 'cpu_percent', 'io_rate', 'io_denied'
+    )
+
+    def __init__(self, process):
+        self.process = process
+        self.name = None
+        # A process seen for the first time is measured against its start,
+        # so its first rates are lifetime averages.
+        try:
+            self.read_at = process.create_time()
+        except psutil.Error:
+            self.read_at = time.time()
+        self.cpu_time = 0.0
+        self.io_bytes = 0
+        self.rss = 0
+        self.cpu_percent = 0.0
+        self.io_rate = None
+        self.io_denied = False
+
+class ProcessSampler:
+    def __init__(self, budget=PROCESS_SAMPLE_BUDGET):
+        self.budget = budget
+        self.states = {}
+        self.cursor = 0
+        self.hot = []
+        self.fresh = []
+        self.pid_count = 0
+        self.lock = threading.Lock()
+
+    def read(self, state):
+        process = state.process
+        with process.oneshot():
+            if state.name is None:
+                state.name = process.name()
+            cpu_times = process.cpu_times()
+            rss = process.memory_info().rss
+            io_bytes = None
+            if not state.io_denied:
+                try:
+                    io = process.io_counters()
+                    io_bytes = io.read_bytes + io.write_bytes
+                except (psutil.AccessDenied, AttributeError, NotImplementedError):
+                    state.io_denied = True
+        now = time.time()
+        elapsed = now - state.read_at
+        cpu_time = cpu_times.user + cpu_times.system
+        if elapsed > 0:
+            state.cpu_percent = max(100.0 * (cpu_time - state.cpu_time) / elapsed, 0.0)
+            if io_bytes is not None:
+                state.io_rate = max((io_bytes - state.io_bytes) / elapsed, 0.0)
+        state.cpu_time = cpu_time
+        if io_bytes is not None:
+            state.io_bytes = io_bytes
+        state.rss = rss
+        state.read_at = now
+
+    def visit(self, pid):
+        # A state exists only once its process has been read, so nothing
+        # half-initialised is ever ranked.
+        state = self.states.get(pid)
+        try:
+            if state is None:
+                state = ProcessState(psutil.Process(pid))
+                self.read(state)
+                self.states[pid] = state
+            else:
+                self.read(state)
+        except psutil.Error:
+            self.states.pop(pid, None)
+            return None
+        return state
+
+    # Reads `pids` in order until the deadline; False if it ran out first.
+    def walk(self, pids, visited, deadline):
+        for pid in pids:
+            if pid in visited:
+                continue
+            visited[pid] = self.visit(pid)
+            if len(visited) % BUDGET_CHECK_EVERY == 0 and time.perf_counter() > deadline:
+                return False
+        return True
+
+    def sample(self):
+        with self.lock:
+            first = not self.states
+            pids = psutil.pids()
+            if len(pids) != self.pid_count or first:
+                # Processes started or exited: both sides of the change are
+                # worked out by set operations in C. A start and an exit in
+                # the same tick are left to the cursor and to failed reads.
+                current = set(pids)
+                for pid in self.states.keys() - current:
+                    del self.states[pid]
+                self.fresh = list(current.difference(self.states)) if not first else []
+                self.pid_count = len(pids)
+
+            deadline = time.perf_counter() + self.budget if not first and self.budget else None
+            visited = {}
+            if deadline is None:
+                for pid in pids:
+                    visited[pid] = self.visit(pid)
+            elif self.walk(self.hot + self.fresh, visited, deadline):
+                # The previous leaders and new processes first, then the
+                # remaining pids round-robin from where the last tick
+                # stopped, by index into this tick's list.
+                self.fresh = []
+                count = len(pids)
+                index = self.cursor % count if count else 0
+                stop = index
+                while count:
+                    pid = pids[index]
+                    index = index + 1 if index + 1 < count else 0
+                    if pid not in visited:
+                        visited[pid] = self.visit(pid)
+                        if len(visited) % BUDGET_CHECK_EVERY == 0 and time.perf_counter() > deadline:
+                            break
+                    if index == stop:
+                        break
+                self.cursor = index
+            else:
+                self.fresh = [pid for pid in self.fresh if pid not in visited]
+
+            # Only the states read this tick can have overtaken the held
+            # leaders, which were read first; everything else keeps its
+            # place below them.
+            candidates = [(pid, state) for pid, state in visited.items() if state is not None]
+            top_cpu = heapq.nlargest(TOP_PROCESSES, candidates, key=lambda item: item[1].cpu_percent)
+            top_rss = heapq.nlargest(TOP_PROCESSES, candidates, key=lambda item: item[1].rss)
+            top_io = heapq.nlargest(
+                TOP_PROCESSES,
+                [item for item in candidates if item[1].io_rate],
+                key=lambda item: item[1].io_rate
+            )
+            self.hot = list({pid: None for pid, _ in top_cpu + top_rss + top_io})
+            return len(pids), first, top_cpu, top_rss, top_io
+
+PROCESS_SAMPLER = ProcessSampler()
+
+def sample_processes():
+    return PROCESS_SAMPLER.sample()
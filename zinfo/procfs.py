@@ -0,0 +1,32 @@
+import os
+
+INITIAL_BUFFER = 8 * 1024
+
+class ProcFile:
+    # One descriptor re-read from offset 0 into the same buffer, which only
+    # ever grows; procfs and sysfs files are regenerated on every read, so
+    # nothing is reopened between samples.
+    def __init__(self, path, size=INITIAL_BUFFER):
+        self.fd = os.open(path, os.O_RDONLY)
+        self.buffer = bytearray(size)
+        self.view = memoryview(self.buffer)
+
+    def close(self):
+        os.close(self.fd)
+
+    # Refills the buffer and returns how many bytes of it are the file, for
+    # callers that parse it in place.
+    def fill(self):
+        size = 0
+        while True:
+            n = os.preadv(self.fd, [self.view[size:]], size)
+            if n == 0:
+                return size
+            size += n
+            if size == len(self.buffer):
+                self.view.release()
+                self.buffer.extend(bytes(len(self.buffer)))
+                self.view = memoryview(self.buffer)
+
+    def read(self):
+        return self.view[:self.fill()].tobytes()
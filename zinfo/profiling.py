@@ -0,0 +1,106 @@
+import os
+import time
+import platform
+import threading
+from contextlib import contextmanager
+
+class Span:
+    __slots__ = ('name', 'category', 'start', 'wall', 'cpu', 'thread_id')
+
+    def __init__(self, name, category, start, wall, cpu, thread_id):
+        self.name = name
+        self.category = category
+        self.start = start
+        self.wall = wall
+        self.cpu = cpu
+        self.thread_id = thread_id
+
+class Tracer:
+    def __init__(self):
+        self.enabled = False
+        self.epoch = time.perf_counter()
+        self.spans = []
+        self.lock = threading.Lock()
+
+    def begin_refresh(self):
+        with self.lock:
+            self.spans = []
+
+    @contextmanager
+    def span(self, name, category='collector'):
+        if not self.enabled:
+            yield
+            return
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            span = Span(
+                name, category, wall_start,
+                time.perf_counter() - wall_start,
+                time.thread_time() - cpu_start,
+                threading.get_ident()
+            )
+            with self.lock:
+                self.spans.append(span)
+
+    def snapshot(self):
+        with self.lock:
+            return list(self.spans)
+
+    def chrome_trace(self, spans=None):
+        spans = self.snapshot() if spans is None else spans
+        pid = os.getpid()
+        events = []
+        for span in spans:
+            events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': round((span.start - self.epoch) * 1e6, 1),
+                'dur': round(span.wall * 1e6, 1),
+                'pid': pid,
+                'tid': span.thread_id,
+                'args': {'cpu_ms': round(span.cpu * 1e3, 3)}
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, path, spans=None):
+        import json
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(spans), f)
+
+    def log_refresh(self, spans=None):
+        import json
+        import logging
+
+        spans = self.snapshot() if spans is None else spans
+        record = {
+            'event': 'zinfo.refresh',
+            'host': platform.node(),
+            'time': round(time.time(), 3),
+            'wall_ms': round(spans_wall_time(spans) * 1e3, 3),
+            'spans': {
+                span.name: {'wall_ms': round(span.wall * 1e3, 3), 'cpu_ms': round(span.cpu * 1e3, 3)}
+                for span in spans
+            }
+        }
+        logging.getLogger('zinfo.profiling').info(json.dumps(record, separators=(',', ':')))
+        return record
+
+def spans_wall_time(spans):
+    if not spans:
+        return 0.0
+    start = min(span.start for span in spans)
+    end = max(span.start + span.wall for span in spans)
+    return end - start
+
+def summarize_spans(spans, top=3):
+    slowest = sorted(spans, key=lambda span: span.wall, reverse=True)[:top]
+    parts = [f"⏱ {spans_wall_time(spans) * 1e3:.0f} ms"]
+    parts.extend(f"{span.name} {span.wall * 1e3:.0f} ms" for span in slowest)
+    return " · ".join(parts)
+
+TRACER = Tracer()
@@ -0,0 +1,200 @@
+import os
+import math
+import mmap
+import time
+import struct
+import threading
+
+from zinfo.cache import user_cache_dir
+from zinfo.model import CpuInfo, DiskIoInfo, MemoryInfo, NetworkInfo, StorageInfo
+
+# One fixed-size little-endian record per snapshot; a missing value is NaN
+# (or 0 for the byte counts).
+RECORD_FIELDS = (
+    'timestamp', 'cpu_percent', 'memory_percent', 'memory_used', 'memory_available',
+    'disks_percent', 'disk_read_rate', 'disk_write_rate', 'net_rx_rate', 'net_tx_rate'
+)
+RECORD = struct.Struct('<dffQQfffff')
+TIMESTAMP = struct.Struct('<d')
+
+# Header: magic, format version, record size, record count. The count is
+# written after the record it covers, so a crash never exposes a torn one.
+MAGIC = b'ZINFOLOG'
+LOG_VERSION = 1
+HEADER = struct.Struct('<8sIII')
+COUNT = struct.Struct('<I')
+COUNT_OFFSET = HEADER.size - COUNT.size
+
+SEGMENT_SIZE = 16 * 1024 * 1024
+KEEP_SEGMENTS = 4
+RECORDED_SECTIONS = ('cpu', 'memory', 'disks', 'disk_io', 'interfaces')
+
+def default_log_path():
+    return os.path.join(user_cache_dir(), 'history', 'snapshots.zlog')
+
+def segment_paths(path, keep=KEEP_SEGMENTS):
+    # Oldest first: path.N ... path.1, then the live segment.
+    candidates = [f"{path}.{i}" for i in range(keep, 0, -1)] + [path]
+    return [candidate for candidate in candidates if os.path.exists(candidate)]
+
+class SnapshotLog:
+    # Append-only writer. Each segment is preallocated to segment_size and
+    # memory-mapped, so an append is one pack_into() for the record and one
+    # for the count; a full segment is rotated to path.1, path.2, ...
+    def __init__(self, path, segment_size=SEGMENT_SIZE, keep=KEEP_SEGMENTS):
+        self.path = path
+        self.segment_size = segment_size
+        self.keep = keep
+        self.capacity = (segment_size - HEADER.size) // RECORD.size
+        self.file = None
+        self.map = None
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def open(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        try:
+            self.file = open(self.path, 'r+b')
+        except FileNotFoundError:
+            self.file = open(self.path, 'w+b')
+        size = os.fstat(self.file.fileno()).st_size
+        header = None
+        if size >= HEADER.size:
+            header = HEADER.unpack(self.file.read(HEADER.size))
+        if header is None or header[:3] != (MAGIC, LOG_VERSION, RECORD.size) or size != self.segment_size:
+            if header is not None:
+                # A segment from another format or size is set aside, not
+                # appended to.
+                self.file.close()
+                self.shift_segments()
+                self.file = open(self.path, 'w+b')
+            self.file.truncate(self.segment_size)
+            self.file.seek(0)
+            self.file.write(HEADER.pack(MAGIC, LOG_VERSION, RECORD.size, 0))
+            self.file.flush()
+            header = (MAGIC, LOG_VERSION, RECORD.size, 0)
+        self.count = min(header[3], self.capacity)
+        self.map = mmap.mmap(self.file.fileno(), self.segment_size)
+
+    def close(self):
+        with self.lock:
+            if self.map is not None:
+                self.map.flush()
+                self.map.close()
+                self.map = None
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+    def shift_segments(self):
+        oldest = f"{self.path}.{self.keep}"
+        if os.path.exists(oldest):
+            os.remove(oldest)
+        for i in range(self.keep - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        if os.path.exists(self.path):
+            os.replace(self.path, f"{self.path}.1")
+
+    def rotate(self):
+        self.map.close()
+        self.file.close()
+        self.map = None
+        self.file = None
+        self.shift_segments()
+        self.open()
+
+    def append(self, values):
+        with self.lock:
+            if self.map is None:
+                self.open()
+            elif self.count >= self.capacity:
+                self.rotate()
+            RECORD.pack_into(self.map, HEADER.size + self.count * RECORD.size, *values)
+            self.count += 1
+            COUNT.pack_into(self.map, COUNT_OFFSET, self.count)
+
+class SegmentTimestamps:
+    # A read-only sequence view over a segment's timestamps for bisect;
+    # only the probed records are unpacked.
+    def __init__(self, data, count):
+        self.data = data
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        return TIMESTAMP.unpack_from(self.data, HEADER.size + index * RECORD.size)[0]
+
+def bisect_left(timestamps, value):
+    lo, hi = 0, len(timestamps)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if timestamps[mid] < value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+def read_segment(path, start=None, end=None):
+    with open(path, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return
+    with data:
+        if len(data) < HEADER.size:
+            return
+        magic, version, record_size, count = HEADER.unpack_from(data, 0)
+        if (magic, version, record_size) != (MAGIC, LOG_VERSION, RECORD.size):
+            return
+        count = min(count, (len(data) - HEADER.size) // RECORD.size)
+        # Timestamps are appended in order (barring wall-clock jumps), so
+        # the range is found by bisection and only it is unpacked.
+        timestamps = SegmentTimestamps(data, count)
+        first = bisect_left(timestamps, start) if start is not None else 0
+        last = bisect_left(timestamps, math.nextafter(end, math.inf)) if end is not None else count
+        for offset in range(HEADER.size + first * RECORD.size, HEADER.size + last * RECORD.size, RECORD.size):
+            yield RECORD.unpack_from(data, offset)
+
+# Yields RECORD_FIELDS tuples with start <= timestamp <= end, oldest
+# first, one at a time.
+def query_log(path, start=None, end=None, keep=KEEP_SEGMENTS):
+    for segment in segment_paths(path, keep):
+        yield from read_segment(segment, start, end)
+
+def sum_rates(items, field, skip=()):
+    return sum(getattr(item, field) or 0.0 for item in items if getattr(item, 'name', None) not in skip)
+
+def snapshot_values(sections, timestamp=None):
+    nan = math.nan
+    cpu = sections.get('cpu')
+    memory = sections.get('memory')
+    disks = sections.get('disks')
+    disk_io = sections.get('disk_io')
+    network = sections.get('interfaces')
+
+    disks_percent = nan
+    if isinstance(disks, StorageInfo):
+        used, total = disks.totals()
+        if total:
+            disks_percent = 100.0 * used / total
+    # A first sample's rates are averages since boot, not readings for this
+    # moment, and are recorded as missing.
+    has_cpu = isinstance(cpu, CpuInfo) and not cpu.since_boot
+    has_memory = isinstance(memory, MemoryInfo)
+    has_disk_io = isinstance(disk_io, DiskIoInfo) and not disk_io.since_boot
+    has_network = isinstance(network, NetworkInfo) and not network.since_boot
+    return (
+        time.time() if timestamp is None else timestamp,
+        cpu.usage if has_cpu else nan,
+        memory.percent if has_memory else nan,
+        memory.used if has_memory else 0,
+        memory.available if has_memory else 0,
+        disks_percent,
+        sum_rates(disk_io.devices, 'read_rate') if has_disk_io else nan,
+        sum_rates(disk_io.devices, 'write_rate') if has_disk_io else nan,
+        sum_rates(network.interfaces, 'rx_rate', skip=('lo',)) if has_network else nan,
+        sum_rates(network.interfaces, 'tx_rate', skip=('lo',)) if has_network else nan
+    )
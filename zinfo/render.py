@@ -0,0 +1,374 @@
+import math
+from itertools import groupby
+
+from zinfo.model import SectionError
+from zinfo.storage import MAX_LISTED_MOUNTS
+
+SECTION_FORMATTERS = {}
+
+def section_formatter(key):
+    def register(func):
+        SECTION_FORMATTERS[key] = func
+        return func
+    return register
+
+def render_section(key, record, t):
+    if isinstance(record, SectionError):
+        return f"{t['fatal_error']}\n{record.message}"
+    return SECTION_FORMATTERS[key](record, t)
+
+def format_bytes(bytes_val):
+    if bytes_val < 1024:
+        return f"{bytes_val} B"
+    exp = int(math.log(bytes_val) / math.log(1024))
+    pre = "KMGTPE"[exp - 1] + "B"
+    return f"{bytes_val / (1024 ** exp):.2f} {pre}"
+
+@section_formatter('os')
+def format_os_info(info, t):
+    os_info = []
+    os_info.append(f"┌─ {t['os_label']}: {info.system} {info.release}")
+    if info.edition:
+        os_info.append(f"├─ {t['edition']}: {info.edition}")
+    os_info.append(f"├─ {t['version']}: {info.version}")
+    os_info.append(f"├─ {t['architecture']}: {info.machine}")
+    os_info.append(f"└─ {t['computer_name']}: {info.node}")
+    return "\n".join(os_info)
+
+@section_formatter('cpu')
+def format_cpu_info(info, t):
+    cpu_info = []
+    cpu_info.append(f"┌─ {t['processor']}: {info.processor}")
+    cpu_info.append(f"├─ {t['physical_cores']}: {info.physical_cores}")
+    cpu_info.append(f"├─ {t['logical_cores']}: {info.logical_cores}")
+    if info.max_mhz:
+        cpu_info.append(f"├─ {t['max_frequency']}: {info.max_mhz:.2f} MHz")
+    else:
+        cpu_info.append(f"├─ {t['frequency_unavailable']}")
+    usage = f"{info.usage:.1f}%"
+    if info.since_boot:
+        usage += f" ({t['since_boot']})"
+    cpu_info.append(f"├─ {t['usage']}: {usage}")
+    cpu_info.append(f"└─ {t['per_core']}:")
+    
+    per_core = info.per_core
+    for idx in range(len(per_core)):
+        prefix = "└─" if idx == len(per_core) - 1 else "├─"
+        line = f"    {prefix} {t['core']} {idx}: {per_core[idx]:5.1f}%"
+        if info.freqs:
+            current, minimum, maximum = info.freqs[idx]
+            line += f" · {current:.0f} MHz"
+            if maximum:
+                line += f" ({minimum:.0f}–{maximum:.0f} MHz)"
+        cpu_info.append(line)
+    return "\n".join(cpu_info)
+
+@section_formatter('memory')
+def format_memory_info(info, t):
+    memory_info = []
+    memory_info.append(f"┌─ {t['total']}: {format_bytes(info.total)}")
+    memory_info.append(f"├─ {t['available']}: {format_bytes(info.available)}")
+    memory_info.append(f"└─ {t['in_use']}: {format_bytes(info.used)} ({info.percent}%)")
+    return "\n".join(memory_info)
+
+def format_optional_bytes(value):
+    return "—" if value is None else format_bytes(value)
+
+def format_pressure(averages):
+    if averages[0] is None:
+        return "—"
+    return " ".join(f"{value:5.2f}" for value in averages)
+
+@section_formatter('memory_pressure')
+def format_memory_pressure_info(info, t):
+    # (line, sub-lines) pairs; the tree prefixes are added at the end.
+    entries = []
+    entries.append((
+        f"{t['page_cache']}: {format_optional_bytes(info.cached)}"
+        f" · {t['buffers']}: {format_optional_bytes(info.buffers)}"
+        f" · {t['shared']}: {format_optional_bytes(info.shared)}",
+        []
+    ))
+    if info.dirty is not None:
+        entries.append((
+            f"{t['dirty']}: {format_bytes(info.dirty)} · {t['writeback']}: {format_optional_bytes(info.writeback)}",
+            []
+        ))
+    if info.slab is not None:
+        entries.append((
+            f"Slab: {format_bytes(info.slab)} ({t['reclaimable']}: {format_optional_bytes(info.slab_reclaimable)})",
+            []
+        ))
+    if info.swap_total:
+        used = info.swap_total - (info.swap_free or 0)
+        line = f"Swap: {format_bytes(used)} / {format_bytes(info.swap_total)} ({100.0 * used / info.swap_total:.1f}%)"
+        if info.swap_cached is not None:
+            line += f" · {t['swap_cached']}: {format_bytes(info.swap_cached)}"
+        entries.append((line, []))
+    elif info.swap_total is not None:
+        entries.append((f"Swap: {t['no_swap']}", []))
+    if info.hugepages_total:
+        entries.append((
+            f"HugePages: {info.hugepages_total - (info.hugepages_free or 0)} / {info.hugepages_total}"
+            f" × {format_optional_bytes(info.hugepage_size)}",
+            []
+        ))
+    if info.committed is not None:
+        entries.append((
+            f"{t['committed']}: {format_bytes(info.committed)} / {t['commit_limit']} {format_optional_bytes(info.commit_limit)}",
+            []
+        ))
+    if info.pressure:
+        entries.append((
+            f"{t['pressure']}: avg10 avg60 avg300 %",
+            [
+                f"{stall.resource:<7} some {format_pressure((stall.some10, stall.some60, stall.some300))}"
+                f" · full {format_pressure((stall.full10, stall.full60, stall.full300))}"
+                for stall in info.pressure
+            ]
+        ))
+    elif info.source == 'procfs':
+        entries.append((t['pressure_unavailable'], []))
+    if info.cgroup is not None:
+        line = f"cgroup {info.cgroup}: {format_bytes(info.cgroup_current)}"
+        if info.cgroup_max is None:
+            line += f" ({t['unlimited']})"
+        else:
+            line += f" / {format_bytes(info.cgroup_max)} ({100.0 * info.cgroup_current / info.cgroup_max:.1f}%)"
+        entries.append((line, []))
+    
+    pressure_info = []
+    for idx, (line, sub_lines) in enumerate(entries):
+        last = idx == len(entries) - 1
+        prefix = "└─" if last else ("┌─" if idx == 0 else "├─")
+        pressure_info.append(f"{prefix} {line}")
+        pressure_info.extend(f"{'    ' if last else '│   '}{sub_line}" for sub_line in sub_lines)
+    return "\n".join(pressure_info)
+
+@section_formatter('disks')
+def format_disk_info(info, t):
+    mounts = info.mounts
+    used_total, size_total = info.totals()
+    
+    disk_info = []
+    listed = mounts
+    if len(mounts) > MAX_LISTED_MOUNTS:
+        # Too many mounts for a readable tree: summarise them and list only
+        # the fullest ones, with problem mounts first.
+        timed_out = sum(1 for mount in mounts if mount.status == 'timed_out')
+        summary = f"{t['mounts']}: {len(mounts)}"
+        if size_total:
+            summary += f" · {format_bytes(used_total)} / {format_bytes(size_total)} ({100.0 * used_total / size_total:.1f}%)"
+        if timed_out:
+            summary += f" · {timed_out} {t['timed_out']}"
+        disk_info.append(f"┌─ {summary}")
+        listed = sorted(
+            mounts,
+            key=lambda mount: mount.percent if mount.status in ('ok', 'stale') else 101.0,
+            reverse=True
+        )[:MAX_LISTED_MOUNTS]
+    
+    hidden = len(mounts) - len(listed)
+    has_footer = bool(hidden or info.pseudo_counts)
+    for idx, mount in enumerate(listed):
+        last = idx == len(listed) - 1 and not has_footer
+        prefix = "└─" if last else "├─"
+        sub_prefix = "    " if last else "│   "
+        disk_info.append(f"{prefix} {t['drive']}: {mount.device} ({mount.fstype})")
+        if mount.status in ('ok', 'stale'):
+            line = f"{sub_prefix}{t['space']}: {format_bytes(mount.used)} / {format_bytes(mount.total)} ({mount.percent}%)"
+            if mount.status == 'stale':
+                line += f" · {t['stale']}"
+            disk_info.append(line)
+        elif mount.status == 'timed_out':
+            disk_info.append(f"{sub_prefix}{mount.mountpoint}: {t['timed_out']}")
+        else:
+            disk_info.append(f"{sub_prefix}{t['info_unavailable']}")
+    
+    if hidden:
+        prefix = "├─" if info.pseudo_counts else "└─"
+        disk_info.append(f"{prefix} … +{hidden} {t['more_mounts']}")
+    if info.pseudo_counts:
+        groups = ", ".join(f"{fstype} ×{count}" for fstype, count in sorted(info.pseudo_counts.items()))
+        disk_info.append(f"└─ {t['pseudo_filesystems']}: {groups}")
+    return "\n".join(disk_info)
+
+def format_rate(rate):
+    if rate is None:
+        return "—"
+    return f"{format_bytes(int(rate))}/s"
+
+MAX_LISTED_DISKS = 16
+
+@section_formatter('disk_io')
+def format_disk_io_info(info, t):
+    devices = info.devices
+    if not devices:
+        return f"└─ {t['no_disk_io']}"
+    header = f"┌─ {t['io_devices']}: {len(devices)}"
+    if info.since_boot:
+        header += f" ({t['since_boot']})"
+    disk_io_info = [header]
+    
+    listed = sorted(
+        devices,
+        key=lambda disk: (-(disk.utilization or 0), -((disk.read_rate or 0) + (disk.write_rate or 0)), disk.name)
+    )[:MAX_LISTED_DISKS]
+    hidden = len(devices) - len(listed)
+    for idx, disk in enumerate(listed):
+        last = idx == len(listed) - 1 and not hidden
+        prefix = "└─" if last else "├─"
+        sub_prefix = "    " if last else "│   "
+        line = f"{prefix} {disk.name}"
+        if disk.utilization is not None:
+            line += f" · {disk.utilization:.1f}% {t['busy']}"
+        disk_io_info.append(line)
+        if disk.read_iops is None:
+            continue
+        disk_io_info.append(
+            f"{sub_prefix}{t['read']} {disk.read_iops:.0f} IOPS {format_rate(disk.read_rate)}"
+            f" · {t['write']} {disk.write_iops:.0f} IOPS {format_rate(disk.write_rate)}"
+            f" · {t['latency']} {disk.latency:.2f} ms"
+        )
+    if hidden:
+        disk_io_info.append(f"└─ … +{hidden} {t['more_disks']}")
+    return "\n".join(disk_io_info)
+
+def format_process_row(row):
+    return f"{row.pid:>7}  {row.name[:24]:<24} {row.cpu_percent:6.1f}%  {format_bytes(row.rss):>10}  {format_rate(row.io_rate):>12}"
+
+PROCESS_GROUPS = (('top_cpu', 'top_cpu'), ('top_rss', 'top_memory'), ('top_io', 'top_io'))
+
+@section_formatter('processes')
+def format_process_info(info, t):
+    header = f"┌─ {t['process_count']}: {info.total}"
+    if info.since_start:
+        header += f" ({t['since_start']})"
+    process_info = [header]
+    for idx, (field, title) in enumerate(PROCESS_GROUPS):
+        last = idx == len(PROCESS_GROUPS) - 1
+        process_info.append(f"{'└─' if last else '├─'} {t[title]}:")
+        rows = getattr(info, field)
+        if not rows:
+            process_info.append(f"{'    ' if last else '│   '}{t['no_processes']}")
+        for row in rows:
+            process_info.append(f"{'    ' if last else '│   '}{format_process_row(row)}")
+    return "\n".join(process_info)
+
+MAX_LISTED_INTERFACES = 16
+
+@section_formatter('interfaces')
+def format_network_info(info, t):
+    interfaces = info.interfaces
+    rx_total = sum(nic.rx_rate or 0 for nic in interfaces)
+    tx_total = sum(nic.tx_rate or 0 for nic in interfaces)
+    header = f"┌─ {t['interface_count']}: {len(interfaces)} · ↓ {format_rate(rx_total)} ↑ {format_rate(tx_total)}"
+    if info.since_boot:
+        header += f" ({t['since_boot']})"
+    network_info = [header]
+    
+    # Busy interfaces first; on container hosts the long tail is idle veths.
+    listed = sorted(
+        interfaces,
+        key=lambda nic: (-((nic.rx_rate or 0) + (nic.tx_rate or 0)), not nic.is_up, nic.name)
+    )[:MAX_LISTED_INTERFACES]
+    hidden = len(interfaces) - len(listed)
+    for idx, nic in enumerate(listed):
+        last = idx == len(listed) - 1 and not hidden
+        prefix = "└─" if last else "├─"
+        sub_prefix = "    " if last else "│   "
+        link = [t['link_up'] if nic.is_up else t['link_down']]
+        if nic.speed:
+            link.append(f"{nic.speed} Mb/s")
+        if nic.mtu:
+            link.append(f"MTU {nic.mtu}")
+        network_info.append(f"{prefix} {nic.name} ({', '.join(link)})")
+        if nic.rx_rate is not None:
+            network_info.append(
+                f"{sub_prefix}↓ {format_rate(nic.rx_rate)} ({nic.rx_packets:.0f} {t['packets']})"
+                f" ↑ {format_rate(nic.tx_rate)} ({nic.tx_packets:.0f} {t['packets']})"
+                f" · {t['errors']} {nic.error_rate:.1f}/s · {t['drops']} {nic.drop_rate:.1f}/s"
+            )
+        addresses = ([nic.mac] if nic.mac else []) + nic.addresses
+        if addresses:
+            network_info.append(f"{sub_prefix}{', '.join(addresses)}")
+    if hidden:
+        network_info.append(f"└─ … +{hidden} {t['more_interfaces']}")
+    return "\n".join(network_info)
+
+SENSOR_UNITS = {'temperature': ('°C', 1), 'fan': ('RPM', 0), 'power': ('W', 2)}
+
+def format_sensor_value(kind, value):
+    if value is None:
+        return "—"
+    unit, digits = SENSOR_UNITS[kind]
+    return f"{value:.{digits}f} {unit}"
+
+@section_formatter('sensors')
+def format_sensor_info(info, t):
+    if not info.sensors:
+        return f"└─ {t['no_sensors']}"
+    chips = [(chip, list(sensors)) for chip, sensors in groupby(info.sensors, key=lambda sensor: sensor.chip)]
+    sensor_info = []
+    for chip_idx, (chip, sensors) in enumerate(chips):
+        last_chip = chip_idx == len(chips) - 1
+        prefix = "└─" if last_chip else ("┌─" if chip_idx == 0 else "├─")
+        sub_prefix = "    " if last_chip else "│   "
+        sensor_info.append(f"{prefix} {chip}")
+        for sensor in sensors:
+            line = f"{sub_prefix}{sensor.label[:24]:<24} {format_sensor_value(sensor.kind, sensor.value):>10}"
+            limits = []
+            if sensor.high:
+                limits.append(f"{t['high']} {format_sensor_value(sensor.kind, sensor.high)}")
+            if sensor.critical:
+                limits.append(f"{t['critical']} {format_sensor_value(sensor.kind, sensor.critical)}")
+            if limits:
+                line += f" ({' · '.join(limits)})"
+            sensor_info.append(line)
+    return "\n".join(sensor_info)
+
+@section_formatter('devices')
+def format_device_info(info, t):
+    if info.stale:
+        return f"{format_device_body(info, t)}\n  ({t['stale']})"
+    return format_device_body(info, t)
+
+def format_device_body(info, t):
+    if info.status == 'wmi_error':
+        return t['wmi_error'].format(info.error)
+    if info.status == 'wmi_missing':
+        return t['wmi_not_installed']
+
+    # WMI always lists its three categories; sysfs and lspci only the
+    # non-empty ones.
+    always = info.status == 'wmi'
+    driver_info = []
+    for category in ('graphics', 'audio', 'network'):
+        devices = getattr(info, category)
+        if not devices and not always:
+            continue
+        driver_info.append(t[category])
+        for device in devices:
+            driver_info.append(f"     ├─ {device.name}")
+            if device.driver:
+                driver_info.append(f"     │  {t['driver']}: {device.driver}")
+            if device.ip:
+                driver_info.append(f"     │  {t['ip']}: {device.ip}")
+    
+    if not driver_info:
+        driver_info.append(t['drivers_windows_only'])
+    # The audio and network headings carry their own leading blank line.
+    if driver_info[0].startswith('\n'):
+        driver_info[0] = driver_info[0][1:]
+    return "\n".join(driver_info)
+
+@section_formatter('license')
+def format_license_info(info, t):
+    license_info = []
+    if info.applicable:
+        key = f"{info.key} ({t['stale']})" if info.stale else info.key
+        license_info.append(f"┌─ {t['license_key']}: {key}")
+        license_info.append(f"└─ {t['license_status']}: Active")
+    else:
+        license_info.append(f"└─ {t['license_linux']}")
+    return "\n".join(license_info)
@@ -0,0 +1,104 @@
+import sys
+import time
+import threading
+from array import array
+
+import psutil
+
+from zinfo.history import record_metric
+
+LINUX = sys.platform.startswith('linux')
+
+def cpu_busy_time(times):
+    # Same accounting as psutil.cpu_percent: guest time is already part of
+    # user time on Linux, and iowait counts as idle.
+    total = sum(times)
+    if LINUX:
+        total -= getattr(times, 'guest', 0) + getattr(times, 'guest_nice', 0)
+    idle = times.idle + getattr(times, 'iowait', 0)
+    return total - idle, total
+
+class CpuSample:
+    __slots__ = ('timestamp', 'since_boot', 'total', 'per_core', 'freqs')
+
+    def __init__(self, timestamp, since_boot, total, per_core, freqs):
+        self.timestamp = timestamp
+        self.since_boot = since_boot
+        self.total = total
+        self.per_core = per_core
+        self.freqs = freqs
+
+class CpuSampler:
+    def __init__(self, interval=1.0):
+        self.interval = interval
+        self.prev_busy = None
+        self.prev_total = None
+        self.latest = None
+        self.thread = None
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+
+    def start(self):
+        with self.lock:
+            if self.thread is not None:
+                return
+            # The first reading is taken right away so callers always get a
+            # value; until the thread has a second one it covers the time
+            # since boot.
+            self.sample()
+            self.thread = threading.Thread(target=self.run, name="zinfo-cpu-sampler", daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            try:
+                with self.lock:
+                    self.sample()
+            except Exception:
+                pass
+
+    def sample(self):
+        times = psutil.cpu_times(percpu=True)
+        n = len(times)
+        busy = array('d', bytes(8 * n))
+        total = array('d', bytes(8 * n))
+        for i, core_times in enumerate(times):
+            busy[i], total[i] = cpu_busy_time(core_times)
+
+        since_boot = self.prev_busy is None or len(self.prev_busy) != n
+        prev_busy = array('d', bytes(8 * n)) if since_boot else self.prev_busy
+        prev_total = array('d', bytes(8 * n)) if since_boot else self.prev_total
+
+        per_core = array('f', bytes(4 * n))
+        busy_delta_sum = 0.0
+        total_delta_sum = 0.0
+        for i in range(n):
+            busy_delta = busy[i] - prev_busy[i]
+            total_delta = total[i] - prev_total[i]
+            if total_delta > 0:
+                per_core[i] = min(max(100.0 * busy_delta / total_delta, 0.0), 100.0)
+            busy_delta_sum += busy_delta
+            total_delta_sum += total_delta
+        overall = 0.0
+        if total_delta_sum > 0:
+            overall = min(max(100.0 * busy_delta_sum / total_delta_sum, 0.0), 100.0)
+
+        try:
+            freqs = psutil.cpu_freq(percpu=True) or []
+        except Exception:
+            freqs = []
+
+        self.prev_busy = busy
+        self.prev_total = total
+        self.latest = CpuSample(time.time(), since_boot, overall, per_core, freqs)
+        if not since_boot:
+            record_metric('cpu.percent', overall)
+
+CPU_SAMPLER = CpuSampler()
+
+def get_cpu_sample():
+    CPU_SAMPLER.start()
+    return CPU_SAMPLER.latest
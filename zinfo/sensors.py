@@ -0,0 +1,177 @@
+import os
+import re
+import threading
+
+import psutil
+
+HWMON_PATH = '/sys/class/hwmon'
+THERMAL_PATH = '/sys/class/thermal'
+
+# hwmon input file prefix -> (kind, divisor to the displayed unit).
+HWMON_KINDS = {
+    'temp': ('temperature', 1000.0),
+    'fan': ('fan', 1.0),
+    'power': ('power', 1000000.0),
+}
+INPUT_PATTERN = re.compile(r'^(temp|fan|power)(\d+)_(input|average)$')
+READ_SIZE = 32
+
+def read_text(path):
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+def read_scaled(path, divisor):
+    text = read_text(path)
+    try:
+        return int(text) / divisor
+    except (TypeError, ValueError):
+        return None
+
+class SensorInput:
+    __slots__ = ('chip', 'label', 'kind', 'fd', 'divisor', 'high', 'critical')
+
+    def __init__(self, chip, label, kind, fd, divisor, high=None, critical=None):
+        self.chip = chip
+        self.label = label
+        self.kind = kind
+        self.fd = fd
+        self.divisor = divisor
+        self.high = high
+        self.critical = critical
+
+def discover_hwmon(root):
+    inputs = []
+    chips = set()
+    try:
+        entries = sorted(os.listdir(root))
+    except OSError:
+        return inputs, chips
+    for entry in entries:
+        directory = os.path.join(root, entry)
+        chip = read_text(os.path.join(directory, 'name')) or entry
+        chips.add(chip)
+        try:
+            matches = [INPUT_PATTERN.match(filename) for filename in os.listdir(directory)]
+        except OSError:
+            continue
+        # Temperatures, then fans, then power, each in numeric order.
+        order = list(HWMON_KINDS)
+        matches = sorted(
+            (match for match in matches if match is not None),
+            key=lambda match: (order.index(match.group(1)), int(match.group(2)), match.group(3))
+        )
+        seen = set()
+        for match in matches:
+            filename = match.group(0)
+            prefix, index, _ = match.groups()
+            # power*_input and power*_average can both exist; keep one.
+            if (prefix, index) in seen:
+                continue
+            seen.add((prefix, index))
+            kind, divisor = HWMON_KINDS[prefix]
+            stem = os.path.join(directory, f"{prefix}{index}")
+            try:
+                fd = os.open(os.path.join(directory, filename), os.O_RDONLY)
+            except OSError:
+                continue
+            # Labels and limits do not change while the machine is up; they
+            # are read once here, only the inputs are re-read.
+            inputs.append(SensorInput(
+                chip,
+                read_text(f"{stem}_label") or f"{prefix}{index}",
+                kind, fd, divisor,
+                read_scaled(f"{stem}_max", divisor) if kind != 'fan' else None,
+                read_scaled(f"{stem}_crit", divisor) if kind == 'temperature' else None
+            ))
+    return inputs, chips
+
+def discover_thermal_zones(root, known_chips):
+    # Most thermal zones also register a hwmon device named after their
+    # type; only the ones that do not are added.
+    inputs = []
+    try:
+        entries = sorted(os.listdir(root))
+    except OSError:
+        return inputs
+    for entry in entries:
+        if not entry.startswith('thermal_zone'):
+            continue
+        directory = os.path.join(root, entry)
+        zone_type = read_text(os.path.join(directory, 'type')) or entry
+        if zone_type in known_chips:
+            continue
+        try:
+            fd = os.open(os.path.join(directory, 'temp'), os.O_RDONLY)
+        except OSError:
+            continue
+        inputs.append(SensorInput(zone_type, entry, 'temperature', fd, 1000.0))
+    return inputs
+
+class HwmonReader:
+    # Discovers the sysfs inputs once and keeps one descriptor per input;
+    # each tick is one pread per sensor, with no directory walks or opens.
+    def __init__(self, hwmon_root=HWMON_PATH, thermal_root=THERMAL_PATH):
+        inputs, chips = discover_hwmon(hwmon_root)
+        self.inputs = inputs + discover_thermal_zones(thermal_root, chips)
+
+    def close(self):
+        for sensor in self.inputs:
+            os.close(sensor.fd)
+        self.inputs = []
+
+    def read(self):
+        readings = []
+        for sensor in self.inputs:
+            try:
+                value = int(os.pread(sensor.fd, READ_SIZE, 0)) / sensor.divisor
+            except (OSError, ValueError):
+                # Some drivers return EIO or ENODATA while a sensor is
+                # powered down.
+                value = None
+            readings.append((sensor.chip, sensor.label, sensor.kind, value, sensor.high, sensor.critical))
+        return readings
+
+def read_psutil_sensors():
+    readings = []
+    sensors_temperatures = getattr(psutil, 'sensors_temperatures', None)
+    sensors_fans = getattr(psutil, 'sensors_fans', None)
+    for chip, entries in (sensors_temperatures() if sensors_temperatures else {}).items():
+        for idx, entry in enumerate(entries):
+            readings.append((chip, entry.label or f"temp{idx + 1}", 'temperature', entry.current, entry.high, entry.critical))
+    for chip, entries in (sensors_fans() if sensors_fans else {}).items():
+        for idx, entry in enumerate(entries):
+            readings.append((chip, entry.label or f"fan{idx + 1}", 'fan', float(entry.current), None, None))
+    return readings
+
+class SensorSampler:
+    def __init__(self):
+        self.reader = None
+        self.source = None
+        self.lock = threading.Lock()
+
+    def open(self, hwmon_root=HWMON_PATH, thermal_root=THERMAL_PATH):
+        if hasattr(os, 'pread'):
+            reader = HwmonReader(hwmon_root, thermal_root)
+            if reader.inputs:
+                self.reader = reader
+                self.source = 'sysfs'
+                return
+        self.source = 'psutil'
+
+    # Returns (source, readings) with readings as
+    # (chip, label, kind, value, high, critical) tuples.
+    def sample(self):
+        with self.lock:
+            if self.source is None:
+                self.open()
+            if self.reader is not None:
+                return self.source, self.reader.read()
+            return self.source, read_psutil_sensors()
+
+SENSOR_SAMPLER = SensorSampler()
+
+def sample_sensors():
+    return SENSOR_SAMPLER.sample()
@@ -0,0 +1,161 @@
+import time
+import threading
+
+import psutil
+
+
+PROBE_DEADLINE = 1.5
+PROBE_WORKERS = 16
+MAX_ABANDONED_POOLS = 4
+RETRY_AFTER = 30.0
+MAX_LISTED_MOUNTS = 24
+
+PSEUDO_FILESYSTEMS = {
+    'autofs', 'binfmt_misc', 'bpf', 'cgroup', 'cgroup2', 'configfs', 'debugfs',
+    'devpts', 'devtmpfs', 'efivarfs', 'fusectl', 'hugetlbfs', 'mqueue', 'nsfs',
+    'overlay', 'proc', 'pstore', 'ramfs', 'rpc_pipefs', 'securityfs', 'selinuxfs',
+    'squashfs', 'sysfs', 'tmpfs', 'tracefs', 'fuse.lxcfs', 'fuse.gvfsd-fuse',
+    'fuse.portal', 'nfsd', 'shm', 'none'
+}
+
+# Network and FUSE filesystems whose statvfs can hang on an unreachable
+# server or daemon; nfs*, smb* and fuse* are matched by prefix as well.
+REMOTE_FILESYSTEMS = {
+    'cifs', 'ceph', 'glusterfs', 'afs', '9p', 'lustre', 'gpfs', 'beegfs',
+    'ocfs2', 'gfs2', 'davfs', 'sshfs', 'ncpfs', 'coda'
+}
+
+class MountProbe:
+    __slots__ = ('partition', 'usage', 'status')
+
+    def __init__(self, partition, usage, status):
+        self.partition = partition
+        self.usage = usage
+        self.status = status
+
+def is_pseudo_filesystem(partition):
+    return partition.fstype in PSEUDO_FILESYSTEMS or not partition.fstype
+
+def classify_partitions(partitions):
+    real = []
+    seen = set()
+    pseudo_counts = {}
+    for p in partitions:
+        if is_pseudo_filesystem(p):
+            fstype = p.fstype or '?'
+            pseudo_counts[fstype] = pseudo_counts.get(fstype, 0) + 1
+        elif p.mountpoint not in seen:
+            seen.add(p.mountpoint)
+            real.append(p)
+    return real, pseudo_counts
+
+def is_remote_filesystem(partition):
+    fstype = partition.fstype
+    return fstype in REMOTE_FILESYSTEMS or fstype.startswith(('nfs', 'smb', 'fuse'))
+
+class MountProber:
+    # statvfs on a dead network mount never returns. Local filesystems are
+    # read on threads with a deadline, which costs nothing at start-up;
+    # network and FUSE mounts, and any mount that has already timed out,
+    # go to the probe worker processes, where a hung call is killed at its
+    # deadline. A mount that timed out is served from its last good
+    # reading, marked stale, and only re-probed after retry_after seconds.
+    def __init__(self, workers=PROBE_WORKERS, deadline=PROBE_DEADLINE, retry_after=RETRY_AFTER):
+        self.workers = workers
+        self.deadline = deadline
+        self.retry_after = retry_after
+        self.pool = None
+        self.hung = {}
+        self.abandoned = []
+        self.suspect = set()
+        self.last_good = {}
+        self.backoff = {}
+        self.lock = threading.Lock()
+
+    def get_pool(self):
+        # A thread stuck in statvfs cannot be reclaimed. Once half the pool
+        # is stuck, start a fresh one so healthy mounts keep being probed;
+        # the old pool's stuck threads are remembered until they return,
+        # and at most MAX_ABANDONED_POOLS pools are left behind at a time.
+        from concurrent.futures import ThreadPoolExecutor
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="zinfo-disk")
+        elif len(self.hung) >= self.workers // 2:
+            self.abandoned = [futures for futures in self.abandoned if not all(f.done() for f in futures)]
+            if len(self.abandoned) < MAX_ABANDONED_POOLS:
+                # Nothing is queued on it by then: probes left waiting at the
+                # end of a tick are cancelled there.
+                self.pool.shutdown(wait=False)
+                self.abandoned.append(list(self.hung.values()))
+                self.hung.clear()
+                self.pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="zinfo-disk")
+        return self.pool
+
+    def probe(self, partitions):
+        now = time.monotonic()
+        local = {}
+        isolated = {}
+        with self.lock:
+            for mountpoint, future in list(self.hung.items()):
+                if future.done():
+                    del self.hung[mountpoint]
+            pool = self.get_pool()
+            for p in partitions:
+                if self.backoff.get(p.mountpoint, 0) > now:
+                    continue
+                if is_remote_filesystem(p) or p.mountpoint in self.suspect:
+                    # Loaded only when some mount needs it; most hosts have
+                    # no network mounts.
+                    from zinfo.isolation import PROBE_POOL
+                    isolated[p.mountpoint] = PROBE_POOL.submit(psutil.disk_usage, p.mountpoint, deadline=self.deadline)
+                else:
+                    local[p.mountpoint] = pool.submit(psutil.disk_usage, p.mountpoint)
+
+        # Imported here, like the pool, so sections other than disks never
+        # load concurrent.futures.
+        from concurrent.futures import wait
+        wait(local.values(), timeout=self.deadline)
+        # Probes queued behind a hung one wait for a worker; the overall
+        # wait leaves room for one killed probe ahead of them.
+        wait(isolated.values(), timeout=max(2 * self.deadline - (time.monotonic() - now), 0))
+
+        # Only isolated probes can time out with ProbeTimeout.
+        timeouts = ()
+        if isolated:
+            from zinfo.isolation import ProbeTimeout as timeouts
+        results = []
+        with self.lock:
+            for p in partitions:
+                mountpoint = p.mountpoint
+                future = local.get(mountpoint) or isolated.get(mountpoint)
+                if future is not None and future.cancelled():
+                    future = None
+                if future is not None and future.done() and future.exception() is None:
+                    self.last_good[mountpoint] = future.result()
+                    self.backoff.pop(mountpoint, None)
+                    self.suspect.discard(mountpoint)
+                    results.append(MountProbe(p, future.result(), 'ok'))
+                    continue
+                if future is not None and future.done() and not isinstance(future.exception(), timeouts):
+                    results.append(MountProbe(p, None, 'unavailable'))
+                    continue
+                if future is not None:
+                    if mountpoint in local:
+                        # The thread may stay stuck; from now on this mount
+                        # is probed where a hung call can be killed.
+                        if not future.cancel():
+                            self.hung[mountpoint] = future
+                        self.suspect.add(mountpoint)
+                        self.backoff[mountpoint] = now + self.retry_after
+                    elif future.done():
+                        self.backoff[mountpoint] = now + self.retry_after
+                    else:
+                        future.cancel()
+                usage = self.last_good.get(mountpoint)
+                results.append(MountProbe(p, usage, 'stale' if usage is not None else 'timed_out'))
+        return results
+
+MOUNT_PROBER = MountProber()
+
+def probe_mounts(partitions):
+    return MOUNT_PROBER.probe(partitions)